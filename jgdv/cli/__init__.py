@@ -4,13 +4,20 @@ jgdv.cli provides a statemachine based argument parser.
 ``ParseMachineBase`` defines the state flow,
 ``ParseMachine`` implements ``__call__`` to start the parsing,
 ``CLIParserModel`` implements the callbacks for the different states.
+``ParseLoop`` runs the same model and transitions as a plain loop,
+and ``build_parser`` selects between the two engines.
+``ParamCatalogue`` stores the specs of every source, and can be cached on disk between runs.
+``SourceStub`` names a source without importing it, so only the sources in the args are loaded.
 
 ``ParamSpec``'s are descriptions of a single argument type,
 combined with the parsing logic for that type.
 """
-from ._interface import ParamSpec_p, ArgParserModel_p, ParamSource_p, CLIParamProvider_p
+from ._interface import ParamSpec_p, ArgParserModel_p, ParamSource_p, CLIParamProvider_p, ParseEngine_e
 from .errors import ParseError
 from .parse_machine import ParseMachine
+from .parse_loop import ParseLoop, build_parser
 from .parser_model import CLIParserModel
+from .catalogue import ParamCatalogue
+from .stubs import SourceStub
 from .param_spec import ParamSpec
 from .builder_mixin import ParamSpecMaker_m
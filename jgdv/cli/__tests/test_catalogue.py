@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import importlib
+import logging as logmod
+import os
+import pickle
+import sys
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from .. import param_spec as Specs  # noqa: N812
+from .._interface import SectionType_e, ParseReport_d
+from ..catalogue import CATALOGUE_VERSION, ParamCatalogue
+from ..dispatch import DispatchTable
+from ..parse_loop import build_parser
+from ..parser_model import CLIParserModel
+
+logging = logmod.root
+
+class SpecSource:
+    """ A Source which builds fresh specs each time it's asked """
+
+    def __init__(self, name:str, *, count:int=2, positional:bool=True) -> None:
+        self._name       = name
+        self.count       = count
+        self.positional  = positional
+        self.calls       = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def param_fingerprint(self) -> tuple:
+        return self.count, self.positional
+
+    def param_specs(self) -> list:
+        self.calls += 1
+        specs = [Specs.ParamSpec[bool](name=f"-{self._name}{i}") for i in range(self.count)]
+        specs.append(Specs.KeyParam[str](name="-key"))
+        if self.positional:
+            specs.append(Specs.PositionalParam(name="<1>target", type=str))
+        return specs
+
+@pytest.fixture(scope="function")
+def sources() -> dict:
+    acmd = SpecSource("acmd")
+    return {
+        "prog" : SpecSource("aweg", positional=False),
+        "cmds" : [acmd, SpecSource("bcmd"), ("a", acmd)],
+        "subs" : [((acmd.name,), SpecSource("asub"))],
+    }
+
+##--|
+
+class TestParamCatalogue:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_build(self, sources):
+        cat = ParamCatalogue.build(**sources)
+        assert(cat.prog_name == "aweg")
+        assert(set(cat.cmds) == {"acmd", "bcmd", "a"})
+        assert(set(cat.subs) == {"asub"})
+        assert(cat.constraints == {"acmd": {"asub"}})
+        assert(cat.cmds["a"] is cat.cmds["acmd"])
+
+    def test_tables(self, sources):
+        cat = ParamCatalogue.build(**sources)
+        assert(not bool(cat.tables))
+        assert(isinstance(cat.table(SectionType_e.prog, "aweg"), DispatchTable))
+        assert(isinstance(cat.table(SectionType_e.cmd, "a"), DispatchTable))
+        assert(cat.table(SectionType_e.sub, "asub").params[0].name == "asub0")
+        assert(cat.table(SectionType_e.sub, "asub") is cat.table(SectionType_e.sub, "asub"))
+
+    def test_build_fail(self):
+        with pytest.raises(TypeError):
+            ParamCatalogue.build(prog=None, cmds=["blah"], subs=[])
+
+    @pytest.mark.parametrize("engine", ["machine", "loop"])
+    def test_parse_agrees_with_sources(self, sources, engine):
+        args     = ["aweg", "-aweg1", "acmd", "-acmd0", "-key", "val", "x", "asub", "-asub1", "--", "bcmd"]
+        cat      = ParamCatalogue.build(**sources)
+        expected = build_parser(CLIParserModel(), engine=engine)(args, **sources)
+        match build_parser(CLIParserModel(), engine=engine)(args, catalogue=cat):
+            case ParseReport_d() as result:
+                assert(result.to_dict() == expected.to_dict())
+                assert(result.remaining == expected.remaining)
+                assert(result.cmds["acmd"][0].args["target"] == "x")
+            case x:
+                assert(False), x
+
+    def test_parse_alias(self, sources):
+        cat = ParamCatalogue.build(**sources)
+        match build_parser(CLIParserModel(), engine="loop")(["aweg", "a", "-acmd1"], catalogue=cat):
+            case ParseReport_d(remaining=(), cmds={"a": [result]}):
+                assert(result.args["acmd1"] is True)
+            case x:
+                assert(False), x
+
+    def test_parse_doesnt_ask_sources(self, sources):
+        cat = ParamCatalogue.build(**sources)
+        build_parser(CLIParserModel(), engine="loop")(["aweg", "bcmd"], catalogue=cat)
+        assert(sources["prog"].calls == 1)
+
+class TestParamCatalogue_Cache:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_fingerprint(self, sources):
+        first = ParamCatalogue.fingerprint_of(**sources)
+        assert(first == ParamCatalogue.fingerprint_of(**sources))
+        assert(sources["prog"].calls == 0)
+
+    def test_fingerprint_changes(self, sources):
+        first = ParamCatalogue.fingerprint_of(**sources)
+        sources["cmds"].append(("b", sources["cmds"][1]))
+        assert(first != ParamCatalogue.fingerprint_of(**sources))
+
+    def test_param_fingerprint(self, sources):
+        first = ParamCatalogue.fingerprint_of(**sources)
+        sources["prog"].param_fingerprint = lambda: "v2"
+        second = ParamCatalogue.fingerprint_of(**sources)
+        assert(first != second)
+        assert(second == ParamCatalogue.fingerprint_of(**sources))
+
+    def test_fingerprint_base_module(self, tmp_path, monkeypatch):
+        """ Editing the module a source's base class is defined in changes the fingerprint """
+        base = tmp_path / "catalogue_base_mod.py"
+        base.write_text("class BaseSource:\n    @classmethod\n    def param_specs(cls):\n        return []\n")
+        (tmp_path / "catalogue_sub_mod.py").write_text("from catalogue_base_mod import BaseSource\n"
+                                                       "class SubSource(BaseSource):\n    name = 'sub'\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        try:
+            source  = importlib.import_module("catalogue_sub_mod").SubSource()
+            first   = ParamCatalogue.fingerprint_of(prog=None, cmds=[source], subs=[])
+            base.write_text(base.read_text() + "    # edited\n")
+            assert(first != ParamCatalogue.fingerprint_of(prog=None, cmds=[source], subs=[]))
+        finally:
+            sys.modules.pop("catalogue_sub_mod", None)
+            sys.modules.pop("catalogue_base_mod", None)
+
+    def test_instance_state_fingerprint(self, sources):
+        first = ParamCatalogue.fingerprint_of(**sources)
+        sources["cmds"][1].count = 5
+        assert(first != ParamCatalogue.fingerprint_of(**sources))
+
+    def test_no_fingerprint_for_instance_state(self):
+        """ Without a param_fingerprint, an instance's specs may depend on its state """
+        source = SpecSource("acmd")
+        source.param_fingerprint = None
+        assert(ParamCatalogue.fingerprint_of(prog=None, cmds=[source], subs=[]) is None)
+        assert(ParamCatalogue.fingerprint_of(prog=None, cmds=[], subs=[((), source)]) is None)
+
+    def test_cached_without_fingerprint(self, tmp_path):
+        """ Sources that can't be fingerprinted are built fresh, and not saved """
+        target = tmp_path / "cli.catalogue"
+        source = SpecSource("acmd")
+        source.param_fingerprint = None
+        first  = ParamCatalogue.cached(target, prog=None, cmds=[source], subs=[])
+        assert(not target.exists())
+        source.count = 5
+        second = ParamCatalogue.cached(target, prog=None, cmds=[source], subs=[])
+        assert(len(second.cmds["acmd"]) == len(first.cmds["acmd"]) + 3)
+        assert(source.calls == 2)
+
+    def test_save_load(self, sources, tmp_path):
+        target  = tmp_path / "cli.catalogue"
+        cat     = ParamCatalogue.build(**sources, fingerprint="blah")
+        assert(cat.save(target))
+        loaded  = ParamCatalogue.load(target, fingerprint="blah")
+        assert(isinstance(loaded, ParamCatalogue))
+        assert(loaded.cmds.keys() == cat.cmds.keys())
+        assert(loaded.cmds["a"] is loaded.cmds["acmd"])
+        assert(not bool(loaded.tables))
+        assert(loaded.table(SectionType_e.cmd, "acmd").params[0] in loaded.cmds["acmd"])
+
+    def test_load_missing(self, tmp_path):
+        assert(ParamCatalogue.load(tmp_path / "missing") is None)
+
+    def test_load_out_of_date(self, sources, tmp_path):
+        target  = tmp_path / "cli.catalogue"
+        ParamCatalogue.build(**sources, fingerprint="blah").save(target)
+        assert(ParamCatalogue.load(target, fingerprint="bloo") is None)
+
+    def test_load_old_version(self, sources, tmp_path):
+        target  = tmp_path / "cli.catalogue"
+        target.write_bytes(pickle.dumps((CATALOGUE_VERSION - 1, None, ParamCatalogue.build(**sources))))
+        assert(ParamCatalogue.load(target) is None)
+
+    def test_load_corrupt(self, tmp_path):
+        target = tmp_path / "cli.catalogue"
+        target.write_bytes(b"not a catalogue")
+        assert(ParamCatalogue.load(target) is None)
+
+    def test_save_unpicklable(self, tmp_path):
+        source  = SpecSource("blah")
+        source.param_specs = lambda: [Specs.ParamSpec(name="-blah", type=list, default=lambda: [1])]
+        cat     = ParamCatalogue.build(prog=None, cmds=[source], subs=[])
+        assert(not cat.save(tmp_path / "cli.catalogue"))
+        assert(not (tmp_path / "cli.catalogue").exists())
+
+    def test_save_unwritable(self, sources, tmp_path):
+        """ The target's parent is a file, so it can't be created """
+        (tmp_path / "afile").write_text("blah")
+        cat = ParamCatalogue.build(**sources)
+        assert(not cat.save(tmp_path / "afile" / "cli.catalogue"))
+
+    def test_save_failed_replace_cleans_up(self, sources, tmp_path):
+        """ The target is a directory, so the temp file can't replace it """
+        target = tmp_path / "cli.catalogue"
+        target.mkdir()
+        cat    = ParamCatalogue.build(**sources)
+        assert(not cat.save(target))
+        assert(os.listdir(tmp_path) == ["cli.catalogue"])
+
+    def test_cached(self, sources, tmp_path):
+        target = tmp_path / "cli.catalogue"
+        first  = ParamCatalogue.cached(target, **sources)
+        assert(target.exists())
+        assert(sources["prog"].calls == 1)
+        second = ParamCatalogue.cached(target, **sources)
+        assert(second is not first)
+        assert(sources["prog"].calls == 1)
+        assert(second.fingerprint == first.fingerprint)
+
+@pytest.mark.benchmark
+class TestParamCatalogue_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_cold_start(self, tmp_path):
+        """ Preparing 400 cmds of ~12 params each,
+        from their sources, and from a saved catalogue
+        """
+        target   = tmp_path / "cli.catalogue"
+        sources  = {"prog": SpecSource("aweg", positional=False), "cmds": [SpecSource(f"cmd{i}", count=10) for i in range(400)], "subs": []}
+        args     = ["aweg", "cmd5", "-cmd53", "x"]
+        ParamCatalogue.cached(target, **sources)
+        with Benchmark(f"Parsing with {len(sources['cmds'])} cmds") as bench:
+            with bench.case("from sources"):
+                expected = build_parser(CLIParserModel(), engine="loop")(args, **sources)
+
+            with bench.case("from a saved catalogue"):
+                cat     = ParamCatalogue.cached(target, **sources)
+                result  = build_parser(CLIParserModel(), engine="loop")(args, catalogue=cat)
+
+            bench.note(catalogue_bytes=target.stat().st_size)
+
+        assert(result.to_dict() == expected.to_dict())
+        assert(bench["from a saved catalogue"] < bench["from sources"])
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from .. import param_spec as Specs  # noqa: N812
+from .._interface import ParseReport_d, UNRESTRICTED_COUNT
+from ..cursor import ArgCursor
+from ..parse_loop import build_parser
+from ..parser_model import CLIParserModel
+
+logging = logmod.root
+
+class ASource:
+
+    def __init__(self, *, name=None, specs=None) -> None:
+        self._name = name or "simple"
+        self.specs = specs or []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def param_specs(self) -> list:
+        return self.specs
+
+PROG  = ASource(name="aweg", specs=[Specs.ParamSpec[bool](name="-v")])
+ACMD  = ASource(name="acmd", specs=[Specs.ParamSpec[bool](name="-blah"),
+                                    Specs.KeyParam[str](name="-key"),
+                                    Specs.PositionalParam(name="<1>target", type=str)])
+PATHS = ASource(name="paths", specs=[Specs.PositionalParam(name="<1>paths", type=list, count=UNRESTRICTED_COUNT)])
+
+##--|
+
+class TestArgCursor:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        args = ("a", "b", "c")
+        cursor = ArgCursor(args)
+        assert(len(cursor) == 3)
+        assert(cursor[0] == "a")
+        assert(cursor[-1] == "c")
+        assert(list(cursor) == ["a", "b", "c"])
+        assert(cursor == ["a", "b", "c"])
+
+    def test_empty(self):
+        cursor = ArgCursor()
+        assert(not bool(cursor))
+        with pytest.raises(IndexError):
+            cursor[0]
+        with pytest.raises(IndexError):
+            cursor.pop_head()
+
+    def test_advance(self):
+        args   = ("a", "b", "c")
+        cursor = ArgCursor(args)
+        cursor.advance(2)
+        assert(cursor == ["c"])
+        assert(cursor.position == 2)
+        cursor.advance(5)
+        assert(not bool(cursor))
+
+    def test_slice_is_list(self):
+        cursor = ArgCursor(("a", "b", "c", "d"))
+        cursor.advance(1)
+        assert(cursor[:2] == ["b", "c"])
+        assert(cursor[:] == ["b", "c", "d"])
+        assert(cursor[-1:] == ["d"])
+        assert(isinstance(cursor[:], list))
+
+    def test_pop(self):
+        cursor = ArgCursor(("a", "b", "c"))
+        assert(cursor.pop_head() == "a")
+        assert(cursor.pop_tail() == "c")
+        assert(cursor == ["b"])
+
+    def test_insert(self):
+        args   = ("a", "b")
+        cursor = ArgCursor(args)
+        cursor.advance(1)
+        cursor.insert(["x", "y"])
+        assert(cursor == ["x", "y", "b"])
+        assert(cursor[:2] == ["x", "y"])
+        assert(cursor[1] == "y")
+        assert(cursor.position == 1)
+        cursor.advance(2)
+        assert(cursor == ["b"])
+
+    def test_insert_pop_tail(self):
+        cursor = ArgCursor(("a",))
+        cursor.advance(1)
+        cursor.insert(["x", "y"])
+        assert(cursor.pop_tail() == "y")
+        assert(cursor == ["x"])
+
+    def test_view(self):
+        cursor = ArgCursor(("a", "b", "c"))
+        cursor.insert(["x"])
+        assert(cursor.view(0) == ["x", "a", "b", "c"])
+        assert(cursor.view(2) == ["b", "c"])
+        assert(cursor.view(2)._args is cursor._args)
+
+    def test_match_as_sequence(self):
+        match ArgCursor(("a", "b")):
+            case [x, *_]:
+                assert(x == "a")
+            case x:
+                assert(False), x
+
+class TestArgCursor_Parsing:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_consume_cursor(self):
+        param  = Specs.KeyParam[str](name="-key")
+        cursor = ArgCursor(("-blah", "-key", "val", "x"))
+        match param.consume(cursor, offset=1):
+            case {"key": "val"}, 2:
+                assert(cursor.position == 0)
+            case x:
+                assert(False), x
+
+    def test_consume_offset_list(self):
+        param = Specs.KeyParam[str](name="-key")
+        match param.consume(["-blah", "-key", "val"], offset=1):
+            case {"key": "val"}, 2:
+                assert(True)
+            case x:
+                assert(False), x
+
+    def test_shares_args(self):
+        model = CLIParserModel()
+        model.prepare_for_parse(prog=PROG, cmds=[ACMD], subs=[], raw_args=["aweg", "acmd", "-blah"])
+        assert(model.args_remaining._args is model.args_initial)
+
+    def test_implicit_doesnt_copy(self):
+        model = CLIParserModel()
+        model.prepare_for_parse(prog=PROG, cmds=[ACMD], subs=[], raw_args=["aweg", "-blah"], implicits=["acmd"])
+        model.args_remaining.advance(1)
+        model._insert_implicit_cmd()
+        assert(model.args_remaining == ["acmd", "-blah"])
+        assert(model.args_remaining._args is model.args_initial)
+
+    @pytest.mark.parametrize("engine", ["machine", "loop"])
+    def test_remaining(self, engine):
+        match build_parser(CLIParserModel(), engine=engine)(["aweg", "acmd", "x", "y", "z"], prog=PROG, cmds=[ACMD], subs=[]):
+            case ParseReport_d(remaining=("y", "z"), cmds={"acmd": [cmd]}):
+                assert(cmd.args["target"] == "x")
+            case x:
+                assert(False), x
+
+@pytest.mark.benchmark
+class TestArgCursor_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_many_paths(self):
+        """ 10k paths, passed to one unrestricted positional """
+        count  = 10_000
+        args   = ["aweg", "paths", *(f"file_{i}.txt" for i in range(count))]
+        with Benchmark("Parsing paths", count=count) as bench, bench.case("parse"):
+            result = build_parser(CLIParserModel(), engine="loop")(args, prog=PROG, cmds=[PATHS], subs=[])
+
+        assert(len(result.cmds["paths"][0].args["paths"]) == count)
+
+    @pytest.mark.parametrize("count", [1_000, 10_000])
+    def test_many_sections(self, count):
+        """ count args, as repeated cmd sections """
+        group  = ["acmd", "-blah", "x", "--"]
+        args   = ["aweg", *(group * (count // len(group)))]
+        parser = build_parser(CLIParserModel(), engine="loop", max=count * 10)
+        with Benchmark("Parsing args of cmd sections", count=count) as bench, bench.case("parse"):
+            result = parser(args, prog=PROG, cmds=[ACMD], subs=[])
+
+        assert(len(result.cmds["acmd"]) == count // len(group))
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from .. import param_spec as Specs  # noqa: N812
+from .._interface import PositionalParam_p, ParseReport_d
+from ..dispatch import DispatchTable
+from ..param_spec import ParamSpec
+from ..parse_machine import ParseMachine
+from ..parser_model import CLIParserModel
+
+logging = logmod.root
+
+class _PlusParam(ParamSpec):
+    """ A param which matches heads itself, without head_keys """
+
+    def matches_head(self, val:str) -> bool:
+        return val.startswith("+")
+
+class _LoudKeyParam(Specs.KeyParam):
+    """ Overrides matches_head, but inherits KeyParam's head_keys """
+
+    def matches_head(self, val:str) -> bool:
+        return val.lower() in self.key_strs
+
+@pytest.fixture(scope="function")
+def params() -> list:
+    return [
+        Specs.ParamSpec[bool](name="-blah"),
+        Specs.ParamSpec[bool](name="-bloo"),
+        Specs.KeyParam[str](name="-key"),
+        Specs.AssignParam(name="--val="),
+        Specs.PositionalParam(name="<2>second", type=str),
+        Specs.PositionalParam(name="<1>first", type=str),
+        _PlusParam(name="-plus"),
+        Specs.HelpParam(),
+    ]
+
+@pytest.fixture(scope="function")
+def PSource(): # noqa: N802
+
+    class ASource:
+
+        def __init__(self, *, name=None, specs=None) -> None:
+            self._name = name or "simple"
+            self.specs = specs or []
+
+        @property
+        def name(self) -> str:
+            return self._name
+
+        def param_specs(self) -> list:
+            return self.specs
+
+    return ASource
+
+##--|
+
+class TestDispatchTable:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self, params):
+        table = DispatchTable(params)
+        assert(len(table) == len(params))
+        assert(table.params == tuple(sorted(params, key=ParamSpec.key_func)))
+
+    def test_positionals(self, params):
+        table = DispatchTable(params)
+        assert([x.name for x in table.positionals] == ["first", "second"])
+
+    @pytest.mark.parametrize("head", ["-blah", "-b", "-no-bloo", "-key", "-k",
+                                      "--val=2", "--val", "--v=a=b", "--help",
+                                      "+a", "blah", "-other", "--other=2", "--"])
+    def test_agrees_with_matches_head(self, params, head):
+        table     = DispatchTable(params)
+        expected  = [x for x in table.params
+                     if not isinstance(x, PositionalParam_p)
+                     and ParamSpec._processor.matches_head(x, head)]
+        assert([x for _, x in table.kwargs_for(head)] == expected)
+
+    def test_shared_head_in_order(self, params):
+        table = DispatchTable(params)
+        assert([x.name for _, x in table.kwargs_for("-b")] == ["blah", "bloo"])
+
+    def test_unindexed(self, params):
+        table = DispatchTable(params)
+        assert([x.name for _, x in table.kwargs_for("+anything")] == ["plus"])
+
+    def test_inherited_head_keys_untrusted(self):
+        param = _LoudKeyParam(name="-key", type=str)
+        assert(ParamSpec._processor.head_keys(param) is None)
+        assert(ParamSpec._processor.head_keys(Specs.KeyParam[str](name="-key")) == param.key_strs)
+        table = DispatchTable([param])
+        assert([x.name for _, x in table.kwargs_for("-KEY")] == ["key"])
+
+    def test_compile_per_source(self, params, PSource):
+        DispatchTable.clear()
+        source  = PSource(specs=params)
+        table   = DispatchTable.compile(source, source.param_specs())
+        assert(DispatchTable.compile(source, source.param_specs()) is table)
+        assert(DispatchTable.compile(source, list(params)) is table)
+        assert(DispatchTable.compile(PSource(specs=params), params) is not table)
+        assert(len(DispatchTable._tables) == 2)
+
+    def test_compile_fresh_specs_rebuild(self, params, PSource):
+        """ Without a param_fingerprint, a source returning new specs gets a new table """
+        DispatchTable.clear()
+        source  = PSource(specs=params)
+        table   = DispatchTable.compile(source, params)
+        source.specs = params[:-1]
+        assert(DispatchTable.compile(source, source.param_specs()) is not table)
+        assert(len(DispatchTable._tables) == 1)
+
+    def test_compile_fingerprint(self, params, PSource):
+        """ With a param_fingerprint, fresh specs reuse the table until the fingerprint changes """
+        DispatchTable.clear()
+        source                    = PSource()
+        source.param_fingerprint  = "a"
+        table                     = DispatchTable.compile(source, list(params))
+        assert(DispatchTable.compile(source, list(params)) is table)
+        source.param_fingerprint  = "b"
+        assert(DispatchTable.compile(source, list(params)) is not table)
+
+    def test_compile_bounded(self, params, PSource, mocker):
+        mocker.patch.object(DispatchTable._tables, "maxsize", 2)
+        DispatchTable.clear()
+        for x in params:
+            DispatchTable.compile(PSource(), [x])
+
+        assert(len(DispatchTable._tables) == 2)
+
+class TestDispatchParsing:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_kwargs_any_order(self, PSource):
+        cmd = PSource(name="acmd", specs=[Specs.ParamSpec[bool](name="-blah"),
+                                          Specs.ParamSpec[bool](name="-aweg")])
+        match ParseMachine(CLIParserModel())(["python", "acmd", "-blah", "-aweg"], prog=None, cmds=[cmd], subs=[]):
+            case ParseReport_d(remaining=(), cmds={"acmd":[result]}):
+                assert(result.args == {"aweg": True, "blah": True})
+            case x:
+                assert(False), x
+
+    def test_table_reused_across_parses(self, PSource):
+        DispatchTable.clear()
+        cmd = PSource(name="acmd", specs=[Specs.ParamSpec[bool](name="-blah")])
+        for _ in range(2):
+            ParseMachine(CLIParserModel())(["python", "acmd", "-blah"], prog=None, cmds=[cmd], subs=[])
+
+        # One table for the prog section, and one for acmd
+        assert(len(DispatchTable._tables) == 2)
+        assert(DispatchTable._tables.get([cmd]) is not None)
+
+    def test_kwarg_once_per_section(self, PSource):
+        cmd = PSource(name="acmd", specs=[Specs.ParamSpec[bool](name="-blah")])
+        match ParseMachine(CLIParserModel())(["python", "acmd", "-blah", "-blah"], prog=None, cmds=[cmd], subs=[]):
+            case ParseReport_d(remaining=("-blah",), cmds={"acmd":[result]}):
+                assert(result.args == {"blah": True})
+            case x:
+                assert(False), x
+
+    def test_kwargs_and_posargs(self, PSource, params):
+        cmd = PSource(name="acmd", specs=params)
+        match ParseMachine(CLIParserModel())(["python", "acmd", "--val=2", "-key", "a", "-b", "x", "y"],
+                                             prog=None, cmds=[cmd], subs=[]):
+            case ParseReport_d(remaining=(), cmds={"acmd":[result]}):
+                assert(result.args['val'] == "2")
+                assert(result.args['key'] == "a")
+                assert(result.args['blah'] is True)
+                assert(result.args['bloo'] is False)
+                assert(result.args['first'] == "x")
+                assert(result.args['second'] == "y")
+            case x:
+                assert(False), x
+
+@pytest.mark.benchmark
+class TestDispatch_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_kwarg_lookup(self):
+        """ Finding the kwarg for 1k heads in a section of 300 params,
+        compared to testing each param with matches_head
+        """
+        params  = [Specs.ParamSpec[bool](name=f"-flag{i}") for i in range(100)]
+        params += [Specs.KeyParam[str](name=f"-key{i}") for i in range(100)]
+        params += [Specs.AssignParam(name=f"--assign{i}=") for i in range(100)]
+        heads   = [f"-flag{i}" for i in range(0, 100, 3)] + [f"--assign{i}=val" for i in range(0, 100, 3)]
+        heads   = (heads * 20)[:1_000]
+        proc    = ParamSpec._processor
+        with Benchmark(f"Matching {len(heads)} heads against {len(params)} params") as bench:
+            with bench.case("scanning"):
+                ordered  = sorted(params, key=ParamSpec.key_func)
+                scanned  = [[x for x in ordered if proc.matches_head(x, head)] for head in heads]
+
+            with bench.case("dispatch table"):
+                table    = DispatchTable(params)
+                found    = [[x for _, x in table.kwargs_for(head)] for head in heads]
+
+        assert(found == scanned)
+        assert(bench["dispatch table"] < bench["scanning"])
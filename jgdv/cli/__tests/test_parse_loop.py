@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004, N802
+from __future__ import annotations
+
+import logging as logmod
+import random
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from .. import param_spec as Specs  # noqa: N812
+from ..errors import ParseError
+from .._interface import ParseEngine_e, ParseReport_d, ParseResult_d
+from ..parse_loop import ParseLoop, build_parser
+from ..parse_machine import ParseMachine
+from ..parser_model import CLIParserModel
+
+logging = logmod.root
+
+class ASource:
+
+    def __init__(self, *, name=None, specs=None) -> None:
+        self._name = name or "simple"
+        self.specs = specs or []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def param_specs(self) -> list:
+        return self.specs
+
+PROG  = ASource(name="aweg", specs=[Specs.ParamSpec[bool](name="-v"), Specs.AssignParam(name="--level=")])
+ACMD  = ASource(name="acmd", specs=[Specs.ParamSpec[bool](name="-blah"),
+                                    Specs.KeyParam[str](name="-key"),
+                                    Specs.PositionalParam(name="<1>target", type=str)])
+BCMD  = ASource(name="bcmd", specs=[Specs.ParamSpec[bool](name="-aweg")])
+ASUB  = ASource(name="asub", specs=[Specs.ParamSpec[bool](name="-blah"), Specs.ParamSpec[bool](name="-bloo")])
+VOCAB = ["acmd", "bcmd", "asub", "-blah", "-bloo", "-aweg", "-b", "-key", "val",
+         "-v", "--level=2", "--", "--help", "x"]
+
+def run(engine:str, args:list[str], implicits=None) -> tuple:
+    """ Parse with an engine, returning the results or the error, for comparing """
+    parser = build_parser(CLIParserModel(), engine=engine)
+    try:
+        result = parser(args, prog=PROG, cmds=[ACMD, BCMD], subs=[((ACMD.name,), ASUB)], implicits=implicits)
+    except Exception as err:  # noqa: BLE001
+        return "error", type(err), err.args
+    else:
+        match result:
+            case None:
+                return "none", parser.count
+            case ParseReport_d():
+                return "report", parser.count, result.raw, result.remaining, result.to_dict()
+            case x:
+                return "other", x
+
+##--|
+
+class TestParseLoop:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_creation(self):
+        parser = ParseLoop(CLIParserModel())
+        assert(isinstance(parser.model, CLIParserModel))
+        assert(parser.current_state == "Start")
+
+    def test_creation_fail(self):
+        with pytest.raises(TypeError):
+            ParseLoop(None)
+
+    def test_build_parser(self):
+        assert(isinstance(build_parser(), ParseMachine))
+        assert(isinstance(build_parser(engine=ParseEngine_e.loop), ParseLoop))
+        assert(isinstance(build_parser(CLIParserModel(), engine="loop"), ParseLoop))
+
+    def test_empty_parse(self):
+        parser = ParseLoop(CLIParserModel())
+        assert(parser([], prog=None, cmds=[], subs=[]) is None)
+        assert(parser.current_state == "End")
+
+    def test_parse_cmd_and_sub(self):
+        parser = ParseLoop(CLIParserModel())
+        match parser(["aweg", "-v", "acmd", "-blah", "x", "asub"], prog=PROG, cmds=[ACMD], subs=[((ACMD.name,), ASUB)]):
+            case ParseReport_d(remaining=(), prog=ParseResult_d() as prog, cmds={"acmd":[cmd]}, subs={"asub": [sub]}):
+                assert(prog.args['v'] is True)
+                assert(cmd.args['blah'] is True)
+                assert(cmd.args['target'] == "x")
+                assert(sub.ref == "acmd")
+                assert(parser.current_state == "End")
+            case x:
+                assert(False), x
+
+    def test_max_stages(self):
+        parser = ParseLoop(CLIParserModel(), max=3)
+        with pytest.raises(StopIteration):
+            parser(["aweg", "acmd"], prog=PROG, cmds=[ACMD], subs=[])
+
+    def test_no_transition(self):
+        """ A state with no allowed transitions is a ParseError, not statemachine's TransitionNotAllowed """
+
+        class StuckLoop(ParseLoop):
+            transitions = {**ParseLoop.transitions, "Prepare": (("not _has_more_args", "End", None),)}
+
+        with pytest.raises(ParseError):
+            StuckLoop(CLIParserModel())(["aweg", "acmd"], prog=PROG, cmds=[ACMD], subs=[])
+
+    def test_transitions_match_machine(self):
+        """ The loop's table is the machine's transitions, in the same order """
+        for state in ParseMachine.states:
+            expected = [(next((str(c) for c in t.cond), None), t.target.id) for t in state.transitions]
+            actual   = [(cond, target) for cond, target, _ in ParseLoop.transitions[state.id]]
+            assert(expected == actual), state.id
+            enter    = [str(x) for x in state.enter if not str(x).startswith("on_enter")]
+            assert(enter == [y for y in [ParseLoop.enters.get(state.id, None)] if y is not None]), state.id
+
+class TestParseLoop_Differential:
+    """ The loop and the machine give the same results """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    @pytest.mark.parametrize("args", [
+        [],
+        ["aweg"],
+        ["aweg", "--help"],
+        ["aweg", "-v", "--level=3"],
+        ["aweg", "acmd", "-blah", "-key", "val", "x"],
+        ["aweg", "acmd", "-key", "val", "-blah", "asub", "-bloo", "--", "asub"],
+        ["aweg", "acmd", "x", "y", "z"],
+        ["aweg", "bcmd", "-aweg", "--", "acmd", "--help"],
+        ["aweg", "bcmd", "asub"],
+        ["aweg", "-blah"],
+    ])
+    def test_scenarios(self, args):
+        assert(run("loop", args) == run("machine", args))
+
+    @pytest.mark.parametrize("args", [["aweg", "asub"], ["aweg", "-blah", "asub"], ["aweg"]])
+    def test_implicits(self, args):
+        assert(run("loop", args, implicits=["acmd"]) == run("machine", args, implicits=["acmd"]))
+
+    def test_random(self):
+        rand = random.Random(4296)  # noqa: S311
+        for _ in range(30):
+            args      = ["aweg", *rand.choices(VOCAB, k=rand.randint(0, 8))]
+            implicits = rand.choice([None, ["acmd"]])
+            assert(run("loop", args, implicits) == run("machine", args, implicits)), args
+
+@pytest.mark.benchmark
+class TestParseLoop_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_startup(self):
+        """ Building a parser and parsing a short invocation, 50 times """
+        count  = 50
+        args   = ["aweg", "-v", "acmd", "-blah", "-key", "val", "x", "asub", "-bloo"]
+        kwargs = {"prog": PROG, "cmds": [ACMD, BCMD], "subs": [((ACMD.name,), ASUB)]}
+        with Benchmark("Building and parsing", count=count) as bench:
+            with bench.case("machine"):
+                for _ in range(count):
+                    ParseMachine(CLIParserModel())(args, **kwargs)
+
+            with bench.case("loop"):
+                for _ in range(count):
+                    ParseLoop(CLIParserModel())(args, **kwargs)
+
+        assert(run("loop", args) == run("machine", args))
+        assert(bench["loop"] < bench["machine"])
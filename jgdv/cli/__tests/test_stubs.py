@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+import sys
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from jgdv.structs.strang import CodeReference
+from .. import param_spec as Specs  # noqa: N812
+from .._interface import ParamSource_p, ParseReport_d
+from ..catalogue import ParamCatalogue
+from ..parse_loop import build_parser
+from ..parser_model import CLIParserModel
+from ..stubs import SourceStub, module_file
+
+logging = logmod.root
+MISSING : str = "jgdv.cli.__tests.not_a_module:Missing"
+
+class LazySource:
+    """ A Source which counts how often it is built """
+    built : int = 0
+
+    def __init__(self, name:str="lazy", *, count:int=2, positional:bool=True) -> None:
+        LazySource.built  += 1
+        self._name         = name
+        self.count         = count
+        self.positional    = positional
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def param_fingerprint(self) -> tuple:
+        return self.count, self.positional
+
+    def param_specs(self) -> list:
+        specs = [Specs.ParamSpec[bool](name=f"-{self._name}{i}") for i in range(self.count)]
+        if self.positional:
+            specs.append(Specs.PositionalParam(name="<1>target", type=str))
+        return specs
+
+PROG = LazySource("aweg", count=1, positional=False)
+
+@pytest.fixture(scope="function")
+def built():
+    LazySource.built = 0
+    return LazySource
+
+##--|
+
+class TestSourceStub:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        stub = SourceStub("acmd", lambda: LazySource("acmd"), aliases=["a"])
+        assert(isinstance(stub, ParamSource_p))
+        assert(stub.name == "acmd")
+        assert(stub.names == ("acmd", "a"))
+        assert(not stub.loaded)
+
+    def test_creation_fail(self):
+        with pytest.raises(TypeError):
+            SourceStub("acmd", 5)
+
+    def test_load_callable(self, built):
+        stub = SourceStub("acmd", lambda: LazySource("acmd"))
+        assert(built.built == 0)
+        assert(stub.load() is stub.load())
+        assert(stub.loaded)
+        assert(built.built == 1)
+        assert(stub.param_specs()[0].name == "acmd0")
+
+    def test_load_code_ref(self, built):
+        stub = SourceStub("lazy", f"{__name__}:LazySource")
+        assert(built.built == 0)
+        assert(isinstance(stub.load(), LazySource))
+        assert(built.built == 1)
+
+    def test_load_code_ref_instance(self):
+        stub = SourceStub("aweg", CodeReference(f"{__name__}:PROG"))
+        assert(stub.load() is PROG)
+
+    def test_load_missing(self):
+        stub = SourceStub("acmd", MISSING)
+        with pytest.raises(ImportError):
+            stub.load()
+
+    def test_load_wrong_name(self):
+        stub = SourceStub("acmd", lambda: LazySource("bcmd"))
+        with pytest.raises(ValueError):
+            stub.load()
+
+    def test_load_not_source(self):
+        stub = SourceStub("acmd", lambda: 5)
+        with pytest.raises(TypeError):
+            stub.load()
+
+    def test_fingerprint_without_loading(self):
+        stub = SourceStub("acmd", MISSING, aliases=["a"])
+        assert(stub.param_fingerprint == SourceStub("acmd", MISSING, aliases=["a"]).param_fingerprint)
+        assert(stub.param_fingerprint != SourceStub("acmd", MISSING).param_fingerprint)
+        assert(not stub.loaded)
+
+    def test_fingerprint_doesnt_import(self, tmp_path, monkeypatch):
+        """ Neither the module, nor its parent package, are imported """
+        pkg = tmp_path / "stub_fingerprint_pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("raise RuntimeError('imported')\n")
+        (pkg / "cmds.py").write_text("class Cmd: pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        stub   = SourceStub("acmd", "stub_fingerprint_pkg.cmds:Cmd")
+        first  = stub.param_fingerprint
+        assert("stub_fingerprint_pkg" not in sys.modules)
+        assert(module_file("stub_fingerprint_pkg.cmds") == str(pkg / "cmds.py"))
+        (pkg / "cmds.py").write_text("class Cmd:\n    pass\n")
+        assert(first != stub.param_fingerprint)
+
+    def test_module_file(self):
+        assert(module_file(__name__) == __file__)
+        assert(module_file("jgdv.cli.not_a_module") is None)
+        assert(module_file("not_a_package.sub") is None)
+
+class TestSourceStub_Parsing:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    @pytest.mark.parametrize("engine", ["machine", "loop"])
+    def test_only_referenced_are_loaded(self, engine):
+        """ Unused stubs point to a missing module, so loading them would fail """
+        acmd   = SourceStub("acmd", lambda: LazySource("acmd"))
+        cmds   = [acmd, *(SourceStub(f"cmd{i}", MISSING) for i in range(5))]
+        subs   = [(("acmd",), SourceStub("asub", MISSING))]
+        parser = build_parser(CLIParserModel(), engine=engine)
+        match parser(["aweg", "acmd", "-acmd1", "x"], prog=PROG, cmds=cmds, subs=subs):
+            case ParseReport_d(remaining=(), cmds={"acmd": [result]}):
+                assert(result.args["acmd1"] is True)
+                assert(result.args["target"] == "x")
+                assert(acmd.loaded)
+                assert(not any(x.loaded for x in cmds[1:]))
+                assert(not subs[0][1].loaded)
+            case x:
+                assert(False), x
+
+    def test_matches_sources(self):
+        args      = ["aweg", "-aweg0", "acmd", "-acmd0", "x", "asub", "-asub1", "--", "bcmd", "y"]
+        sources   = {"prog": PROG, "cmds": [LazySource("acmd"), LazySource("bcmd")], "subs": [(("acmd",), LazySource("asub"))]}
+        stubbed   = {"prog": PROG,
+                     "cmds": [SourceStub("acmd", lambda: LazySource("acmd")), SourceStub("bcmd", lambda: LazySource("bcmd"))],
+                     "subs": [(("acmd",), SourceStub("asub", lambda: LazySource("asub")))]}
+        expected  = build_parser(CLIParserModel(), engine="loop")(args, **sources)
+        result    = build_parser(CLIParserModel(), engine="loop")(args, **stubbed)
+        assert(result.to_dict() == expected.to_dict())
+
+    def test_aliases(self):
+        acmd  = SourceStub("acmd", lambda: LazySource("acmd"), aliases=["a"])
+        asub  = SourceStub("asub", lambda: LazySource("asub"), aliases=["s"])
+        match build_parser(CLIParserModel(), engine="loop")(["aweg", "a", "-acmd0", "x", "s", "-asub1", "y"], prog=PROG, cmds=[acmd, ("ac", acmd)], subs=[(("a",), asub)]):
+            case ParseReport_d(remaining=(), cmds={"a": [cmd]}, subs={"s": [sub]}):
+                assert(cmd.args["acmd0"] is True)
+                assert(sub.args["asub1"] is True)
+            case x:
+                assert(False), x
+
+    def test_implicit_stub(self):
+        acmd  = SourceStub("acmd", lambda: LazySource("acmd"))
+        match build_parser(CLIParserModel(), engine="loop")(["aweg", "-acmd1"], prog=PROG, cmds=[acmd, SourceStub("bcmd", MISSING)], subs=[], implicits=["acmd"]):
+            case ParseReport_d(cmds={"acmd": [cmd]}):
+                assert(cmd.args["acmd1"] is True)
+            case x:
+                assert(False), x
+
+    def test_missing_referenced_fails(self):
+        cmds = [SourceStub("acmd", MISSING)]
+        with pytest.raises(ImportError):
+            build_parser(CLIParserModel(), engine="loop")(["aweg", "acmd"], prog=PROG, cmds=cmds, subs=[])
+
+    def test_help_enumerates_everything(self, built):
+        """ Help parses only what's referenced, but every stub can still be listed """
+        cmds = [SourceStub(f"cmd{i}", lambda i=i: LazySource(f"cmd{i}")) for i in range(5)]
+        match build_parser(CLIParserModel(), engine="loop")(["aweg", "cmd1", "--help"], prog=PROG, cmds=cmds, subs=[]):
+            case ParseReport_d(help=True):
+                assert(built.built == 1)
+            case x:
+                assert(False), x
+
+        listed = {x.name: [y.name for y in x.param_specs()] for x in cmds}
+        assert(built.built == 5)
+        assert(listed["cmd3"] == ["cmd30", "cmd31", "target"])
+
+    def test_catalogue(self):
+        acmd  = SourceStub("acmd", lambda: LazySource("acmd"), aliases=["a"])
+        cat   = ParamCatalogue.build(prog=PROG, cmds=[acmd], subs=[(("acmd",), SourceStub("asub", lambda: LazySource("asub"), aliases=["s"]))])
+        assert(cat.cmds["a"] is cat.cmds["acmd"])
+        assert(cat.constraints == {"acmd": {"asub", "s"}})
+        first = ParamCatalogue.fingerprint_of(prog=PROG, cmds=[acmd], subs=[])
+        assert(first != ParamCatalogue.fingerprint_of(prog=PROG, cmds=[SourceStub("acmd", lambda: LazySource("acmd"))], subs=[]))
+
+@pytest.mark.benchmark
+class TestSourceStub_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_many_cmds(self, built):
+        """ Parsing one of 400 cmds of ~12 params each, from sources and from stubs """
+        count    = 400
+        args     = ["aweg", "cmd5", "-cmd53", "x"]
+        with Benchmark(f"Parsing with {count} cmds") as bench:
+            with bench.case("from sources"):
+                sources   = [LazySource(f"cmd{i}", count=10) for i in range(count)]
+                expected  = build_parser(CLIParserModel(), engine="loop")(args, prog=PROG, cmds=sources, subs=[])
+
+            built.built = 0
+            with bench.case("from stubs"):
+                stubs   = [SourceStub(f"cmd{i}", lambda i=i: LazySource(f"cmd{i}", count=10)) for i in range(count)]
+                result  = build_parser(CLIParserModel(), engine="loop")(args, prog=PROG, cmds=stubs, subs=[])
+
+        assert(built.built == 1)
+        assert(result.to_dict() == expected.to_dict())
+        assert(bench["from stubs"] < bench["from sources"])
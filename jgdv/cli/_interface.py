@@ -40,6 +40,7 @@ from typing import Any
 if TYPE_CHECKING:
     import types
     from jgdv import Maybe, Rx
+    from .cursor import ArgCursor
     from typing import Final
     from typing import ClassVar, LiteralString
     from typing import Never, Self, Literal
@@ -69,6 +70,7 @@ EXTRA_KEY           : Final[str]  = "_extra_"
 NON_DEFAULT_KEY     : Final[str]  = "_non_default_"
 DEFAULT_COUNT       : Final[int]  = 1
 UNRESTRICTED_COUNT  : Final[int]  = -1
+MAX_STAGES          : Final[int]  = 200
 ##--|
 TYPE_CONV_MAPPING: Final[dict[str|type|types.GenericAlias, type|Callable]] = {
     "int"               : int,
@@ -86,6 +88,11 @@ class SectionType_e(enum.Enum):
     cmd  = enum.auto()
     sub  = enum.auto()
 
+class ParseEngine_e(enum.StrEnum):
+    """ The different engines that can run a parser model """
+    machine  = "machine"
+    loop     = "loop"
+
 class ParseResult_d:
     """ Simple container for parsed cli information
 
@@ -167,7 +174,7 @@ class ParamSpec_p(Protocol):
     @classmethod
     def key_func(cls, x:ParamSpec_i) -> tuple: ...
 
-    def consume(self, args:list[str], *, offset:int=0) -> Maybe[tuple[dict, int]]:
+    def consume(self, args:Sequence[str], *, offset:int=0) -> Maybe[tuple[dict, int]]:
         pass
 
     ##--| properties
@@ -211,6 +218,11 @@ class ParamSpec_i(ParamSpec_p, Protocol):
     separator  : str|Literal[False]
     implicit   : bool
 
+    @property
+    def head_keys(self) -> Maybe[list[str]]:
+        """ The exact heads the param matches, or None if it has to be tested with matches_head """
+        return None
+
 ##--| Param Subtypes
 
 @runtime_checkable
@@ -241,8 +253,11 @@ class ToggleParam_p(Protocol):
 @runtime_checkable
 class ArgParserModel_p(Protocol):
     """ The Model used in a jgdv.cli.arg_parser:ParseMachine to implement specific parsing logic """
+    args_initial    : tuple[str, ...]
+    args_remaining  : ArgCursor
+    _report         : Maybe[ParseReport_d]
 
-    def prepare_for_parse(self, *, prog:ParamSource_p, cmds:list[ParamSource_p], subs:list[tuple[tuple[str, ...], ParamSource_p]], raw_args:list[str]) -> None: ...
+    def prepare_for_parse(self, *, prog:Maybe[ParamSource_p]=None, cmds:Maybe[list[ParamSource_p]]=None, subs:Maybe[list[tuple[tuple[str, ...], ParamSource_p]]]=None, raw_args:list[str], implicits:Maybe[dict[str, list[str]]]=None, catalogue:Maybe[Any]=None) -> None: ...  # noqa: PLR0913
 
 @runtime_checkable
 class ParamSource_p(Protocol):
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Catalogues of param specs, built once and reused across cli invocations.
+
+Preparing to parse asks every cmd and sub source for its param specs,
+which often builds and validates fresh ParamSpecs each time.
+A ParamCatalogue does that once, storing each section's specs,
+and the DispatchTables of the sections that are parsed.
+It can be saved to disk, keyed by a fingerprint of the sources,
+so a later invocation with the same sources loads it instead::
+
+    catalogue = ParamCatalogue.cached(path, prog=prog, cmds=cmds, subs=subs)
+    report    = parser(args, catalogue=catalogue)
+
+The fingerprint doesn't call param_specs.
+It uses each source's name, aliases and constraints,
+and where its class and its bases are defined (the module files' mtimes and sizes),
+along with the param spec modules the saved specs are instances of.
+Sources whose specs depend on more than their code should provide
+a param_fingerprint, as an attribute or method.
+Instances whose param_specs is a plain method can build their specs from their state,
+so unless they provide a param_fingerprint, the catalogue is built but not saved or loaded.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import contextlib
+import hashlib
+import inspect
+import logging as logmod
+import os
+import pathlib as pl
+import pickle
+import sys
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+import jgdv
+# ##-- end 1st party imports
+
+from . import param_spec as Specs  # noqa: N812
+from ._interface import SectionType_e, ParamSource_p
+from .dispatch import DispatchTable
+from .stubs import SourceStub, file_stat
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from ._interface import ParamSpec_i
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type SectionKey = tuple[SectionType_e, str]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+CATALOGUE_VERSION  : Final[int]  = 1
+PROG_KEY           : Final[str]  = "prog"
+BadSourceMsg       : Final[str]  = "Catalogue sources need to be ParamSource_p's"
+
+# Body:
+
+class ParamCatalogue:
+    """ The param specs of a prog, its cmds and subs.
+
+    Mirrors what CLIParserModel.prepare_for_parse builds from its sources:
+    | prog        : the prog name and specs,
+    | cmds        : cmd name (and aliases) -> specs,
+    | subs        : sub name -> specs,
+    | constraints : cmd name -> sub names available to it.
+
+    Dispatch tables are compiled when a section is first parsed.
+    They aren't saved, as loading a table for every cmd costs more
+    than compiling the few that are used.
+    """
+    __slots__ = ("cmds", "constraints", "fingerprint", "prog", "prog_name", "subs", "tables")
+    prog_name    : Maybe[str]
+    prog         : list[ParamSpec_i]
+    cmds         : dict[str, list[ParamSpec_i]]
+    subs         : dict[str, list[ParamSpec_i]]
+    constraints  : dict[str, set[str]]
+    tables       : dict[SectionKey, DispatchTable]
+    fingerprint  : Maybe[str]
+
+    def __init__(self) -> None:
+        self.prog_name    = None
+        self.prog         = []
+        self.cmds         = {}
+        self.subs         = {}
+        self.constraints  = {}
+        self.tables       = {}
+        self.fingerprint  = None
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.prog_name}, cmds:{len(self.cmds)}, subs:{len(self.subs)}>"
+
+    @override
+    def __getstate__(self) -> tuple[None, dict]:
+        return None, {x: getattr(self, x) for x in self.__slots__ if x != "tables"}
+
+    def __setstate__(self, state:tuple[None, dict]) -> None:
+        for key, val in state[1].items():
+            setattr(self, key, val)
+        else:
+            self.tables = {}
+
+    @classmethod
+    def build(cls, *, prog:Maybe[ParamSource_p], cmds:list, subs:list, fingerprint:Maybe[str]=None) -> Self:
+        """ Get the specs from every source """
+        obj = cls()
+        obj.fingerprint = fingerprint
+        obj._add_prog(prog)
+        for cmd in cmds:
+            obj._add_cmd(cmd)
+        for sub in subs:
+            obj._add_sub(sub)
+        else:
+            return obj
+
+    @classmethod
+    def cached(cls, path:pl.Path, *, prog:Maybe[ParamSource_p], cmds:list, subs:list) -> Self:
+        """ Load the catalogue for these sources from path,
+        or build it and save it there if it's missing or out of date.
+        """
+        fingerprint = cls.fingerprint_of(prog=prog, cmds=cmds, subs=subs)
+        if fingerprint is None:
+            logging.info("Param catalogue sources can't be fingerprinted, not caching: %s", path)
+            return cls.build(prog=prog, cmds=cmds, subs=subs)
+
+        match cls.load(path, fingerprint=fingerprint):
+            case ParamCatalogue() as loaded:
+                return cast("Self", loaded)
+            case None:
+                built = cls.build(prog=prog, cmds=cmds, subs=subs, fingerprint=fingerprint)
+                built.save(path)
+                return built
+
+    @classmethod
+    def load(cls, path:pl.Path, *, fingerprint:Maybe[str]=None) -> Maybe[Self]:
+        """ Load a saved catalogue.
+        Returns None if there isn't one, it can't be loaded,
+        or it doesn't match the fingerprint.
+        """
+        path = pl.Path(path)
+        if not path.is_file():
+            return None
+        try:
+            with path.open("rb") as f:
+                version, saved_print, obj = pickle.load(f)
+        except Exception as err:  # noqa: BLE001
+            logging.info("Failed to load param catalogue: %s : %s", path, err)
+            return None
+
+        match obj:
+            case _ if version != CATALOGUE_VERSION:
+                logging.info("Param catalogue is an old version, ignoring: %s", path)
+                return None
+            case _ if fingerprint is not None and saved_print != fingerprint:
+                logging.info("Param catalogue is out of date, ignoring: %s", path)
+                return None
+            case cls():
+                return obj
+            case _:
+                return None
+
+    @staticmethod
+    def fingerprint_of(*, prog:Maybe[ParamSource_p], cmds:list, subs:list) -> Maybe[str]:
+        """ A hash of the sources, without calling param_specs.
+        Returns None if a source can't be identified without its specs.
+        """
+        files   : dict[str, Any]         = {}
+        prints  : list[tuple[Any, ...]]  = []
+        parts   : list[Any]              = [CATALOGUE_VERSION, jgdv.__version__, file_stat(__file__, files)]
+        parts  += [(x.name, file_stat(str(x), files)) for x in sorted(pl.Path(Specs.__file__).parent.glob("*.py"))]
+        if prog is not None:
+            prints.append((PROG_KEY, _source_print(prog, files)))
+        for cmd in cmds:
+            match cmd:
+                case (str() as alias, source):
+                    prints.append((alias, _source_print(source, files)))
+                case source:
+                    prints.append((None, _source_print(source, files)))
+        for sub in subs:
+            match sub:
+                case [*constraints], source:
+                    prints.append((tuple(constraints), _source_print(source, files)))
+                case x:
+                    raise TypeError(BadSourceMsg, x)
+
+        if any(x is None for _, x in prints):
+            return None
+        parts += prints
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+    def save(self, path:pl.Path) -> bool:
+        """ Write the catalogue to path, replacing it atomically.
+        Returns False if the specs can't be pickled (eg: lambda defaults),
+        or the file can't be written.
+        """
+        path  = pl.Path(path)
+        temp  = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            data = pickle.dumps((CATALOGUE_VERSION, self.fingerprint, self), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as err:
+            logging.info("Param catalogue can't be saved: %s", err)
+            return False
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp.write_bytes(data)
+            temp.replace(path)
+        except OSError as err:
+            logging.info("Param catalogue can't be written: %s : %s", path, err)
+            with contextlib.suppress(OSError):
+                temp.unlink(missing_ok=True)
+            return False
+        else:
+            return True
+
+    def table(self, section:SectionType_e, name:str) -> DispatchTable:
+        """ Get the dispatch table of a section, compiling it if necessary """
+        key    : SectionKey
+        specs  : list[ParamSpec_i]
+        match section:
+            case SectionType_e.prog:
+                key, specs = (section, PROG_KEY), self.prog
+            case SectionType_e.cmd:
+                key, specs = (section, name), self.cmds[name]
+            case SectionType_e.sub:
+                key, specs = (section, name), self.subs[name]
+
+        if key not in self.tables:
+            self.tables[key] = DispatchTable(specs)
+        return self.tables[key]
+
+    ##--| internal
+
+    def _add_prog(self, prog:Maybe[ParamSource_p]) -> None:
+        match prog:
+            case None:
+                pass
+            case ParamSource_p():
+                self.prog_name  = prog.name
+                self.prog       = list(prog.param_specs())
+            case x:
+                raise TypeError(BadSourceMsg, x)
+
+    def _add_cmd(self, cmd:Any) -> None:  # noqa: ANN401
+        match cmd:
+            case SourceStub() as stub:
+                specs = list(stub.param_specs())
+                for name in stub.names:
+                    self.cmds[name] = specs
+            case (str() as alias, ParamSource_p() as source):
+                self.cmds[source.name] = self.cmds[alias] = list(source.param_specs())
+            case ParamSource_p() as source:
+                self.cmds[source.name] = list(source.param_specs())
+            case x:
+                raise TypeError(BadSourceMsg, x)
+
+    def _add_sub(self, sub:Any) -> None:  # noqa: ANN401
+        match sub:
+            case [*constraints], SourceStub() as stub:
+                specs = list(stub.param_specs())
+                for name in stub.names:
+                    self.subs[name] = specs
+                for c in constraints:
+                    self.constraints.setdefault(c, set()).update(stub.names)
+            case [*constraints], ParamSource_p() as source:
+                self.subs[source.name] = list(source.param_specs())
+                for c in constraints:
+                    self.constraints.setdefault(c, set()).add(source.name)
+            case x:
+                raise TypeError(BadSourceMsg, x)
+
+##--| utils
+
+def _source_print(source:Any, files:dict[str, Any]) -> Maybe[tuple]:  # noqa: ANN401
+    """ Identify a source by its name, and either its param_fingerprint,
+    or where its class, and the classes it inherits from, are defined.
+
+    Returns None for an instance whose param_specs isn't a class or static method,
+    as its specs can depend on its state.
+    """
+    match getattr(source, "param_fingerprint", None):
+        case None:
+            pass
+        case x if callable(x):
+            return source.name, x()
+        case x:
+            return source.name, x
+
+    cls = source if isinstance(source, type) else type(source)
+    if cls is not source and not isinstance(inspect.getattr_static(cls, "param_specs", None), classmethod|staticmethod):
+        return None
+
+    modules  = dict.fromkeys(x.__module__ for x in cls.__mro__ if x.__module__ != "builtins")
+    stats    = tuple((x, file_stat(getattr(sys.modules.get(x, None), "__file__", None), files)) for x in modules)
+    return source.name, cls.__module__, cls.__qualname__, stats
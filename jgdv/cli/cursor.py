@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+A Cursor over the args being parsed.
+
+Instead of slicing the remaining args after each param is consumed,
+the parser model keeps the args as an immutable tuple,
+and an ArgCursor of the range that hasn't been parsed yet.
+Consuming args moves the start of the range, so parsing is linear in the number of args.
+
+Implicit cmds and subs are inserted in front of the range,
+without copying the args.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import itertools as itz
+import logging as logmod
+# ##-- end stdlib imports
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+EmptyCursorMsg : Final[str] = "No args remain in the cursor"
+
+# Body:
+
+class ArgCursor(collections.abc.Sequence):
+    """ A read only view of args[start:end], with any inserted args in front.
+
+    Indexing is relative to the front of the view.
+    Slicing returns a list, as slicing the remaining args used to.
+    advance, pop_head, pop_tail and insert move the view, without copying args.
+    """
+    __slots__ = ("_args", "_end", "_inserted", "_start")
+    _args      : Sequence[str]
+    _start     : int
+    _end       : int
+    _inserted  : tuple[str, ...]
+
+    def __init__(self, args:Sequence[str]=(), *, start:int=0, end:Maybe[int]=None, inserted:Iterable[str]=()) -> None:
+        self._args      = args
+        self._start     = start
+        self._end       = len(args) if end is None else end
+        self._inserted  = tuple(inserted)
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self._start}:{self._end}/{len(self._args)} (+{len(self._inserted)})>"
+
+    @override
+    def __len__(self) -> int:
+        return len(self._inserted) + max(0, self._end - self._start)
+
+    @overload
+    def __getitem__(self, idx:int) -> str: ...
+
+    @overload
+    def __getitem__(self, idx:slice) -> list[str]: ...
+
+    @override
+    def __getitem__(self, idx:int|slice) -> str|list[str]:
+        count : int
+        match idx:
+            case int():
+                count = len(self._inserted)
+                if idx < 0:
+                    idx += len(self)
+                if not (0 <= idx < len(self)):
+                    raise IndexError(idx)
+                if idx < count:
+                    return self._inserted[idx]
+                return self._args[self._start + idx - count]
+            case slice() if not bool(self._inserted) and idx.step in {None, 1}:
+                lower, upper, _ = idx.indices(len(self))
+                return list(self._args[self._start + lower:self._start + max(lower, upper)])
+            case slice():
+                return [self[i] for i in range(*idx.indices(len(self)))]
+            case x:
+                raise TypeError(type(x))
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        yield from self._inserted
+        yield from itz.islice(self._args, self._start, self._end)
+
+    @override
+    def __eq__(self, other:object) -> bool:
+        match other:
+            case ArgCursor() | list() | tuple():
+                return len(self) == len(other) and all(x == y for x, y in zip(self, other, strict=True))
+            case _:
+                return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def position(self) -> int:
+        """ How far into the args the cursor is, not counting inserted args """
+        return self._start
+
+    def view(self, offset:int) -> ArgCursor:
+        """ A new cursor, offset further into the same args """
+        count = len(self._inserted)
+        if offset < count:
+            return ArgCursor(self._args, start=self._start, end=self._end, inserted=self._inserted[offset:])
+        return ArgCursor(self._args, start=self._start + offset - count, end=self._end)
+
+    def advance(self, count:int=1) -> None:
+        """ Move the front of the cursor past count args """
+        if bool(self._inserted):
+            taken            = min(count, len(self._inserted))
+            self._inserted   = self._inserted[taken:]
+            count           -= taken
+        self._start = min(self._start + count, max(self._start, self._end))
+
+    def pop_head(self) -> str:
+        if not bool(self):
+            raise IndexError(EmptyCursorMsg)
+        head = self[0]
+        self.advance(1)
+        return head
+
+    def pop_tail(self) -> str:
+        if not bool(self):
+            raise IndexError(EmptyCursorMsg)
+        tail = self[-1]
+        if self._start < self._end:
+            self._end -= 1
+        else:
+            self._inserted = self._inserted[:-1]
+        return tail
+
+    def insert(self, args:Iterable[str]) -> None:
+        """ Put args in front of the cursor, for implicit cmds and subs """
+        self._inserted = (*args, *self._inserted)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Precompiled lookups of a section's param specs, for CLIParserModel.
+
+A DispatchTable sorts a list of specs once (by ParamSpec.key_func),
+and maps every head a kwarg can be written as to its spec:
+long, short and no- inverse key strings,
+and the key part of assignments (eg: --key=val -> --key).
+So finding the kwarg for a cli arg is a dict lookup, instead of testing every param.
+
+Params which decide for themselves if they match (eg: wildcards),
+and don't provide head_keys, are still tested in turn.
+
+Compiled tables are cached per source, so a source parsed again reuses its table.
+A cached table is reused while the source's param_fingerprint is unchanged,
+or, for sources without one, while it returns the same spec objects.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+from jgdv.util.id_cache import IdCache
+# ##-- end 1st party imports
+
+from . import _interface as API # noqa: N812
+from .param_spec import ParamSpec
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from .param_spec.param_spec import ParamProcessor
+    from ._interface import ParamSpec_i
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Entry = tuple[int, ParamSpec_i]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+DEFAULT_DISPATCH_MAX : Final[int] = 256
+
+# Body:
+
+class DispatchTable:
+    """ The sorted params of a section, with a lookup of head -> kwarg params.
+
+    Candidates for a head are returned as (position, param) pairs,
+    in sorted order, so shared heads (eg: the short -b of -blah and -bloo)
+    are tried in the same order as before.
+    """
+    __slots__ = ("_assign", "_exact", "_unindexed", "params", "positionals")
+    _tables      : ClassVar[IdCache[tuple[tuple, DispatchTable]]] = IdCache(maxsize=DEFAULT_DISPATCH_MAX)
+    params       : tuple[ParamSpec_i, ...]
+    positionals  : tuple[ParamSpec_i, ...]
+    _exact       : dict[str, tuple[Entry, ...]]
+    _assign      : dict[str, dict[str, tuple[Entry, ...]]]
+    _unindexed   : tuple[Entry, ...]
+
+    @staticmethod
+    def compile(source:Any, params:Iterable[ParamSpec_i]) -> DispatchTable:  # noqa: ANN401
+        """ Get the table for a source's params, building it if the source's cached table is stale """
+        table  : DispatchTable
+        params = tuple(params)
+        mark   = DispatchTable._source_mark(source, params)
+        match DispatchTable._tables.get([source]):
+            case [x, table] if x == mark:
+                return table
+            case _:
+                table = DispatchTable(params)
+                DispatchTable._tables.add([source], (mark, table))
+                return table
+
+    @staticmethod
+    def clear() -> None:
+        DispatchTable._tables.clear()
+
+    @staticmethod
+    def _source_mark(source:Any, params:tuple[ParamSpec_i, ...]) -> tuple:  # noqa: ANN401
+        """ What a cached table was built from.
+        The source's param_fingerprint if it has one, otherwise the ids of its specs.
+        (the ids stay unique, as the cached table holds the specs)
+        """
+        match getattr(source, "param_fingerprint", None):
+            case None:
+                return (None, *(id(x) for x in params))
+            case x if callable(x):
+                return (x(),)
+            case x:
+                return (x,)
+
+    def __init__(self, params:Iterable[ParamSpec_i], *, processor:Maybe[ParamProcessor]=None) -> None:
+        exact      : dict[str, list[Entry]]             = {}
+        assign     : dict[str, dict[str, list[Entry]]]  = {}
+        unindexed  : list[Entry]                        = []
+        processor  = processor or ParamSpec._processor
+        self.params       = tuple(sorted(params, key=ParamSpec.key_func))
+        self.positionals  = tuple(x for x in self.params if isinstance(x, API.PositionalParam_p))
+        for entry in enumerate(self.params):
+            match entry[1], processor.head_keys(entry[1]):
+                case API.PositionalParam_p(), _:
+                    continue
+                case _, None:
+                    unindexed.append(entry)
+                case param, [*keys]:
+                    for key in dict.fromkeys(keys):
+                        exact.setdefault(key, []).append(entry)
+                        if param.separator:
+                            assign.setdefault(param.separator, {}).setdefault(key, []).append(entry)
+        else:
+            self._exact      = {k: tuple(v) for k, v in exact.items()}
+            self._assign     = {s: {k: tuple(v) for k, v in keys.items()} for s, keys in assign.items()}
+            self._unindexed  = tuple(unindexed)
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self.params)} params, {len(self._exact)} heads>"
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def kwargs_for(self, head:str, *, processor:Maybe[ParamProcessor]=None) -> list[Entry]:
+        """ The kwarg params that match a head, as (position, param) pairs in sorted order """
+        found : list[Entry] = list(self._exact.get(head, ()))
+        for sep, keys in self._assign.items():
+            if sep in head:
+                found += keys.get(head.partition(sep)[0], ())
+        if bool(self._unindexed):
+            processor = processor or ParamSpec._processor
+            found += (x for x in self._unindexed if processor.matches_head(x[1], head))
+
+        match found:
+            case [] | [_]:
+                return found
+            case _:
+                return sorted(dict(found).items())
@@ -121,6 +121,21 @@ class TestPositionalParam:
                 assert(False), x
 
 
+    def test_consume_unrestricted_stops_at_separator(self):
+        data = {
+            "name"     : "test",
+            "type"     : list,
+            "default"  : [],
+            "count"    : -1,
+        }
+        in_data = ("bloo", "blah", "--", "aweg")
+        obj = core.PositionalParam(**data)
+        match obj.consume(in_data):
+            case {"test": ["bloo", "blah"]}, 2:
+                assert(True)
+            case x:
+                assert(False), x
+
     def test_consume_unrestricted_one_still_is_list(self):
         data = {
             "name"     : "test",
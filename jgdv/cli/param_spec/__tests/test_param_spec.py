@@ -16,6 +16,7 @@ from typing import Any
 from ... import ParseError
 from .. import param_spec as pbase
 from ..param_spec import ParamSpec, ParamProcessor
+from ..core import LiteralParam
 from ... import _interface as API # noqa: N812
 
 ##--| vars
@@ -83,6 +84,26 @@ class TestParamProcessor:
         assert(not obj.matches_head(param, f"-{key}=val"))
         assert(not obj.matches_head(param, f"-{key[0]}=val"))
 
+    @pytest.mark.parametrize("key", [*good_names])
+    def test_head_keys(self, key):
+        obj    = ParamProcessor()
+        param  = ParamSpec(name=f"-{key}")
+        assert(obj.head_keys(param) == [f"-{key}", f"-{key[0]}", f"-no-{key}"])
+
+    def test_head_keys_from_param(self):
+        obj    = ParamProcessor()
+        param  = LiteralParam(name="blah")
+        assert(obj.head_keys(param) == ["blah"])
+
+    def test_head_keys_unknown(self):
+
+        class AnyHead(ParamSpec):
+
+            def matches_head(self, val:str) -> bool:
+                return True
+
+        assert(ParamProcessor().head_keys(AnyHead(name="-blah")) is None)
+
 ##--|
 
 class TestParamSpec_classmethods:
@@ -80,8 +80,8 @@ class ToggleParam(ParamSpec, annotation=bool, default=True):
     def _toggle(self) -> Literal[True]:
         return True
 
-    def next_value(self, args:list) -> tuple[str, list, int]:
-        head, *_ = args
+    def next_value(self, args:Sequence[str]) -> tuple[str, list, int]:
+        head = args[0]
         if self.inverse in head:
             value = self.default_value
         else:
@@ -102,7 +102,12 @@ class KeyParam(ParamSpec[str]):
     def matches_head(self, val:str) -> bool:
         return val in self.key_strs
 
-    def next_value(self, args:list) -> tuple[str, list, int]:
+    @override
+    @property
+    def head_keys(self) -> list[str]:
+        return self.key_strs
+
+    def next_value(self, args:Sequence[str]) -> tuple[str, list, int]:
         """ get the value for a -key val """
         logging.debug("Getting Key/Value: %s : %s", self.name, args)
         match args:
@@ -139,7 +144,7 @@ class AssignParam(ParamSpec):
     def _assignment(self) -> Literal[True]:
         return True
 
-    def next_value(self, args:list) -> tuple[str, list, int]:
+    def next_value(self, args:Sequence[str]) -> tuple[str, list, int]:
         """ get the value for a --key=val """
         logging.debug("Getting Key Assignment: %s : %s", self.name, args)
         if self.separator not in args[0]:
@@ -177,18 +182,18 @@ class PositionalParam(ParamSpec):
     def matches_head(self, val:str) -> bool:  # noqa: ARG002
         return True
 
-    def next_value(self, args:list) -> tuple[str, list, int]:
+    def next_value(self, args:Sequence[str]) -> tuple[str, list, int]:
         match self.count:
             case API.DEFAULT_COUNT:
                 return self.name, [args[0]], 1
             case API.UNRESTRICTED_COUNT if self._processor.end_sep in args:
                 idx     = args.index(self._processor.end_sep)
-                claimed = args[max(idx, len(args))]
+                claimed = list(args[:idx])
                 return self.name, claimed, len(claimed)
             case API.UNRESTRICTED_COUNT:
-                return self.name, args[:], len(args)
+                return self.name, list(args), len(args)
             case int() as x if x < len(args):
-                return self.name, args[:x], x
+                return self.name, list(args[:x]), x
             case x:
                 msg = "Bad positional count"
                 raise ArgParseError(msg, x)
@@ -208,3 +213,8 @@ class LiteralParam(ToggleParam):
                 return True
             case _:
                 return False
+
+    @override
+    @property
+    def head_keys(self) -> list[str]:
+        return [self.key_str]
@@ -85,7 +85,7 @@ class WildcardParam(AssignParam):
             case _:
                 return False
 
-    def next_value(self, args:list) -> tuple[str, list, int]:
+    def next_value(self, args:Sequence[str]) -> tuple[str, list, int]:
         logging.debug("Getting Wildcard Key Assingment: %s", args)
         assert(self.separator in args[0]), (self.separator, args[0])
         key,val = self._processor.split_assignment(self, args[0])
@@ -118,21 +118,19 @@ class RepeatableParam(KeyParam):
         super().__init__(*args, **kwargs)
         self.type_ = list
 
-    def next_value(self, args:list) -> tuple[str, list, int]:
+    def next_value(self, args:Sequence[str]) -> tuple[str, list, int]:
         """ Get as many values as match
         eg: args[-test, 2, -test, 3, -test, 5, -nottest, 6]
         ->  [2,3,5], [-nottest, 6]
         """
         logging.debug("Getting until no more matches: %s : %s", self.name, args)
         assert(self.repeatable)
-        result, consumed, remaining  = [], 0, args[:]
-        while bool(remaining):
-            head, val, *rest = remaining
-            if not self.matches_head(head):
+        result, consumed  = [], 0
+        while consumed + 1 < len(args):
+            if not self.matches_head(args[consumed]):
                 break
             else:
-                result.append(val)
-                remaining = rest
+                result.append(args[consumed + 1])
                 consumed += 2
 
         return self.name, result, consumed
@@ -157,6 +155,11 @@ class ChoiceParam(LiteralParam):
         """
         return val in self._choices
 
+    @override
+    @property
+    def head_keys(self) -> list[str]:
+        return list(self._choices)
+
 class EntryParam(LiteralParam):
     """ TODO a parameter that if it matches,
     returns list of more params to parse
@@ -36,6 +36,7 @@ from jgdv.structs.chainguard import ChainGuard
 
 from .. import _interface as API # noqa: N812
 from .._interface import ParamSpec_i, ParamSpec_p
+from ..cursor import ArgCursor
 
 # ##-- types
 # isort: off
@@ -127,11 +128,12 @@ class ParamProcessor:
 
     ##--| consuming
 
-    def consume(self, obj:ParamSpec_i, args:list[str], *, offset:int=0) -> Maybe[tuple[dict, int]]:
+    def consume(self, obj:ParamSpec_i, args:Sequence[str], *, offset:int=0) -> Maybe[tuple[dict, int]]:
         """
           Given a list of args, possibly add a value to the data.
 
           return maybe(newdata, amount_consumed)
+          args isn't copied, offsets are a view of it (see cli.cursor.ArgCursor).
 
           handles:
           ["--arg=val"],
@@ -140,18 +142,28 @@ class ParamProcessor:
           ["-arg"],    (if type=bool)
           ["-no-arg"], (if type=bool)
           """
-        result  : Maybe[tuple[dict, int]]  = None
-        consumed, remaining                = 0, args[offset:]
+        result     : Maybe[tuple[dict, int]]  = None
+        remaining  : Sequence[str]
         ##--|
+        match args:
+            case _ if not bool(offset):
+                remaining = args
+            case ArgCursor():
+                remaining = args.view(offset)
+            case collections.abc.Sequence():
+                remaining = ArgCursor(args, start=offset)
         logging.debug("Trying to consume: %s : %s", obj.name, remaining)
         try:
             match remaining:
-                case []:
+                case str() | bytes() | None:
+                    msg = "Tried to consume a bad type"
+                    raise ArgParseError(msg, remaining)  # noqa: TRY301
+                case _ if not bool(remaining):
                     result = None
-                case [x, *xs] if not self.matches_head(obj, x):
+                case _ if not self.matches_head(obj, remaining[0]):
                     result = None
-                case [*xs]:
-                    key, value, consumed = self.next_value(obj, xs)
+                case collections.abc.Sequence():
+                    key, value, consumed = self.next_value(obj, remaining)
                     result = self.coerce_types(obj, key, value), consumed
                 case _:
                     msg = "Tried to consume a bad type"
@@ -162,7 +174,7 @@ class ParamProcessor:
         else:
             return result
 
-    def next_value(self, obj:ParamSpec_i, args:list) -> tuple[str, list, int]:
+    def next_value(self, obj:ParamSpec_i, args:Sequence[str]) -> tuple[str, list, int]:
         match getattr(obj, "next_value", None):
             case None:
                 pass
@@ -229,6 +241,34 @@ class ParamProcessor:
             logging.debug("Head Matches : %s : %s", obj.name, val)
         return result
 
+    def head_keys(self, obj:ParamSpec_i) -> Maybe[list[str]]:
+        """ The exact heads a param matches, for building dispatch tables.
+
+        Uses the param's head_keys if it matches heads itself,
+        and both are defined by the same class.
+        (So a subclass that overrides matches_head, but inherits head_keys, isn't trusted)
+        Returns None if it doesn't provide them,
+        so has to be tested with matches_head.
+        """
+        if getattr(obj, "matches_head", None) is None:
+            prefix = str(obj.prefix)
+            return [x for x in obj.key_strs if x.startswith(prefix)]
+
+        mro = type(obj).__mro__
+        match next((x for x in mro if "matches_head" in vars(x)), None), next((x for x in mro if "head_keys" in vars(x)), None):
+            case matcher, keyer if matcher is None or matcher is not keyer:
+                return None
+            case _:
+                pass
+
+        match obj.head_keys:
+            case None:
+                return None
+            case [*xs]:
+                return xs
+            case x:
+                raise TypeError(type(x))
+
     def match_on_end(self, val:str) -> bool:
         return val == self.end_sep
 
@@ -511,7 +551,7 @@ class ParamSpec[*T](_ParamClassMethods, ParamSpec_i, SubAlias_m, fresh_registry=
     ##--| methods
 
     @override
-    def consume(self, args:list[str], *, offset:int=0) -> Maybe[tuple[dict, int]]:
+    def consume(self, args:Sequence[str], *, offset:int=0) -> Maybe[tuple[dict, int]]:
         return self._processor.consume(self, args, offset=offset)
 
     @override
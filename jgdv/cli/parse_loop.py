@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+A Direct parsing loop, as an alternative engine to the ParseMachine StateMachine.
+
+ParseLoop follows the same states and transitions as ParseMachine,
+calling the same ArgParserModel conditions and actions.
+But the transitions are a precomputed table, bound to the model once,
+and walked by a plain loop.
+So there is no StateMachine setup, or per transition callback dispatch.
+
+Use build_parser to select an engine::
+
+    parser = build_parser(CLIParserModel(), engine=ParseEngine_e.loop)
+    report = parser(args, prog=prog, cmds=cmds, subs=subs)
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+# ##-- end stdlib imports
+
+from . import _interface as API # noqa: N812
+from . import errors
+from ._interface import MAX_STAGES
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from .parse_machine import ParseMachine
+    from ._interface import ParamSource_p, ArgParserModel_p
+    from .catalogue import ParamCatalogue
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Transition     = tuple[Maybe[str], str, Maybe[str]]
+    type BoundCond      = Maybe[Callable[[], bool]]
+    type BoundAction    = Maybe[Callable[[], Any]]
+    type BoundTransition = tuple[BoundCond, bool, str, BoundAction]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+START      : Final[str] = "Start"
+PREPARE    : Final[str] = "Prepare"
+END        : Final[str] = "End"
+NEGATE     : Final[str] = "not "
+NoTransitionMsg : Final[str] = "No Parse Transition Allowed"
+
+# Body:
+
+class ParseLoop:
+    """ Parses cli args by a direct loop over ParseMachine's transitions.
+
+    Constructed and called the same as ParseMachine,
+    and returns the model's ParseReport_d.
+
+    transitions : state -> ((condition, target, action),...), tried in order.
+    | conditions and actions are names of model methods,
+    | conditions can be negated with 'not '.
+    enters : state -> the model method to call on entering it.
+
+    Every state but End has an unconditional last transition, so the loop can't get stuck.
+    If a subclass's transitions leave a state with none allowed,
+    a ParseError is raised, where ParseMachine would raise statemachine's TransitionNotAllowed.
+    """
+    transitions : ClassVar[dict[str, tuple[Transition, ...]]] = {
+        "Start"        : ((None, "Prepare", None),),
+        "Prepare"      : (("not _has_more_args", "End", None),
+                          ("_has_no_specs", "End", None),
+                          ("_has_help_flag_at_tail", "Help", None),
+                          (None, "Head", None)),
+        "Help"         : ((None, "Head", None),),
+        "Head"         : (("_prog_at_front", "Prog", None),
+                          ("_cmd_at_front", "Cmd", None),
+                          ("_no_cmd", "Cmd", "_insert_implicit_cmd"),
+                          ("_sub_at_front", "Sub", None),
+                          ("_no_sub", "Sub", "_insert_implicit_sub"),
+                          (None, "Report", None)),
+        "Prog"         : ((None, "Section", None),),
+        "Cmd"          : ((None, "Section", None),),
+        "Sub"          : ((None, "Section", None),),
+        "Section"      : (("_kwarg_at_front", "Kwargs", None),
+                          ("_posarg_at_front", "Posargs", None),
+                          ("_separator_at_front", "Separator", None),
+                          (None, "Section_end", None)),
+        "Kwargs"       : (("_kwarg_at_front", "Kwargs", None),
+                          ("_posarg_at_front", "Posargs", None),
+                          ("_separator_at_front", "Separator", None),
+                          (None, "Section_end", None)),
+        "Posargs"      : (("_posarg_at_front", "Posargs", None),
+                          ("_separator_at_front", "Separator", None),
+                          (None, "Section_end", None)),
+        "Separator"    : ((None, "Section_end", None),),
+        "Section_end"  : (("not _has_more_args", "Report", None),
+                          (None, "Head", None)),
+        "Report"       : ((None, "Cleanup", None),),
+        "Cleanup"      : ((None, "End", None),),
+        "End"          : (),
+    }
+    enters : ClassVar[dict[str, str]] = {
+        "Prepare"      : "prepare_for_parse",
+        "Help"         : "set_force_help",
+        "Section"      : "initialise_section",
+        "Prog"         : "select_prog_spec",
+        "Cmd"          : "select_cmd_spec",
+        "Sub"          : "select_sub_spec",
+        "Kwargs"       : "parse_kwarg",
+        "Posargs"      : "parse_posarg",
+        "Separator"    : "parse_separator",
+        "Section_end"  : "clear_section",
+        "Cleanup"      : "cleanup",
+        "Report"       : "report",
+    }
+    model          : ArgParserModel_p
+    count          : int
+    max_attempts   : int
+    current_state  : str
+    _table         : dict[str, tuple[BoundTransition, ...]]
+    _enters        : dict[str, Callable]
+
+    def __init__(self, parser:Maybe[ArgParserModel_p]=None, max:int=MAX_STAGES) -> None:  # noqa: A002
+        match parser:
+            case API.ArgParserModel_p():
+                pass
+            case x:
+                raise TypeError(type(x))
+        self.model          = parser
+        self.count          = 0
+        self.max_attempts   = max
+        self.current_state  = START
+        self._table         = {state: tuple(self._bind(x) for x in trans) for state, trans in self.transitions.items()}
+        self._enters        = {state: getattr(parser, name) for state, name in self.enters.items()}
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.current_state}>"
+
+    def __call__(self, args:list[str], *, prog:Maybe[ParamSource_p]=None, cmds:Maybe[list[ParamSource_p]]=None, subs:Maybe[list[tuple[tuple[str, ...], ParamSource_p]]]=None, implicits:Maybe[dict[str,list[str]]]=None, catalogue:Maybe[ParamCatalogue]=None) -> Maybe[API.ParseReport_d]:  # noqa: PLR0913
+        assert(self.current_state == START)
+        debug   = logging.isEnabledFor(logmod.DEBUG)
+        enters  = self._enters
+        state   = START
+        while state != END:
+            _, _, target, action = self._next(state)
+            if debug:
+                logging.debug("Parse(%s, R:%s/%s): %s -> %s",
+                              self.count, len(self.model.args_remaining), len(self.model.args_initial), state, target)
+            self.count += 1
+            if self.max_attempts < self.count:
+                logging.debug("Max Parse Stages Occurred")
+                raise StopIteration
+
+            if action is not None:
+                action()
+
+            state = self.current_state = target
+            if state == PREPARE:
+                enters[state](prog=prog, cmds=cmds, subs=subs, raw_args=args, implicits=implicits, catalogue=catalogue)
+            elif state in enters:
+                enters[state]()
+        else:
+            return self.model._report
+
+    def _next(self, state:str) -> BoundTransition:
+        """ The first transition from a state whose condition holds """
+        transitions = self._table[state]
+        match next((x for x in transitions if x[0] is None or bool(x[0]()) is not x[1]), None):
+            case None:
+                raise errors.ParseError(NoTransitionMsg, state)
+            case x:
+                return x
+
+    def _bind(self, transition:Transition) -> BoundTransition:
+        """ Get the model's methods for a transition """
+        match transition:
+            case None, str() as target, action:
+                cond, negate = None, False
+            case str() as name, str() as target, action if name.startswith(NEGATE):
+                cond, negate = getattr(self.model, name.removeprefix(NEGATE)), True
+            case str() as name, str() as target, action:
+                cond, negate = getattr(self.model, name), False
+            case x:
+                raise TypeError(type(x))
+
+        match action:
+            case None:
+                return cond, negate, target, None
+            case str() as name:
+                return cond, negate, target, getattr(self.model, name)
+            case _:
+                raise TypeError(type(action))
+
+def build_parser(parser:Maybe[ArgParserModel_p]=None, *, engine:str|API.ParseEngine_e=API.ParseEngine_e.machine, max:int=MAX_STAGES) -> ParseMachine|ParseLoop:  # noqa: A002
+    """ Build a parser, using the given engine to run the model.
+    Defaults to a CLIParserModel
+    """
+    if parser is None:
+        from .parser_model import CLIParserModel  # noqa: PLC0415
+        parser = CLIParserModel()
+
+    match API.ParseEngine_e(engine):
+        case API.ParseEngine_e.machine:
+            from .parse_machine import ParseMachine  # noqa: PLC0415
+            return ParseMachine(parser, max=max)
+        case API.ParseEngine_e.loop:
+            return ParseLoop(parser, max=max)
+        case x:
+            raise ValueError(x)
@@ -40,6 +40,7 @@ from jgdv.structs.chainguard import ChainGuard
 
 from . import _interface as API # noqa: N812
 from . import errors
+from ._interface import MAX_STAGES
 
 # ##-- types
 # isort: off
@@ -54,6 +55,7 @@ from typing import no_type_check, final, override, overload
 
 if TYPE_CHECKING:
     from ._interface import ParamSource_p, ArgParserModel_p
+    from .catalogue import ParamCatalogue
     from jgdv import Maybe
     from typing import Final
     from typing import ClassVar, Any, LiteralString
@@ -68,7 +70,6 @@ if TYPE_CHECKING:
 
 logging = logmod.getLogger(__name__)
 
-MAX_STAGES : Final[int] = 200
 ##--|
 class ParseMachine(StateMachine):
     """
@@ -79,6 +80,7 @@ class ParseMachine(StateMachine):
     prog : list[ParamSpec_i] -- specs of the top level program
     cmds       : list[ParamSource_p] -- commands that can provide their parameters
     subs    : dict[str, list[ParamSource_p]] -- a mapping from commands -> subcommands that can provide parameters
+    catalogue  : ParamCatalogue -- prebuilt specs of prog, cmds and subs, used instead of them
 
     A cli call will be of the form:
     {proghead} {prog [kw]args} {cmd} {cmd[kw]args}* [{subs} {subs[kw]args} [-- {subs} {subargs}]* ]? (--help)?
@@ -158,10 +160,10 @@ class ParseMachine(StateMachine):
         self.count         = 0
         self.max_attempts  = max
 
-    def __call__(self, args:list[str], *, prog:ParamSource_p, cmds:list[ParamSource_p], subs:list[tuple[tuple[str, ...], ParamSource_p]], implicits:Maybe[dict[str,list[str]]]=None) -> Maybe[dict]:
+    def __call__(self, args:list[str], *, prog:Maybe[ParamSource_p]=None, cmds:Maybe[list[ParamSource_p]]=None, subs:Maybe[list[tuple[tuple[str, ...], ParamSource_p]]]=None, implicits:Maybe[dict[str,list[str]]]=None, catalogue:Maybe[ParamCatalogue]=None) -> Maybe[dict]:  # noqa: PLR0913
         assert(self.current_state == self.Start) # type: ignore[has-type]
         while self.current_state != self.End:
-            self.progress(prog=prog, cmds=cmds, subs=subs, raw_args=args, implicits=implicits)
+            self.progress(prog=prog, cmds=cmds, subs=subs, raw_args=args, implicits=implicits, catalogue=catalogue)
         else:
             return self.model._report
 
@@ -33,7 +33,11 @@ from jgdv.structs.chainguard import ChainGuard
 # ##-- end 1st party imports
 
 from . import errors
+from .catalogue import ParamCatalogue
+from .cursor import ArgCursor
+from .dispatch import DispatchTable
 from .param_spec import HelpParam, SeparatorParam, ParamSpec
+from .stubs import SourceStub
 from . import _interface as API # noqa: N812
 from ._interface import ParseResult_d, EXTRA_KEY, EMPTY_CMD, SectionType_e
 from ._interface import ParamSpec_p, ParamSpec_i, ArgParserModel_p, ParamSource_p
@@ -89,7 +93,7 @@ class CLIParserModel:
     type Sub_Params                                = tuple[SubConstraint, list[ParamSpec_i]]
 
     args_initial       : tuple[str, ...]
-    args_remaining     : list[str]
+    args_remaining     : ArgCursor
     data_cmds          : list[ParseResult_d]
     data_prog          : Maybe[ParseResult_d]
     data_subs          : list[ParseResult_d]
@@ -99,8 +103,13 @@ class CLIParserModel:
     specs_subs         : dict[SubName, list[ParamSpec_i]]
 
     implicits          : dict[str, list]
+    _stubs_cmds        : dict[CmdName, SourceStub]
+    _stubs_subs        : dict[SubName, SourceStub]
     _subs_constraints  : defaultdict[CmdName, set[SubName]]
-    _current_section   : Maybe[tuple[str, list[API.ParamSpec_i]]]
+    _sources           : dict[tuple[SectionType_e, str], Any]
+    _current_section   : Maybe[tuple[str, DispatchTable]]
+    _section_tried     : set[int]
+    _section_pos       : int
     _current_data      : Maybe[ParseResult_d]
     _separator         : ParamSpec_i
     _help              : ParamSpec_i
@@ -108,19 +117,22 @@ class CLIParserModel:
     _report            : Maybe[API.ParseReport_d]
     _section_type      : Maybe[SectionType_e]
     _processor         : ParamProcessor
+    _catalogue         : Maybe[ParamCatalogue]
 
     def __init__(self) -> None:
         self._processor         = ParamSpec._processor
         self._separator         = SEPARATOR
         self._help              = HELP
         self._report            = None
+        self._catalogue         = None
         self._current_section   = None
+        self._section_tried     = set()
+        self._section_pos       = 0
         self._subs_constraints  = defaultdict(set)
         self._force_help        = False
         self._section_type      = None
         self.args_initial       = ()
-        self.args_remaining     = []
-        self.args_remaining     = []
+        self.args_remaining     = ArgCursor()
         self.data_cmds          = []
         self.data_prog          = None
         self.data_subs          = []
@@ -128,6 +140,9 @@ class CLIParserModel:
         self.specs_prog         = []
         self.specs_cmds         = {}
         self.specs_subs         = {}
+        self._stubs_cmds        = {}
+        self._stubs_subs        = {}
+        self._sources           = {}
 
     ##--| conditions
 
@@ -136,7 +151,9 @@ class CLIParserModel:
     def _has_no_specs(self) -> bool:
         return not (bool(self.specs_prog)
                     or bool(self.specs_cmds)
-                    or bool(self.specs_subs))
+                    or bool(self.specs_subs)
+                    or bool(self._stubs_cmds)
+                    or bool(self._stubs_subs))
 
     def _has_help_flag_at_tail(self) -> bool:
         return self._processor.matches_head(self._help,
@@ -151,7 +168,7 @@ class CLIParserModel:
 
     def _cmd_at_front(self) -> bool:
         match self.args_remaining:
-            case [x, *_] if x in self.specs_cmds:
+            case [x, *_] if x in self.specs_cmds or x in self._stubs_cmds:
                 return True
             case _:
                 return False
@@ -161,7 +178,7 @@ class CLIParserModel:
 
     def _sub_at_front(self) -> bool:
         match self.args_remaining:
-            case [x, *_] if x in self.specs_subs:
+            case [x, *_] if x in self.specs_subs or x in self._stubs_subs:
                 return True
             case _:
                 return False
@@ -170,47 +187,31 @@ class CLIParserModel:
         return not bool(self.data_subs) and bool(self.implicits)
 
     def _kwarg_at_front(self) -> bool:
-        """ See if theres a kwarg to parse """
-        params : list
+        """ See if theres an untried kwarg to parse """
+        table : DispatchTable
         if not bool(self.args_remaining):
             return False
         match self._current_section:
             case None:
                 return False
-            case _, [*params]:
+            case _, DispatchTable() as table:
                 pass
 
-        head = self.args_remaining[0]
-        for param in params:
-            match param:
-                case API.PositionalParam_p():
-                    continue
-                case _:
-                    if self._processor.matches_head(param, head):
-                        return True
-        else:
-            return False
+        candidates = table.kwargs_for(self.args_remaining[0], processor=self._processor)
+        return any(i not in self._section_tried for i, _ in candidates)
 
     def _posarg_at_front(self) -> bool:
-        params : list
+        table : DispatchTable
         if not bool(self.args_remaining):
             return False
         match self._current_section:
             case None:
                 return False
-            case _, [*params]:
+            case _, DispatchTable() as table:
                 pass
 
         head = self.args_remaining[0]
-        for param in params:
-            match param:
-                case API.PositionalParam_p():
-                    if self._processor.matches_head(param, head): # type: ignore[arg-type]
-                        return True
-                case _:
-                    continue
-        else:
-            return False
+        return any(self._processor.matches_head(x, head) for x in table.positionals[self._section_pos:])
 
     def _separator_at_front(self) -> bool:
         if not bool(self.args_remaining):
@@ -220,10 +221,10 @@ class CLIParserModel:
 
     ##--| transition actions
     def _insert_implicit_cmd(self) -> None:
-        match [(k,v) for k,v in self.implicits.items() if k in self.specs_cmds]:
+        match [(k,v) for k,v in self.implicits.items() if k in self.specs_cmds or k in self._stubs_cmds]:
             case [(str() as x, list() as ys)]:
                 logging.debug("Inserting implicit cmd: %s", x)
-                self.args_remaining = [*ys, *self.args_remaining]
+                self.args_remaining.insert(ys)
             case []:
                 pass
             case x:
@@ -231,10 +232,10 @@ class CLIParserModel:
                 raise ValueError(msg, x)
 
     def _insert_implicit_sub(self) -> None:
-        match [(k,v) for k,v in self.implicits.items() if k in self.specs_subs]:
+        match [(k,v) for k,v in self.implicits.items() if k in self.specs_subs or k in self._stubs_subs]:
             case [(str() as x, list() as ys)]:
                 logging.debug("Inserting implicit sub: %s", x)
-                self.args_remaining = [*ys, *self.args_remaining]
+                self.args_remaining.insert(ys)
             case []:
                 pass
             case x:
@@ -243,10 +244,13 @@ class CLIParserModel:
 
     ##--| state actions
 
-    def prepare_for_parse(self, *, prog:ParamSource_p, cmds:list, subs:list, raw_args:list[str], implicits:Maybe[dict[str, list[str]]]=None) -> None:
+    def prepare_for_parse(self, *, prog:Maybe[ParamSource_p]=None, cmds:Maybe[list]=None, subs:Maybe[list]=None, raw_args:list[str], implicits:Maybe[dict[str, list[str]]]=None, catalogue:Maybe[ParamCatalogue]=None) -> None:  # noqa: PLR0913
+        """ Get the param specs to parse with, from the sources or a prebuilt catalogue.
+        cmds and subs can be SourceStubs, which are only loaded if they are in the args.
+        """
         logging.debug("Setting up Parsing : %s", raw_args)
-        self.args_initial    = tuple(raw_args[:])
-        self.args_remaining  = raw_args[:]
+        self.args_initial    = tuple(raw_args)
+        self.args_remaining  = ArgCursor(self.args_initial)
         match implicits:
             case None:
                 self.implicits = {}
@@ -257,43 +261,46 @@ class CLIParserModel:
             case x:
                 raise TypeError(type(x))
 
-        self._prep_prog_lookup(prog)
-        self._prep_cmd_lookup(cmds)
-        self._prep_sub_lookup(subs)
+        match catalogue:
+            case None:
+                self._prep_prog_lookup(prog)
+                self._prep_cmd_lookup(cmds if cmds is not None else [])
+                self._prep_sub_lookup(subs)
+            case ParamCatalogue():
+                self._prep_from_catalogue(catalogue)
+            case _:
+                raise TypeError(type(catalogue))
 
     def set_force_help(self) -> None:
         match self._help.consume(self.args_remaining[-1:]):
             case dict(), 1:
                 self._force_help = True
-                self.args_remaining.pop()
+                self.args_remaining.pop_tail()
             case _:
                 pass
 
     def select_prog_spec(self) -> None:
         logging.debug("Setting Prog Spec")
-        self._current_section = ("prog", sorted(self.specs_prog, key=ParamSpec.key_func))
-        self._section_type = SectionType_e.prog
-        self.args_remaining.pop(0)
+        self._select_section("prog", self.specs_prog, SectionType_e.prog)
+        self.args_remaining.pop_head()
 
     def select_cmd_spec(self) -> None:
-        head = self.args_remaining.pop(0)
+        head = self.args_remaining.pop_head()
         logging.debug("Setting Cmd Spec: %s", head)
-        match self.specs_cmds.get(head, None):
+        match self._load_specs(head, self.specs_cmds, self._stubs_cmds):
             case None:
                 msg = "No spec found"
                 raise ValueError(msg, head)
             case [*params]:
-                self._current_section = (head, sorted(params, key=ParamSpec.key_func))
-                self._section_type = SectionType_e.cmd
+                self._select_section(head, params, SectionType_e.cmd)
 
     def select_sub_spec(self) -> None:
         last_cmd     = self.data_cmds[-1].name
         constraints  = self._subs_constraints[last_cmd]
-        match self.args_remaining.pop(0):
+        match self.args_remaining.pop_head():
             case x if x in constraints:
                 logging.debug("Setting Sub Spec: %s", x)
-                self._current_section  = (x, sorted(self.specs_subs[x], key=ParamSpec.key_func))
-                self._section_type     = SectionType_e.sub
+                self._select_section(x, self._load_specs(x, self.specs_subs, self._stubs_subs) or [], SectionType_e.sub)
             case x:
                 msg = "Sub Not Available for cmd"
                 raise ValueError(msg, last_cmd, x)
@@ -304,9 +311,9 @@ class CLIParserModel:
         defaults  : dict
         ##--|
         match self._current_section:
-            case str() as name, list() as params:
+            case str() as name, DispatchTable() as table:
                 logging.debug("Initialising: %s", name)
-                defaults = ParamSpec.build_defaults(params)
+                defaults = ParamSpec.build_defaults(table.params)
             case None:
                 raise ValueError()
         match self._section_type:
@@ -317,50 +324,51 @@ class CLIParserModel:
                 self._current_data  = ParseResult_d(name=name, args=defaults)
 
     def parse_kwarg(self) -> None:
-        """ try each param until one works """
+        """ try each untried param that matches the head, until one works.
+        Each kwarg is only tried once per section.
+        """
         logging.debug("Parsing Kwarg")
-        params : list[API.ParamSpec_i]
+        table : DispatchTable
         assert(self._current_data is not None)
         match self._current_section:
-            case str(), list() as params:
+            case str(), DispatchTable() as table:
                 pass
             case x:
                 raise TypeError(type(x))
 
-        while bool(params):
-            if isinstance(params[0], API.PositionalParam_p):
-                return
-            param = params.pop(0)
+        for i, param in table.kwargs_for(self.args_remaining[0], processor=self._processor):
+            if i in self._section_tried:
+                continue
+            self._section_tried.add(i)
             match param.consume(self.args_remaining):
                 case None:
                     continue
                 case dict() as data, int() as count:
                     self._current_data.args.update(data)
                     self._current_data.non_default.update(data.keys())
-                    self.args_remaining = self.args_remaining[count:]
+                    self.args_remaining.advance(count)
                     return
 
     def parse_posarg(self) -> None:
         logging.debug("Parsing Posarg")
-        params : list[API.ParamSpec_i]
+        table : DispatchTable
         assert(self._current_data is not None)
         match self._current_section:
-            case _, list() as params:
+            case _, DispatchTable() as table:
                 pass
             case x:
                 raise TypeError(type(x))
 
-        while bool(params):
-            param = params.pop(0)
-            if not isinstance(param, API.PositionalParam_p):
-                continue
+        while self._section_pos < len(table.positionals):
+            param = table.positionals[self._section_pos]
+            self._section_pos += 1
             match param.consume(self.args_remaining):
                 case None:
                     continue
                 case dict() as data, int() as count:
                     self._current_data.args.update(data)
                     self._current_data.non_default.update(data.keys())
-                    self.args_remaining = self.args_remaining[count:]
+                    self.args_remaining.advance(count)
                     return
 
     def parse_separator(self) -> None:
@@ -368,11 +376,13 @@ class CLIParserModel:
             case None:
                 pass
             case {}, 1:
-                self.args_remaining = self.args_remaining[1:]
+                self.args_remaining.advance(1)
 
     def clear_section(self) -> None:
         assert(self._current_data)
-        self._current_section = None
+        self._current_section  = None
+        self._section_tried    = set()
+        self._section_pos      = 0
         match self._section_type:
             case None:
                 raise ValueError()
@@ -388,9 +398,13 @@ class CLIParserModel:
     def cleanup(self) -> None:
         logging.debug("Cleaning up")
         self.args_initial    = ()
-        self.args_remaining  = []
+        self.args_remaining  = ArgCursor()
         self.specs_cmds      = {}
         self.specs_subs      = {}
+        self._stubs_cmds     = {}
+        self._stubs_subs     = {}
+        self._sources        = {}
+        self._catalogue      = None
     ##--| Report Generation
 
     def report(self) -> API.ParseReport_d:
@@ -425,35 +439,83 @@ class CLIParserModel:
         return result
 
     ##--| util
-    def _prep_prog_lookup(self, prog:ParamSource_p) -> None:
+    def _select_section(self, name:str, params:list[ParamSpec_i], section:SectionType_e) -> None:
+        """ Start a section, with the dispatch table of its params.
+        Without a catalogue, tables are cached by the source the params came from.
+        """
+        table : DispatchTable
+        match self._catalogue:
+            case None:
+                table = DispatchTable.compile(self._sources.get((section, name), None), params)
+            case ParamCatalogue() as cat:
+                table = cat.table(section, name)
+        self._current_section  = (name, table)
+        self._section_type     = section
+        self._section_tried    = set()
+        self._section_pos      = 0
+
+    def _load_specs(self, name:str, specs:dict[str, list[ParamSpec_i]], stubs:dict[str, SourceStub]) -> Maybe[list[ParamSpec_i]]:
+        """ Get the specs of a cmd or sub, loading its stub if it hasn't been yet """
+        match specs.get(name, None):
+            case None if name in stubs:
+                specs[name] = stubs[name].param_specs()
+                return specs[name]
+            case x:
+                return x
+
+    def _prep_prog_lookup(self, prog:Maybe[ParamSource_p]) -> None:
         match prog:
             case ParamSource_p():
                 # TODO make it so variable amount of prefix can be consumed
                 self.specs_prog_prefix  = [prog.name]
                 self.specs_prog         = prog.param_specs()
+                self._sources[SectionType_e.prog, "prog"] = prog
             case None:
                 pass
             case x:
                 msg = "Prog needs to be a ParamSource_p"
                 raise TypeError(msg, x)
 
+    def _prep_from_catalogue(self, catalogue:ParamCatalogue) -> None:
+        """ Use a catalogue's specs, instead of getting them from each source """
+        self._catalogue  = catalogue
+        self.specs_prog  = catalogue.prog
+        self.specs_cmds  = catalogue.cmds
+        self.specs_subs  = catalogue.subs
+        self._subs_constraints.update(catalogue.constraints)
+        if catalogue.prog_name is not None:
+            self.specs_prog_prefix = [catalogue.prog_name]
+
     def _prep_cmd_lookup(self, cmds:list[ParamSource_p]) -> None:
-        """ get the param specs for each cmd """
+        """ get the param specs for each cmd.
+        SourceStubs are only registered by name, and loaded when selected.
+        """
         if not isinstance(cmds, list):
             msg = "cmds needs to be a list"
             raise TypeError(msg, cmds)
 
         for x in cmds:
             match x:
+                case (str() as alias, SourceStub() as stub):
+                    for name in (alias, *stub.names):
+                        self._stubs_cmds[name] = stub
+                        self._sources[SectionType_e.cmd, name] = stub
+                case SourceStub() as stub:
+                    for name in stub.names:
+                        self._stubs_cmds[name] = stub
+                        self._sources[SectionType_e.cmd, name] = stub
                 case (str() as alias, ParamSource_p() as source):
-                    self.specs_cmds[alias] = source.param_specs()
-                    self.specs_cmds[source.name] = source.param_specs()
+                    specs = source.param_specs()
+                    for name in (alias, source.name):
+                        self.specs_cmds[name] = specs
+                        self._sources[SectionType_e.cmd, name] = source
                 case ParamSource_p() as source:
                     self.specs_cmds[source.name] = source.param_specs()
+                    self._sources[SectionType_e.cmd, source.name] = source
                 case x:
                     raise TypeError(x)
 
-    def _prep_sub_lookup(self, subs:list[ParamSource_p]) -> None:
+    def _prep_sub_lookup(self, subs:Maybe[list]) -> None:
         """ for each sub cmd, get it's param specs, but also register the parent cmd constraint """
         if not isinstance(subs, list):
             logging.info("No Subcmd Specs provided for parsing")
@@ -461,9 +523,17 @@ class CLIParserModel:
 
         for x in subs:
             match x:
+                case [*constraints], SourceStub() as stub:
+                    assert(all(isinstance(c, str) for c in constraints))
+                    for name in stub.names:
+                        self._stubs_subs[name] = stub
+                        self._sources[SectionType_e.sub, name] = stub
+                    for c in constraints:
+                        self._subs_constraints[c].update(stub.names)
                 case [*constraints], ParamSource_p() as source:
                     assert(all(isinstance(c, str) for c in constraints))
                     self.specs_subs[source.name] = source.param_specs()
+                    self._sources[SectionType_e.sub, source.name] = source
                     for c in constraints:
                         self._subs_constraints[c].add(source.name)
                 case x:
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Lightweight stand ins for param sources, which are only imported when needed.
+
+A SourceStub has the name (and aliases) of a cmd or sub,
+and a way to get the real source: a CodeReference, or a callable::
+
+    cmds = [SourceStub("run", "cls::doot.cmds.run_cmd:RunCmd", aliases=["r"]), ...]
+
+CLIParserModel only loads the stubs of cmds and subs that are in the args.
+Stubs are ParamSource_p's themselves,
+so anything that needs every source's specs (eg: printing help) can still ask for them.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import os
+import sys
+from importlib.machinery import PathFinder
+# ##-- end stdlib imports
+
+# ##-- 1st party imports
+from jgdv.structs.strang import CodeReference
+# ##-- end 1st party imports
+
+from ._interface import ParamSource_p
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from ._interface import ParamSpec_i
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    type Loader = CodeReference|Callable[[], ParamSource_p]
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+BadLoaderMsg  : Final[str] = "A SourceStub needs a CodeReference or a callable to load from"
+NotSourceMsg  : Final[str] = "A SourceStub loaded something that isn't a ParamSource_p"
+WrongNameMsg  : Final[str] = "A SourceStub loaded a source with a different name"
+
+# Body:
+
+class SourceStub:
+    """ A named, not yet loaded, ParamSource_p.
+
+    The loader is a CodeReference (or a str of one), or a callable.
+    What it gives is instantiated if it's a class,
+    used as the source if it is a ParamSource_p,
+    otherwise it's called (eg: a factory) to build the source.
+    The loaded source is kept.
+    """
+    __slots__ = ("_loader", "_source", "aliases", "name")
+    name     : str
+    aliases  : tuple[str, ...]
+    _loader  : Loader
+    _source  : Maybe[ParamSource_p]
+
+    def __init__(self, name:str, loader:str|Loader, *, aliases:Iterable[str]=()) -> None:
+        self.name     = name
+        self.aliases  = tuple(aliases)
+        self._source  = None
+        match loader:
+            case CodeReference():
+                self._loader = loader
+            case str():
+                self._loader = CodeReference(loader)
+            case x if callable(x):
+                self._loader = x
+            case x:
+                raise TypeError(BadLoaderMsg, x)
+
+    @override
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "stub"
+        return f"<{self.__class__.__name__}: {self.name} ({state})>"
+
+    @property
+    def loaded(self) -> bool:
+        return self._source is not None
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return (self.name, *self.aliases)
+
+    @property
+    def param_fingerprint(self) -> tuple:
+        """ Identify the source for ParamCatalogue, without loading it.
+        Uses the aliases, and the file the loader is defined in.
+        A CodeReference's module is found without importing it, or its parents.
+        """
+        match self._loader:
+            case CodeReference() as ref:
+                return self.aliases, str(ref), file_stat(module_file(ref.module))
+            case x:
+                mod = sys.modules.get(getattr(x, "__module__", ""), None)
+                return self.aliases, getattr(x, "__module__", None), getattr(x, "__qualname__", None), file_stat(getattr(mod, "__file__", None))
+
+    def load(self) -> ParamSource_p:
+        """ Import or build the real source, if it hasn't been already """
+        loaded  : type|ParamSource_p|Callable
+        source  : Any
+        if self._source is not None:
+            return self._source
+
+        logging.debug("Loading Source: %s", self.name)
+        match self._loader:
+            case CodeReference() as ref:
+                loaded = ref(raise_error=True)
+            case loader:
+                loaded = loader()
+
+        match loaded:
+            case type() as cls:
+                source = cls()
+            case ParamSource_p() as built:
+                source = built
+            case x if callable(x):
+                source = x()
+            case x:
+                raise TypeError(NotSourceMsg, self.name, x)
+
+        match source:
+            case ParamSource_p() if source.name != self.name:
+                raise ValueError(WrongNameMsg, self.name, source.name)
+            case ParamSource_p():
+                self._source = source
+                return source
+            case x:
+                raise TypeError(NotSourceMsg, self.name, x)
+
+    def param_specs(self) -> list[ParamSpec_i]:
+        return self.load().param_specs()
+
+##--| utils
+
+def module_file(name:str) -> Maybe[str]:
+    """ Find the file of a module without importing it.
+
+    Uses already imported modules, otherwise searches each package's path in turn,
+    as importlib.util.find_spec would import the parent packages to get them.
+    Returns None if the module can't be found, or has no file.
+    """
+    found  : Maybe[str]            = None
+    path   : Maybe[Sequence[str]]  = None
+    parts  : list[str]             = name.split(".")
+    for i in range(1, len(parts) + 1):
+        if i > 1 and path is None:
+            return None
+        prefix = ".".join(parts[:i])
+        match sys.modules.get(prefix, None):
+            case None:
+                try:
+                    spec = PathFinder.find_spec(prefix, path)
+                except (ImportError, ValueError):
+                    spec = None
+                if spec is None:
+                    return None
+                found, path = spec.origin, spec.submodule_search_locations
+            case mod:
+                found, path = getattr(mod, "__file__", None), getattr(mod, "__path__", None)
+    else:
+        return found
+
+def file_stat(path:Maybe[str], files:Maybe[dict[str, Any]]=None) -> Maybe[tuple[int, int]]:
+    """ The mtime and size of a file, memoized in files if given """
+    if path is None:
+        return None
+    result : Maybe[tuple[int, int]]
+    if files is not None and path in files:
+        return cast("Maybe[tuple[int, int]]", files[path])
+    try:
+        stat = os.stat(path)  # noqa: PTH116
+    except OSError:
+        result = None
+    else:
+        result = (stat.st_mtime_ns, stat.st_size)
+
+    if files is not None:
+        files[path] = result
+    return result
@@ -39,8 +39,8 @@ __all__ = (
 
 
 from .errors import GuardedAccessError
-from ._interface import TomlTypes
-from .chainguard import ChainGuard
+from ._interface import TomlTypes, MergePolicy_e
+from .chainguard import ChainGuard, FrozenChainGuard
 
 load        = ChainGuard.load # type: ignore[attr-defined]
 load_dir    = ChainGuard.load_dir # type: ignore[attr-defined]
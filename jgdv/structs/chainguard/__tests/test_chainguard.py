@@ -17,6 +17,7 @@ import pytest
 from ..errors import GuardedAccessError
 from .. import ChainGuard
 from ..proxies.base import GuardProxy
+from jgdv.testing.benchmark import Benchmark
 
 logging = logmod.root
 example_dict : Final[dict] = {
@@ -98,6 +99,11 @@ class TestBaseGuard_Access:
         with pytest.raises(GuardedAccessError):
             basic['non_existing']
 
+    def test_item_access_list_error(self):
+        basic = ChainGuard({"test": {"blah": 2}})
+        with pytest.raises(TypeError):
+            basic[["test", "blah"]]
+
     def test_dot_access(self):
         basic = ChainGuard({"test": "blah"})
         assert(basic.test == "blah")
@@ -185,6 +191,75 @@ class TestBaseGuard_Info:
         basic = ChainGuard({"test": {"blah": [1,2,3]}, "bloo": ["a","b","c"]})
         assert("doesntexist" not in basic.test)
 
+class TestBaseGuard_ChildCache:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_child_cached(self):
+        basic = ChainGuard({"test": {"blah": {"bloo": 2}}})
+        assert(basic.test is basic.test)
+        assert(basic.test.blah is basic['test'].blah)
+
+    def test_child_wraps_source(self):
+        data  = {"test": {"blah": 2}}
+        basic = ChainGuard(data)
+        assert(basic._table() is data)
+        assert(basic.test._table() is data['test'])
+
+    def test_dash_key_cached(self):
+        basic = ChainGuard({"a-key": {"blah": 2}})
+        assert(basic.a_key is basic.a_key)
+        assert(basic.a_key.blah == 2)
+
+    def test_multi_key_cached(self):
+        basic = ChainGuard({"test": {"blah": {"bloo": 2}}})
+        assert(basic['test', 'blah'] is basic['test', 'blah'])
+        assert(basic['test', 'blah']._index() == (*ROOT_INDEX, "test", "blah"))
+
+    def test_changed_source_rebuilds(self):
+        data  = {"test": {"blah": 2}}
+        basic = ChainGuard(data)
+        first = basic.test
+        data['test'] = {"blah": 3}
+        assert(basic.test is not first)
+        assert(basic.test.blah == 3)
+
+    def test_list_of_tables_cached(self):
+        basic  = ChainGuard({"test": [{"blah": 1}, {"blah": 2}]})
+        first  = basic.test
+        second = basic.test
+        assert(first is not second)
+        assert(all(x is y for x,y in zip(first, second, strict=True)))
+        assert([x.blah for x in second] == [1, 2])
+
+    def test_list_of_tables_returned_list_is_a_copy(self):
+        basic = ChainGuard({"test": [{"blah": 1}, {"blah": 2}]})
+        basic.test.pop()
+        assert(len(basic.test) == 2)
+
+    def test_changed_list_rebuilds(self):
+        data  = {"test": [{"blah": 1}]}
+        basic = ChainGuard(data)
+        assert(len(basic.test) == 1)
+        data['test'].append({"blah": 2})
+        assert([x.blah for x in basic.test] == [1, 2])
+
+    def test_lazy_index(self):
+        basic = ChainGuard({"test": {"blah": {"bloo": 2}}})
+        assert(basic.test.blah._index() == (*ROOT_INDEX, "test", "blah"))
+
+    def test_list_of_tables_index(self):
+        basic = ChainGuard({"test": [{"blah": 1}]})
+        assert(basic.test[0]._index() == (*ROOT_INDEX, "test"))
+
+    def test_error_message_index(self):
+        basic = ChainGuard({"test": {"blah": {"bloo": 2}}})
+        with pytest.raises(GuardedAccessError) as ctx:
+            basic.test.blah.aweg
+
+        assert("<root>.test.blah.aweg not found" in ctx.value.args[0])
+
 class TestLoaderGuard:
 
     def test_sanity(self):
@@ -303,3 +378,19 @@ class TestProxyFailAccess:
                 assert(True)
             case x:
                 assert(False), x
+
+@pytest.mark.benchmark
+class TestChainGuard_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_chained_reads(self):
+        """ 1M attribute reads, as 250k chains of 4 hops """
+        basic = ChainGuard({"a": {"b": {"c": {"d": 5}}}})
+        count = 250_000
+        with Benchmark("ChainGuard chained reads", count=count * 4) as bench:
+            with bench.case("reads"):
+                for _ in range(count):
+                    assert(basic.a.b.c.d == 5)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+import pickle
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from jgdv.structs.chainguard import ChainGuard, FrozenChainGuard
+from jgdv.structs.chainguard.frozen import FrozenTable, freeze
+from jgdv.structs.dkey import DKey
+
+logging = logmod.root
+
+@pytest.fixture(scope="function")
+def data() -> dict:
+    return {"a": {"b": [1, 2], "c": {"d": "blah"}}, "tasks": [{"name": "x"}, {"name": "y"}], "tags": {"e", "f"}}
+
+##--|
+
+class TestFreeze:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_tables(self, data):
+        result = freeze(data)
+        assert(isinstance(result, FrozenTable))
+        assert(isinstance(result["a"], FrozenTable))
+        assert(isinstance(result["a"]["c"], FrozenTable))
+
+    def test_lists(self, data):
+        result = freeze(data)
+        assert(result["a"]["b"] == (1, 2))
+        assert(all(isinstance(x, FrozenTable) for x in result["tasks"]))
+
+    def test_sets(self, data):
+        assert(freeze(data)["tags"] == frozenset({"e", "f"}))
+
+    def test_frozen_unchanged(self, data):
+        result = freeze(data)
+        assert(freeze(result) is result)
+
+    def test_guard(self, data):
+        assert(freeze(ChainGuard(data)) == freeze(data))
+
+    def test_source_unmodified(self, data):
+        freeze(data)
+        assert(isinstance(data["a"]["b"], list))
+
+class TestFrozenTable:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        table = freeze({"a": 1})
+        assert(table["a"] == 1)
+        assert(dict(table) == {"a": 1})
+
+    def test_immutable(self):
+        table = freeze({"a": 1})
+        with pytest.raises(TypeError):
+            table["a"] = 2 # type: ignore[index]
+        with pytest.raises(TypeError):
+            del table["a"]
+        with pytest.raises(TypeError):
+            table.update({"b": 2})
+        with pytest.raises(TypeError):
+            table |= {"b": 2}
+
+        assert(table == {"a": 1})
+
+    def test_hash(self, data):
+        assert(hash(freeze(data)) == hash(freeze(data)))
+        assert(hash(FrozenTable({"a": 1, "b": 2})) == hash(FrozenTable({"b": 2, "a": 1})))
+
+    def test_hash_cached(self, data):
+        table = freeze(data)
+        assert(not hasattr(table, "_hash"))
+        hash(table)
+        assert(hasattr(table, "_hash"))
+
+    def test_eq(self, data):
+        assert(freeze(data) == freeze(data))
+        assert(FrozenTable({"a": 1}) != FrozenTable({"a": 2}))
+        assert(FrozenTable({"a": 1}) == {"a": 1})
+
+    def test_pickle(self, data):
+        table   = freeze(data)
+        hash(table)
+        result  = pickle.loads(pickle.dumps(table))
+        assert(isinstance(result["a"], FrozenTable))
+        assert(not hasattr(result, "_hash"))
+        assert(result == table)
+
+class TestFrozenChainGuard:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self, data):
+        guard = FrozenChainGuard(data)
+        assert(isinstance(guard, ChainGuard))
+        assert(guard.a.c.d == "blah")
+
+    def test_freeze(self, data):
+        guard   = ChainGuard(data)
+        frozen  = guard.freeze()
+        assert(isinstance(frozen, FrozenChainGuard))
+        assert(frozen.freeze() is frozen)
+
+    def test_children_frozen(self, data):
+        guard = FrozenChainGuard(data)
+        assert(isinstance(guard.a, FrozenChainGuard))
+        assert(guard.a.b == (1, 2))
+        assert([x.name for x in guard.tasks] == ["x", "y"])
+        assert(all(isinstance(x, FrozenChainGuard) for x in guard.tasks))
+
+    def test_child_index(self, data):
+        assert(ChainGuard(data).a.freeze()._index() == ("<root>", "a"))
+
+    def test_not_mutable(self, data):
+        with pytest.raises(TypeError):
+            FrozenChainGuard(data, mutable=True)
+
+    def test_hashable(self, data):
+        first, second = FrozenChainGuard(data), ChainGuard(data).freeze()
+        assert(hash(first) == hash(second))
+        assert(first == second)
+        cache = {first: "cached"}
+        assert(cache[second] == "cached")
+        assert(hash(first.a) == hash(second.a))
+
+    def test_hash_differs(self, data):
+        other = data | {"extra": 1}
+        assert(hash(FrozenChainGuard(data)) != hash(FrozenChainGuard(other)))
+
+    def test_pickle(self, data):
+        guard   = FrozenChainGuard(data)
+        result  = pickle.loads(pickle.dumps(guard.a))
+        assert(isinstance(result, FrozenChainGuard))
+        assert(result == guard.a)
+        assert(result._index() == ("<root>", "a"))
+        assert(result.c.d == "blah")
+
+    def test_on_fail(self, data):
+        guard = FrozenChainGuard(data)
+        assert(guard.on_fail(5).a.blah() == 5)
+        assert(guard.on_fail(5).a.c.d() == "blah")
+
+    def test_compiled_path(self, data):
+        guard = FrozenChainGuard(data)
+        assert(ChainGuard.compile_path("tasks.1.name")(guard) == "y")
+        assert(ChainGuard.compile_path("a.b")(guard) == (1, 2))
+
+    def test_merge(self, data):
+        merged = FrozenChainGuard.merge(FrozenChainGuard(data), {"other": [1]})
+        assert(isinstance(merged, FrozenChainGuard))
+        assert(merged.other == (1,))
+        assert(isinstance(hash(merged), int))
+
+    def test_dkey_source(self, data):
+        guard = FrozenChainGuard({"a_key": "blah"})
+        assert(guard.exp_frozen_h())
+        assert(guard.exp_version_h() == guard.exp_version_h())
+        assert(DKey("a_key", implicit=True).expand(guard) == "blah")
+
+    def test_versions_unique(self, data):
+        first, second = FrozenChainGuard(data), FrozenChainGuard(data)
+        assert(hash(first) == hash(second))
+        assert(first.exp_version_h() != second.exp_version_h())
+        assert(pickle.loads(pickle.dumps(first)).exp_version_h() != first.exp_version_h())
+
+@pytest.mark.benchmark
+class TestFrozenChainGuard_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_pickle(self):
+        """ Pickling a config of ~10k values 10 times,
+        compared to a ChainGuard that has been read from (so has cached children)
+        """
+        data   = {f"section_{i}": {f"key_{j}": {"val": j, "list": [i, j]} for j in range(100)} for i in range(100)}
+        guard  = ChainGuard(data)
+        for section in guard:
+            for key in guard[section]:
+                guard[section][key]
+        with Benchmark("Freezing and pickling x10") as bench:
+            with bench.case("freeze"):
+                frozen = guard.freeze()
+                hash(frozen)
+
+            with bench.case("guard"):
+                for _ in range(10):
+                    pickle.loads(pickle.dumps(guard))
+
+            with bench.case("frozen"):
+                for _ in range(10):
+                    pickle.loads(pickle.dumps(frozen))
+
+            with bench.case("hash x100k"):
+                for _ in range(100_000):
+                    hash(frozen)
+
+            bench.note(guard_bytes=len(pickle.dumps(guard)), frozen_bytes=len(pickle.dumps(frozen)))
@@ -61,6 +61,8 @@ type InputData           = dict
 TABLE_K    : Final[str]  = "__table"
 INDEX_K    : Final[str]  = "__index"
 MUTABLE_K  : Final[str]  = "__mutable"
+PARENT_K   : Final[str]  = "__parent"
+CHILDREN_K : Final[str]  = "__children"
 ROOT_STR   : Final[str]  = "<root>"
 USCORE     : Final[str]  = "_"
 DASH       : Final[str]  = "-"
@@ -78,6 +80,10 @@ class GuardBase(dict):
 
     while it can then report missing paths:
     data.report_defaulted() -> ['a.path.that.may.exist.<str|int>']
+
+    Guards wrap the source data without copying it.
+    Child guards are cached on their parent, by the keys used to access them,
+    and only build their index from their parent when it is needed.
     """
 
     def __init__(self, data:Maybe[InputData]=None, *, index:Maybe[Iterable[int|str]]=None, mutable:bool=False) -> None:
@@ -85,11 +91,13 @@ class GuardBase(dict):
         super_set(self, TABLE_K, data or {})
         super_set(self, INDEX_K, tuple(index or [ROOT_STR]))
         super_set(self, MUTABLE_K, mutable)
+        super_set(self, PARENT_K, None)
+        super_set(self, CHILDREN_K, None)
 
     @override
     def __repr__(self) -> str:
         match self._table():
-            case dict() as d:
+            case collections.abc.Mapping() as d:
                 return f"<{self.__class__.__name__}:{list(d.keys())}>"
             case d:
                 return f"<{self.__class__.__name__}:{d}>"
@@ -140,20 +148,69 @@ class GuardBase(dict):
 
     @override
     def __getitem__(self, keys:int|str|list[str]|tuple[int|str, ...]) -> Any:
-        table    : dict
-        curr     : dict
+        table     : dict
+        curr      : Any
+        found     : Maybe[str]  = None
+        children  : Maybe[dict] = super_get(self, CHILDREN_K)
         ##--|
         match keys:
-            case tuple():
+            case list() as x:
+                raise TypeError(type(x))
+            case _:
                 pass
-            case int()|str():
-                keys = (keys, )
+
+        table = super_get(self, TABLE_K)
+        if children is not None and keys in children:
+            # Fast path, for an unchanged table
+            found, source, child = children[keys]
+            if found is not None and table.get(found, None) is source:
+                return child
+
+        found, curr = self._lookup(table, keys)
+        return self._guard_value(keys, curr, found=found)
+
+    @override
+    def get(self, key:str, default:Maybe=None) -> Maybe:
+        if key in self:
+            return self.__getitem__(key)
+
+        return default
+    ##--|
+    def _lookup(self, table:dict, keys:int|str|tuple[int|str, ...]) -> tuple[Maybe[str], Any]:
+        """ Get the data for keys, and the key found if it is directly in the table """
+        match keys:
+            case str() if keys in table:
+                return keys, table[keys]
+            case str() if (alt:=keys.replace(USCORE, DASH)) in table:
+                return alt, table[alt]
+            case str() | int():
+                return None, self._walk(table, (keys,))
+            case tuple():
+                return None, self._walk(table, keys)
             case x:
                 raise TypeError(type(x))
 
+    def _guard_value(self, keys:int|str|tuple[int|str, ...], value:Any, *, found:Maybe[str]=None) -> Any:  # noqa: ANN401
+        """ Wrap mappings, and lists of mappings, in child guards.
+        Other values are returned as is.
+        """
+        match value:
+            case collections.abc.Mapping():
+                # a dict, or eg: a LayeredTable from a merge
+                return self._child(keys, value, found=found)
+            case [*xs] if all(isinstance(x, collections.abc.Mapping) for x in xs):
+                return self._child(keys, value)
+            case tuple():
+                # eg: from a FrozenChainGuard
+                return value
+            case [*xs]:
+                return xs
+            case x:
+                return x
 
-        table  = self._table()
-        curr   = table
+    def _walk(self, table:dict, keys:tuple[int|str, ...]) -> Any:  # noqa: ANN401
+        """ Walk the data for a sequence of keys """
+        curr : Any = table
         for k in keys:
             match k:
                 case str() if k in curr:
@@ -168,40 +225,69 @@ class GuardBase(dict):
                 case int() if k < len(curr):
                     pass
                 case int():
-                    raise GuardedAcccessError("tried to access a list of wrong length")
+                    msg = "tried to access a list of wrong length"
+                    raise GuardedAccessError(msg)
 
-            match curr.get(k, None):
-                case dict() as result:
-                    curr = result
-                case result:
-                    curr = result
+            curr = curr.get(k, None)
         else:
-            match curr:
-                case dict():
-                    return type(self)(curr, index=self._index(keys))
-                case [*xs] if all(isinstance(x, dict) for x in xs):
-                    index = self._index(keys)
-                    return [type(self)(x, index=index) for x in xs]
-                case [*xs]:
-                    return xs
-                case x:
-                    return x
+            return curr
+
+    def _child(self, keys:int|str|tuple[int|str, ...], data:Mapping|Sequence[Mapping], *, found:Maybe[str]=None) -> Self|list[Self]:
+        """ Get the cached child guard(s) for data accessed by keys,
+        building them if the data has changed since they were cached.
+        Entries are (key found in the table, source data, guard(s)).
+        A Found key allows __getitem__ to skip straight to the cached guard.
+        """
+        children : Maybe[dict] = super_get(self, CHILDREN_K)
+        if children is None:
+            children = {}
+            super_set(self, CHILDREN_K, children)
+
+        match children.get(keys, None), data:
+            case [_, source, GuardBase() as child], collections.abc.Mapping() if source is data:
+                return cast("Self", child)
+            case [_, source, [*guards]], list() | tuple() if (source is data
+                                                    and len(guards) == len(data)
+                                                    and all(x._table() is y for x,y in zip(guards, data, strict=True))):
+                return guards[:]
+            case _, collections.abc.Mapping():
+                child = self._make_child(keys, data)
+                children[keys] = (found, data, child)
+                return child
+            case _, list() | tuple():
+                guards = [self._make_child(keys, x) for x in data]
+                children[keys] = (None, data, guards)
+                return guards[:]
+            case x:
+                raise TypeError(type(x))
 
-    @override
-    def get(self, key:str, default:Maybe=None) -> Maybe:
-        if key in self:
-            return self.__getitem__(key)
+    def _make_child(self, keys:int|str|tuple[int|str, ...], data:Mapping) -> Self:
+        # data can be a non-dict mapping, eg: a LayeredTable from a merge
+        child = type(self)(cast("dict", data))
+        super_set(child, INDEX_K, None)
+        super_set(child, PARENT_K, (self, keys))
+        return child
 
-        return default
-    ##--|
     def _index(self, sub:Maybe[int|str|tuple[int|str, ...]]=None) -> tuple[int|str, ...]:
+        index : Maybe[tuple[int|str, ...]] = super_get(self, INDEX_K)
+        if index is None:
+            # Built lazily from the parent
+            match super_get(self, PARENT_K):
+                case [parent, tuple() as keys]:
+                    index = (*parent._index(), *keys)
+                case [parent, keys]:
+                    index = (*parent._index(), keys)
+                case x:
+                    raise TypeError(type(x))
+            super_set(self, INDEX_K, index)
+
         match sub:
             case None:
-                return super_get(self, INDEX_K)[:]
+                return index
             case int()|str() as x:
-                return (*super_get(self, INDEX_K), x)
+                return (*index, x)
             case [*xs]:
-                return (*super_get(self, INDEX_K), *xs)
+                return (*index, *xs)
             case x:
                 raise TypeError(type(x))
 
@@ -216,7 +302,7 @@ class GuardBase(dict):
     @override
     def items(self) -> ItemsView: # type: ignore[override]
         match super_get(self, TABLE_K):
-            case dict() as val:
+            case collections.abc.Mapping() as val:
                 return val.items()
             case list() as val:
                 return {self._index()[-1]: val}.items()
@@ -229,7 +315,7 @@ class GuardBase(dict):
     @override
     def values(self) -> list|ValuesView: # type: ignore[override]
         match super_get(self, TABLE_K):
-            case dict() as val:
+            case collections.abc.Mapping() as val:
                 return val.values()
             case list() as val:
                 return val
@@ -14,13 +14,13 @@ import logging as logmod
 import re
 import time
 import collections
-import contextlib
 import hashlib
 from copy import deepcopy
 from uuid import UUID, uuid1
 from weakref import ref
 import atexit # for @atexit.register
 import faulthandler
+import typing
 # ##-- end stdlib imports
 
 from jgdv._abstract.protocols.stdlib import Mapping_p
@@ -37,6 +37,7 @@ from typing import Protocol, runtime_checkable
 from typing import no_type_check, final, override, overload
 
 if TYPE_CHECKING:
+    import contextlib
     import pathlib as pl
     from jgdv import Maybe
     from typing import Final
@@ -58,8 +59,34 @@ logging = logmod.getLogger(__name__)
 # Vars:
 type TomlTypes = (str | int | float | bool | list[TomlTypes] | dict[str,TomlTypes] | datetime.datetime)
 type ProxyWrapper[T] = Callable[[*Any], T]
+
+DEFAULT_TOML_CACHE_MAX  : Final[int]  = 512
+DEFAULT_LOAD_WORKERS    : Final[int]  = 8
 # Body:
 
+class MergePolicy_e(enum.StrEnum):
+    """ How ChainGuard.merge handles a key in more than one layer,
+    when the values aren't all tables (which are merged recursively)
+    """
+    error   = enum.auto()
+    first   = enum.auto()
+    last    = enum.auto()
+    append  = enum.auto()
+
+class TomlCacheInfo_d(typing.NamedTuple):
+    """ Statistics of the parsed toml file cache, in the style of functools' CacheInfo """
+    hits     : int
+    misses   : int
+    maxsize  : int
+    currsize : int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
 class ChainProxy_p[T](Protocol):
     """ The proxy interface
 
@@ -79,6 +106,9 @@ class ProxyEntry_p(Protocol):
 
     def on_fail[T](self, fallback:Maybe[T]=None, types:Maybe[type[T]]=None, *, non_root:bool=False) -> ChainProxy_p[T]: ...
 
+    @staticmethod
+    def compile_path(path:str|Iterable[str|int], fallback:Maybe[Any|tuple]=(), types:Maybe[type]=None) -> Callable[[ChainGuard_p], Any]: ...
+
     def first_of[T](self, fallback:Maybe[T]=None, types:Maybe[type[T]]=None) -> ChainProxy_p[T]: ...
 
     def all_of[T](self, fallback:Maybe[T]=None, types:Maybe[type[T]]=None) -> ChainProxy_p[T]: ...
@@ -101,18 +131,29 @@ class ChainGuard_p(ProxyEntry_p, Mapping_p, Protocol):
     def from_dict(cls, data:dict) -> Self: ...
 
     @classmethod
-    def load(cls, *paths:str|pl.Path) -> Self: ...
+    def load(cls, *paths:str|pl.Path, workers:int=...) -> Self: ...
 
     @classmethod
-    def load_dir(cls, dirp:str|pl.Path) -> Self: ...
+    def load_dir(cls, dirp:str|pl.Path, workers:int=...) -> Self: ...
+
+    @staticmethod
+    def load_cache_info() -> TomlCacheInfo_d: ...
+
+    @staticmethod
+    def load_cache_clear() -> None: ...
 
     @staticmethod
     def report_defaulted() -> list[str]: ...
 
+    @staticmethod
+    def collect_defaulted(*, maxsize:Maybe[int]=..., propagate:bool=True) -> contextlib.AbstractContextManager: ...
+
     def __init__(self, data:Maybe=None, *, index:Maybe[list[str]]=None, mutable:bool=False) -> None: ...
 
     def to_file(self, path:pl.Path) -> None: ...
 
+    def freeze(self) -> ChainGuard_p: ...
+
     def _table(self) -> dict[str,Any]: ...
 
     def _index(self) -> list[str]: ...
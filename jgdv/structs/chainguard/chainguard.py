@@ -12,7 +12,6 @@ import functools as ftz
 import itertools as itz
 import logging as logmod
 import pathlib as pl
-from collections import ChainMap
 from copy import deepcopy
 from dataclasses import InitVar, dataclass, field
 from re import Pattern
@@ -25,8 +24,11 @@ import tomllib
 from jgdv import Proto, Mixin
 
 from ._base import GuardBase
+from ._interface import MergePolicy_e
+from .merge import LayeredTable, check_conflicts
+from .frozen import FrozenTable, freeze
 from .errors import GuardedAccessError
-from .mixins.access_m import TomlAccess_m
+from .mixins.access_m import TomlAccess_m, super_get, super_set
 from .mixins.loader_m import TomlLoader_m
 from .mixins.proxy_m import GuardProxyEntry_m
 from .mixins.reporter_m import DefaultedReporter_m
@@ -64,6 +66,7 @@ if TYPE_CHECKING:
 logging = logmod.getLogger(__name__)
 ##-- end logging
 
+VERSION_K : Final[str] = "__version"
 ##--|
 
 @Proto(ChainGuard_p)
@@ -76,28 +79,56 @@ class ChainGuard(GuardProxyEntry_m, GuardBase):
 
     """
     @classmethod
-    def merge(cls, *guards:Self, dfs:Maybe[Callable]=None, index:Maybe[str]=None, shadow:bool=False) -> Self:  # noqa: ARG003
+    def merge(cls, *guards:Self|dict, dfs:Maybe[Callable]=None, index:Maybe[str]=None, shadow:bool=False, policy:Maybe[str|MergePolicy_e]=None) -> Self:  # noqa: ARG003
         """
-        Given an ordered list of guards and dicts, convert them to dicts,
-        update an empty dict with each,
-        then wrap that combined dict in a ChainGuard
+        Given an ordered list of guards and dicts,
+        deep merge them into a ChainGuard of a lazy LayeredTable view.
+        Nothing is copied: values only in one guard are shared,
+        and tables in several guards are merged when they are accessed.
 
         *NOTE*: classmethod, not instance. search order is same as arg order.
-        So merge(a, b, c) will retrive from c only if a, then b, don't have the key
+        So merge(a, b, c, shadow=True) will retrive from c only if a, then b, don't have the key
 
-        # TODO if given a dfs callable, use it to merge more intelligently
+        Policy controls conflicting non-table values, see MergePolicy_e.
+        By default, conflicts are an error, or with shadow=True, the first guard wins.
+        A key which is a table in every guard is not a conflict, its tables are merged.
+        (Previously, any key in more than one guard raised a 'Key Conflict' KeyError)
+        Error and append policies are checked for conflicts immediately.
+
+        If given a dfs callable, it is called with the underlying tables,
+        and is responsible for merging them (and raising on conflicts).
+        eg: ChainGuard.merge(a, b, dfs=merge_tables)
         """
-        curr_keys : set = set()
-        # Check for conflicts:
-        for data in guards:
-            new_keys = set(data.keys())
-            if bool(curr_keys & new_keys) and not shadow:
-                msg = "Key Conflict:"
-                raise KeyError(msg, curr_keys & new_keys)
-            curr_keys |= new_keys
-
-        # Build a TG from a chainmap
-        return ChainGuard.from_dict(ChainMap(*(dict(x) for x in guards))) # type: ignore[attr-defined]
+        resolved  : MergePolicy_e
+        tables    : list[dict]
+        ##--|
+        tables = [x._table() if isinstance(x, GuardBase) else x for x in guards]
+        if dfs is not None:
+            return cast("Self", cls.from_dict(dfs(*tables))) # type: ignore[attr-defined]
+
+        match policy:
+            case None if shadow:
+                resolved = MergePolicy_e.first
+            case None:
+                resolved = MergePolicy_e.error
+            case x:
+                resolved = MergePolicy_e(x)
+
+        try:
+            check_conflicts(tables, policy=resolved)
+        except KeyError as err:
+            msg = "Key Conflict:"
+            raise KeyError(msg, *err.args[1:]) from err
+
+        match tables:
+            case [table]:
+                return cast("Self", cls.from_dict(table)) # type: ignore[attr-defined]
+            case _:
+                return cast("Self", cls.from_dict(LayeredTable(tables, policy=resolved))) # type: ignore[attr-defined]
+
+    def freeze(self) -> FrozenChainGuard:
+        """ Get an immutable, hashable and picklable copy of this guard """
+        return FrozenChainGuard(self._table(), index=self._index())
 
     def remove_prefix(self, prefix:str) -> ChainGuard:
         """ Try to remove a prefix from loaded data
@@ -118,4 +149,44 @@ class ChainGuard(GuardProxyEntry_m, GuardBase):
                 except GuardedAccessError:
                     return self
 
+class FrozenChainGuard(ChainGuard):
+    """ An Immutable ChainGuard.
+
+    Its data is converted once, with tables as FrozenTables and lists as tuples,
+    so it can be hashed (structurally, and cached), used as a cache key,
+    and pickled cheaply.
+
+    As a DKey expansion source, it declares itself frozen.
+    Its version is a counter, unique to the instance,
+    as distinct tables can have the same hash.
+    """
+    _versions : ClassVar[Iterator[int]] = itz.count()
+
+    def __init__(self, data:Maybe[dict|Mapping]=None, *, index:Maybe[Iterable[int|str]]=None, mutable:bool=False) -> None:
+        if mutable:
+            msg = "A FrozenChainGuard can't be mutable"
+            raise TypeError(msg)
+        super().__init__(freeze(data or {}), index=index)
+        super_set(self, VERSION_K, next(FrozenChainGuard._versions))
+
+    @override
+    def __hash__(self) -> int: # type: ignore[override]
+        return hash(self._table())
+
+    @override
+    def __reduce__(self) -> tuple:
+        return (type(self)._restore, (self._table(), self._index()))
+
+    @classmethod
+    def _restore(cls, table:FrozenTable, index:tuple[int|str, ...]) -> Self:
+        return cls(table, index=index)
+
+    @override
+    def freeze(self) -> Self:
+        return self
+
+    def exp_frozen_h(self) -> bool:
+        return True
 
+    def exp_version_h(self) -> Hashable:
+        return cast("int", super_get(self, VERSION_K))
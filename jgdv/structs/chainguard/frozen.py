@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Immutable, hashable data for FrozenChainGuard.
+
+freeze converts nested data once:
+tables become FrozenTables, lists become tuples, and sets become frozensets.
+FrozenTables cache their hash, and pickle without being converted again.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import collections.abc
+import logging as logmod
+# ##-- end stdlib imports
+
+from ._base import GuardBase
+
+# ##-- types
+# isort: off
+import abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Body
+
+class FrozenTable(dict):
+    """ An Immutable table, with a cached structural hash.
+    Build with freeze, which converts its values.
+
+    A dict subclass, so unpickling is just a call to the dict constructor,
+    and works anywhere a table is expected.
+    Hashes aren't pickled, as str hashes differ between processes.
+    """
+    __slots__ = ("_hash",)
+    _hash : int
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}:{list(self)}>"
+
+    @override
+    def __hash__(self) -> int: # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    @override
+    def __reduce__(self) -> tuple:
+        return (type(self), (dict(self),))
+
+    def _immutable(self, *args:Any, **kwargs:Any) -> Never:  # noqa: ANN401, ARG002
+        msg = "FrozenTables are immutable"
+        raise TypeError(msg)
+
+    __setitem__  = _immutable
+    __delitem__  = _immutable
+    __ior__      = _immutable # type: ignore[assignment]
+    clear        = _immutable
+    pop          = _immutable
+    popitem      = _immutable
+    setdefault   = _immutable
+    update       = _immutable
+
+def freeze(value:Any) -> Any:  # noqa: ANN401
+    """ Convert a value to an immutable equivalent, recursively """
+    match value:
+        case FrozenTable():
+            return value
+        case GuardBase():
+            return freeze(value._table())
+        case collections.abc.Mapping():
+            return FrozenTable({k: freeze(v) for k, v in value.items()})
+        case list() | tuple():
+            return tuple(freeze(x) for x in value)
+        case set() | frozenset():
+            return frozenset(freeze(x) for x in value)
+        case _:
+            return value
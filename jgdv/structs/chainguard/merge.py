@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Deep merging of ChainGuard data, without copying it.
+
+Merged data is a LayeredTable, a read-only view over the tables being merged::
+
+    merged = LayeredTable([defaults, user, project], policy=MergePolicy_e.last)
+    merged['a']     # from whichever layers have 'a'
+
+A Key only in one layer gives that layer's value as is, so unchanged subtrees are shared.
+A Key in several layers, which are all tables, gives a LayeredTable of them.
+Otherwise the policy decides:
+
+- error  : a conflict.
+- first  : the value from the first layer that has it.
+- last   : the value from the last layer that has it.
+- append : lists are concatenated, other values are a conflict.
+
+Values are combined the first time they are accessed, and then cached.
+Conflicts can be found up front with check_conflicts,
+which only walks keys that are in more than one layer.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import collections.abc
+import itertools as itz
+import logging as logmod
+# ##-- end stdlib imports
+
+from . import _interface as API # noqa: N812
+from ._base import GuardBase
+
+# ##-- types
+# isort: off
+import abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+MergeConflictMsg  : Final[str] = "Key Conflict:"
+
+##--| Body
+
+class LayeredTable(collections.abc.Mapping):
+    """ A Lazy, read-only merge of a sequence of tables.
+
+    Layers are given in order, first to last.
+    Guards are unwrapped to their tables,
+    and LayeredTables of the same policy are flattened into their layers.
+    """
+    __slots__ = ("_keys", "_layers", "_policy", "_resolved")
+    _layers    : tuple[Mapping, ...]
+    _policy    : API.MergePolicy_e
+    _keys      : Maybe[tuple[str, ...]]
+    _resolved  : dict[str, Any]
+
+    def __init__(self, layers:Iterable[Mapping], *, policy:str|API.MergePolicy_e=API.MergePolicy_e.error) -> None:
+        flat : list[Mapping] = []
+        self._policy = API.MergePolicy_e(policy)
+        for layer in layers:
+            match layer:
+                case GuardBase():
+                    flat.append(layer._table())
+                case LayeredTable() if layer._policy is self._policy:
+                    flat.extend(layer._layers)
+                case collections.abc.Mapping():
+                    flat.append(layer)
+                case x:
+                    raise TypeError(type(x))
+        else:
+            self._layers    = tuple(flat)
+            self._keys      = None
+            self._resolved  = {}
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}:{self._policy}:{len(self._layers)}:{list(self)}>"
+
+    @override
+    def __contains__(self, key:object) -> bool:
+        return key in self._resolved or any(key in x for x in self._layers)
+
+    @override
+    def __getitem__(self, key:str) -> Any:
+        result : Any = None
+        if key in self._resolved:
+            return self._resolved[key]
+
+        match [x[key] for x in self._layers if key in x]:
+            case []:
+                raise KeyError(key)
+            case [x]:
+                result = x
+            case [*xs]:
+                result = self._combine(key, xs)
+
+        self._resolved[key] = result
+        return result
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        if self._keys is None:
+            # first seen order
+            self._keys = tuple(dict.fromkeys(itz.chain.from_iterable(self._layers)))
+        return iter(self._keys)
+
+    @override
+    def __len__(self) -> int:
+        if self._keys is None:
+            iter(self)
+        return len(cast("tuple", self._keys))
+
+    @property
+    def layers(self) -> tuple[Mapping, ...]:
+        return self._layers
+
+    @property
+    def policy(self) -> API.MergePolicy_e:
+        return self._policy
+
+    def to_dict(self) -> dict[str, Any]:
+        """ Build the merged data as a dict.
+        Only merged tables are built, values from a single layer are shared
+        """
+        result : dict[str, Any] = {}
+        for key, val in self.items():
+            match val:
+                case LayeredTable():
+                    result[key] = val.to_dict()
+                case _:
+                    result[key] = val
+        else:
+            return result
+
+    def _combine(self, key:str, values:list[Any]) -> Any:  # noqa: ANN401
+        match self._policy, values:
+            case _, [*xs] if all(isinstance(x, collections.abc.Mapping) for x in xs):
+                return LayeredTable(xs, policy=self._policy)
+            case API.MergePolicy_e.first, [x, *_]:
+                return x
+            case API.MergePolicy_e.last, [*_, x]:
+                return x
+            case API.MergePolicy_e.append, [*xs] if all(isinstance(x, list) for x in xs):
+                return list(itz.chain.from_iterable(xs))
+            case _:
+                raise KeyError(MergeConflictMsg, key)
+
+def check_conflicts(layers:Sequence[Mapping], *, policy:str|API.MergePolicy_e=API.MergePolicy_e.error) -> None:
+    """ Check the layers can be merged under a policy,
+    raising KeyError(msg, key path, index of the conflicting layer) if not.
+    Only keys in multiple layers are walked.
+    """
+    match API.MergePolicy_e(policy):
+        case API.MergePolicy_e.first | API.MergePolicy_e.last:
+            return
+        case x:
+            _check_conflicts([y._table() if isinstance(y, GuardBase) else y for y in layers],
+                             origins=range(len(layers)),
+                             policy=x,
+                             index=())
+
+def _check_conflicts(layers:Sequence[Mapping], *, origins:Sequence[int], policy:API.MergePolicy_e, index:tuple[str, ...]) -> None:
+    seen : dict[str, list[int]] = {}
+    for i, layer in enumerate(layers):
+        for key in layer:
+            seen.setdefault(key, []).append(i)
+
+    for key, found in seen.items():
+        if len(found) < 2:  # noqa: PLR2004
+            continue
+        values = [layers[i][key] for i in found]
+        match policy:
+            case _ if all(isinstance(x, collections.abc.Mapping) for x in values):
+                _check_conflicts(values, origins=[origins[i] for i in found], policy=policy, index=(*index, key))
+            case API.MergePolicy_e.append if all(isinstance(x, list) for x in values):
+                pass
+            case _:
+                raise KeyError(MergeConflictMsg, ".".join((*index, key)), origins[found[1]])
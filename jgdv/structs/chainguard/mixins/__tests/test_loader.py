@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging as logmod
 import pathlib as pl
+import tomllib
 from typing import (Any, Callable, ClassVar, Generic, Iterable, Iterator,
                     Mapping, Match, MutableMapping, Sequence, Tuple,
                     TypeVar, cast)
@@ -15,7 +16,9 @@ import warnings
 ##-- end imports
 
 import pytest
+from jgdv.testing.benchmark import Benchmark
 from jgdv.structs.chainguard import ChainGuard
+from jgdv.structs.chainguard.mixins.loader_m import merge_tables
 
 logging = logmod.root
 
@@ -54,3 +57,171 @@ class TestGuardLoader:
         assert("a-different-val" in simple)
         assert(simple.a_different_val == "blah")
         assert(simple.basic == "test")
+
+def write(dirp:pl.Path, name:str, text:str) -> pl.Path:
+    path = dirp / name
+    path.write_text(text)
+    return path
+
+class TestGuardLoader_Files:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        ChainGuard.load_cache_clear()
+        yield
+        ChainGuard.load_cache_clear()
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_load_multiple(self, tmp_path):
+        first   = write(tmp_path, "a.toml", "a = 1\n[table]\nx = 1")
+        second  = write(tmp_path, "b.toml", "b = 2\n[table.sub]\ny = 2")
+        simple  = ChainGuard.load(first, second)
+        assert(simple.a == 1)
+        assert(simple.b == 2)
+        assert(simple.table.x == 1)
+        assert(simple.table.sub.y == 2)
+
+    def test_load_arrays_of_tables_extend(self, tmp_path):
+        first   = write(tmp_path, "a.toml", "[[tasks.group]]\nname = 'a'")
+        second  = write(tmp_path, "b.toml", "[[tasks.group]]\nname = 'b'")
+        simple  = ChainGuard.load(first, second)
+        assert([x.name for x in simple.tasks.group] == ["a", "b"])
+
+    def test_load_conflict_names_file(self, tmp_path):
+        first   = write(tmp_path, "a.toml", "[table]\nx = 1")
+        second  = write(tmp_path, "b.toml", "[table]\nx = 2")
+        with pytest.raises(OSError) as ctx:
+            ChainGuard.load(first, second)
+
+        assert(f"table.x in {second}" in ctx.value.args[1])
+
+    def test_load_parse_error_names_file(self, tmp_path):
+        first   = write(tmp_path, "a.toml", "a = 1")
+        second  = write(tmp_path, "b.toml", "b = = 2")
+        with pytest.raises(OSError) as ctx:
+            ChainGuard.load(first, second)
+
+        assert(str(second) in ctx.value.args[1])
+
+    def test_load_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ChainGuard.load(tmp_path / "missing.toml")
+
+    def test_load_dir_parse_error_names_file(self, tmp_path):
+        write(tmp_path, "a.toml", "a = 1")
+        bad = write(tmp_path, "b.toml", "b = = 2")
+        with pytest.raises(OSError) as ctx:
+            ChainGuard.load_dir(tmp_path)
+
+        assert(str(bad) in ctx.value.__cause__.args[1])
+
+    def test_load_dir_empty(self, tmp_path):
+        assert(not bool(ChainGuard.load_dir(tmp_path)))
+
+    def test_load_serial(self, tmp_path):
+        for i in range(5):
+            write(tmp_path, f"{i}.toml", f"val_{i} = {i}")
+        simple = ChainGuard.load_dir(tmp_path, workers=1)
+        assert(dict(simple) == {f"val_{i}": i for i in range(5)})
+
+    def test_cache_hit(self, tmp_path):
+        path   = write(tmp_path, "a.toml", "a = 1")
+        ChainGuard.load(path)
+        before = ChainGuard.load_cache_info()
+        ChainGuard.load(path)
+        after  = ChainGuard.load_cache_info()
+        assert(after.hits == before.hits + 1)
+        assert(after.currsize == 1)
+
+    def test_cache_miss_on_change(self, tmp_path):
+        path   = write(tmp_path, "a.toml", "a = 1")
+        assert(ChainGuard.load(path).a == 1)
+        write(tmp_path, "a.toml", "a = 22")
+        assert(ChainGuard.load(path).a == 22)
+
+    def test_cached_tables_unmodified_by_merge(self, tmp_path):
+        first   = write(tmp_path, "a.toml", "[table]\nx = 1")
+        second  = write(tmp_path, "b.toml", "[table]\ny = 2")
+        ChainGuard.load(first, second)
+        assert(dict(ChainGuard.load(first).table) == {"x": 1})
+
+    def test_loads_dont_share_tables(self, tmp_path):
+        path   = write(tmp_path, "a.toml", "[a]\nx = 1\nys = [1, 2]")
+        first  = ChainGuard.load(path)
+        first._table()['a']['x'] = 99
+        first._table()['a']['ys'].append(3)
+        before = ChainGuard.load_cache_info()
+        second = ChainGuard.load(path)
+        assert(ChainGuard.load_cache_info().hits == before.hits + 1)
+        assert(second.a.x == 1)
+        assert(second.a.ys == [1, 2])
+
+    def test_load_table_in_two_files(self, tmp_path):
+        """ Unlike concatenating the texts, the same table can be defined in two files """
+        first   = write(tmp_path, "a.toml", "[table]\nx = 1")
+        second  = write(tmp_path, "b.toml", "[table]\ny = 2")
+        with pytest.raises(tomllib.TOMLDecodeError):
+            tomllib.loads("\n".join([first.read_text(), second.read_text()]))
+
+        assert(dict(ChainGuard.load(first, second).table) == {"x": 1, "y": 2})
+
+class TestMergeTables:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        assert(merge_tables({"a": 1}, {"b": 2}) == {"a": 1, "b": 2})
+
+    def test_nested(self):
+        first, second = {"a": {"b": {"c": 1}}}, {"a": {"b": {"d": 2}}}
+        assert(merge_tables(first, second) == {"a": {"b": {"c": 1, "d": 2}}})
+        assert(first == {"a": {"b": {"c": 1}}})
+
+    def test_arrays_of_tables(self):
+        assert(merge_tables({"a": [{"x": 1}]}, {"a": [{"x": 2}]}) == {"a": [{"x": 1}, {"x": 2}]})
+
+    def test_array_conflict(self):
+        with pytest.raises(KeyError):
+            merge_tables({"a": [1]}, {"a": [2]})
+
+    def test_conflict_names(self):
+        with pytest.raises(KeyError) as ctx:
+            merge_tables({"a": {"b": 1}}, {"a": {"b": 2}}, names=["first", "second"])
+
+        assert(ctx.value.args[1:] == ("a.b", "second"))
+
+    def test_through_guard_merge(self):
+        merged = ChainGuard.merge(ChainGuard({"a": {"b": 1}}), {"a": {"c": 2}}, dfs=merge_tables)
+        assert(isinstance(merged, ChainGuard))
+        assert(merged.a.c == 2)
+
+@pytest.mark.benchmark
+class TestGuardLoader_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_load_dir(self, tmp_path):
+        """ 300 task files, loaded by concatenation, then cold and cached """
+        for i in range(300):
+            write(tmp_path, f"tasks_{i}.toml", "\n".join(f"[[tasks.group_{i}]]\nname = 'task_{j}'\nactions = [{{do = 'basic', args = [1, 2, 3]}}]\n" for j in range(20)))
+
+        ChainGuard.load_cache_clear()
+        with Benchmark("Loading 300 toml files") as bench:
+            with bench.case("concatenated"):
+                concat = tomllib.loads("\n".join(x.read_text() for x in sorted(tmp_path.glob("*.toml"))))
+
+            with bench.case("cold"):
+                cold = ChainGuard.load_dir(tmp_path)
+
+            with bench.case("cached"):
+                warm = ChainGuard.load_dir(tmp_path)
+
+        assert(cold._table() == concat)
+        assert(warm._table() == concat)
+        assert(bench["cached"] < bench["cold"])
+        ChainGuard.load_cache_clear()
@@ -35,7 +35,9 @@ from weakref import ref
 # ##-- end stdlib imports
 
 # ##-- 3rd party imports
+import asyncio
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 
 # ##-- end 3rd party imports
 
@@ -44,7 +46,8 @@ from jgdv.structs.chainguard._base import GuardBase
 from jgdv.structs.chainguard.errors import GuardedAccessError
 from jgdv.structs.chainguard.proxies.failure import GuardFailureProxy
 from jgdv.structs.chainguard import ChainGuard
-from jgdv.structs.chainguard.mixins.reporter_m import DefaultedReporter_m
+from jgdv.structs.chainguard.mixins.reporter_m import DefaultedReporter_m, DefaultCollector
+from jgdv.testing.benchmark import Benchmark
 
 # ##-- end 1st party imports
 
@@ -64,19 +67,19 @@ class TestDefaultedReporter:
         assert(True is True)
 
     def test_proxied_report_empty(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
         base     = ChainGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         assert(ChainGuard.report_defaulted() == [])
 
     def test_proxied_report_no_existing_values(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
         base     = ChainGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         base.test.blah.bloo
         base.test.blah.aweg
         assert(ChainGuard.report_defaulted() == [])
 
     def test_proxied_report_missing_values(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
         base              = ChainGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         base.on_fail(False).this.doesnt.exist()
         base.on_fail(False).test.blah.other()
@@ -86,7 +89,7 @@ class TestDefaultedReporter:
         assert("<root>.test.blah.other = false # <Any>" in defaulted)
 
     def test_proxied_report_missing_typed_values(self, mocker):
-        mocker.patch.object(DefaultedReporter_m, "_defaulted", set())
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
         base     = ChainGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
         base.on_fail("aValue", str).this.doesnt.exist()
         base.on_fail(2, int).test.blah.other()
@@ -95,6 +98,176 @@ class TestDefaultedReporter:
         assert("<root>.this.doesnt.exist = 'aValue' # <str>" in defaulted)
         assert("<root>.test.blah.other = 2 # <int>" in defaulted)
 
-    @pytest.mark.skip("not implemented")
-    def test_proxied_report_no_duplicates(self):
-        raise NotImplementedError()
+    def test_proxied_report_no_duplicates(self, mocker):
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
+        base     = ChainGuard({"test": { "blah": {"bloo": "final", "aweg": "joijo"}}})
+        for _ in range(5):
+            base.on_fail(2, int).test.blah.other()
+
+        assert(ChainGuard.report_defaulted() == ["<root>.test.blah.other = 2 # <int>"])
+
+class TestDefaultCollector:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        collector = DefaultCollector()
+        assert(len(collector) == 0)
+
+    def test_records_raw(self):
+        collector = DefaultCollector()
+        collector.add(("<root>", "a", "b"), [1, 2], int)
+        assert(collector.records() == [(("<root>", "a", "b"), [1, 2], int)])
+
+    def test_report(self):
+        collector = DefaultCollector()
+        collector.add(("<root>", "a"), True)
+        collector.add("<root>.b", "blah", str)
+        collector.add(("<root>", "c"), 2, int|str)
+        assert(collector.report() == ["<root>.a = true # <Any>",
+                                      "<root>.b = 'blah' # <str>",
+                                      "<root>.c = 2 # <int | str>"])
+
+    def test_duplicates(self):
+        collector = DefaultCollector()
+        for _ in range(3):
+            collector.add(("a",), 1)
+            collector.add(("b",), [1])
+
+        assert(len(collector) == 2)
+        assert(collector.report() == ["a = 1 # <Any>", "b = [1] # <Any>"])
+
+    def test_capped(self):
+        collector = DefaultCollector(maxsize=2)
+        for i in range(5):
+            collector.add(("a",), i)
+
+        assert(len(collector) == 2)
+        assert(collector.dropped == 3)
+
+    def test_unbounded(self):
+        collector = DefaultCollector(maxsize=None)
+        for i in range(5):
+            collector.add(("a",), i)
+
+        assert(len(collector) == 5)
+
+    def test_merge(self):
+        first, second = DefaultCollector(), DefaultCollector(maxsize=1)
+        first.add(("a",), 1)
+        second.add(("b",), 2)
+        second.add(("c",), 3)
+        first.merge(second)
+        assert(len(first) == 2)
+        assert(first.dropped == 1)
+
+    def test_clear(self):
+        collector = DefaultCollector()
+        collector.add(("a",), 1)
+        collector.clear()
+        assert(collector.report() == [])
+
+    def test_threads(self):
+        collector = DefaultCollector(maxsize=None)
+
+        def work(i):
+            for j in range(200):
+                collector.add(("t", i, j), j)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+
+        assert(len(collector) == 1600)
+
+class TestDefaultedReporter_Scoped:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_list_index_fails(self):
+        with pytest.raises(TypeError):
+            DefaultedReporter_m.add_defaulted(["a", "b"], 2)
+
+    def test_empty_fallback_ignored(self, mocker):
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
+        DefaultedReporter_m.add_defaulted(("a",), ())
+        assert(ChainGuard.report_defaulted() == [])
+
+    def test_collect(self, mocker):
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
+        base = ChainGuard({})
+        with ChainGuard.collect_defaulted() as collector:
+            base.on_fail(1).a()
+            assert(ChainGuard.report_defaulted() == ["<root>.a = 1 # <Any>"])
+
+        assert(len(collector) == 1)
+        assert(ChainGuard.report_defaulted() == ["<root>.a = 1 # <Any>"])
+
+    def test_collect_no_propagate(self, mocker):
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
+        base = ChainGuard({})
+        with ChainGuard.collect_defaulted(propagate=False):
+            base.on_fail(1).a()
+
+        assert(ChainGuard.report_defaulted() == [])
+
+    def test_collect_nested(self, mocker):
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
+        base = ChainGuard({})
+        with ChainGuard.collect_defaulted() as outer:
+            with ChainGuard.collect_defaulted() as inner:
+                base.on_fail(1).a()
+            base.on_fail(2).b()
+
+        assert(len(inner) == 1)
+        assert(len(outer) == 2)
+        assert(len(ChainGuard.report_defaulted()) == 2)
+
+    def test_collect_capped(self):
+        base = ChainGuard({})
+        with ChainGuard.collect_defaulted(maxsize=2, propagate=False) as collector:
+            for i in range(5):
+                base.on_fail(i).a()
+
+        assert(len(collector) == 2)
+        assert(collector.dropped == 3)
+
+    def test_collect_is_per_context(self):
+        base = ChainGuard({})
+
+        async def task(name):
+            with ChainGuard.collect_defaulted(propagate=False) as collector:
+                base.on_fail(name)[name]()
+                await asyncio.sleep(0)
+                base.on_fail(name).other()
+                return collector.report()
+
+        async def main():
+            return await asyncio.gather(task("a"), task("b"))
+
+        first, second = asyncio.run(main())
+        assert(first == ["<root>.a = 'a' # <Any>", "<root>.other = 'a' # <Any>"])
+        assert(second == ["<root>.b = 'b' # <Any>", "<root>.other = 'b' # <Any>"])
+
+@pytest.mark.benchmark
+class TestDefaultedReporter_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_repeated_defaults(self):
+        """ 100k defaulted values over 100 paths, recorded then reported """
+        indexes = [("<root>", "section", f"key_{i}") for i in range(100)]
+        with Benchmark("Recording 100k defaults") as bench, ChainGuard.collect_defaulted(propagate=False) as collector:
+            with bench.case("add"):
+                for i in range(100_000):
+                    DefaultedReporter_m.add_defaulted(indexes[i % 100], i % 7, int)
+
+            with bench.case("report"):
+                report = ChainGuard.report_defaulted()
+
+            bench.note(lines=len(report))
+
+        assert(len(report) == len(collector))
@@ -18,10 +18,15 @@ import time
 import types
 import weakref
 import tomllib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID, uuid1
 
 ##-- end builtin imports
 
+from .. import _interface as API # noqa: N812
+
 # ##-- types
 # isort: off
 import abc
@@ -45,6 +50,7 @@ if TYPE_CHECKING:
 
     from .._interface import ChainGuard_i
     T = TypeVar('T')
+    type CacheKey = tuple[str, int, int]
 
 # isort: on
 # ##-- end types
@@ -58,9 +64,119 @@ LoadFailMsg           : Final[str] = "ChainGuard Failed to Load: "
 TomlLoadFailMsg       : Final[str] = "Failed to Load Toml"
 DirectoryLoadFailMsg  : Final[str] = "ChainGuard Failed to load Directory: "
 
+TomlMergeFailMsg      : Final[str] = "Conflicting Toml Value"
+
+##--|
+
+class TomlCache:
+    """ A Bounded, LRU cache of parsed toml files.
+
+    Keyed on (absolute path, mtime_ns, size), so a changed file misses.
+    Stored tables are never handed out, loads get a copy of them.
+    Files are loaded from a thread pool, so access is locked.
+    """
+    __slots__ = ("_data", "_lock", "hits", "maxsize", "misses")
+    _data    : OrderedDict[CacheKey, dict[str, TomlTypes]]
+    _lock    : threading.Lock
+    hits     : int
+    misses   : int
+    maxsize  : int
+
+    def __init__(self, *, maxsize:int=API.DEFAULT_TOML_CACHE_MAX) -> None:
+        assert(0 < maxsize), maxsize
+        self._data    = OrderedDict()
+        self._lock    = threading.Lock()
+        self.maxsize  = maxsize
+        self.hits     = 0
+        self.misses   = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def key(path:pl.Path) -> CacheKey:
+        stat = path.stat()
+        return (str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+
+    def lookup(self, cache_key:CacheKey) -> Maybe[dict[str, TomlTypes]]:
+        with self._lock:
+            match self._data.get(cache_key, None):
+                case None:
+                    self.misses += 1
+                    return None
+                case x:
+                    self.hits += 1
+                    self._data.move_to_end(cache_key)
+                    return x
+
+    def add(self, cache_key:CacheKey, data:dict[str, TomlTypes]) -> None:
+        """ Store a parsed file, evicting the least recently used if necessary """
+        with self._lock:
+            self._data[cache_key] = data
+            self._data.move_to_end(cache_key)
+            while self.maxsize < len(self._data):
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Drop all entries. The hit/miss counts are kept """
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> API.TomlCacheInfo_d:
+        return API.TomlCacheInfo_d(self.hits, self.misses, self.maxsize, len(self._data))
+
+def merge_tables(*tables:dict[str, TomlTypes], names:Maybe[Sequence[str]]=None) -> dict[str, TomlTypes]:
+    """ Merge parsed toml tables, mostly as if their texts were concatenated:
+    tables are merged recursively, arrays of tables are extended,
+    and any other repeated key is a conflict.
+
+    The difference is that a table can be defined in more than one file,
+    (eg: '[a]' in two files) as long as their keys don't conflict.
+    Concatenated texts reject that, but parsed tables don't record
+    which tables had headers, so they can't.
+
+    Shared tables are copied rather than modified.
+    Raises a KeyError, naming the source of the conflict if names are given.
+    """
+    result : dict[str, TomlTypes] = {}
+    for i, table in enumerate(tables):
+        name = names[i] if names else i
+        result = _merge_table(result, table, name=name, index=())
+    else:
+        return result
+
+def _merge_table(base:dict, new:dict, *, name:str|int, index:tuple[str, ...]) -> dict:
+    if not base:
+        return new
+
+    result = dict(base)
+    for key, val in new.items():
+        match result.get(key, None), val:
+            case None, _:
+                result[key] = val
+            case dict() as prev, dict():
+                result[key] = _merge_table(prev, val, name=name, index=(*index, key))
+            case list() as prev, list() if all(isinstance(x, dict) for x in itz.chain(prev, val)):
+                result[key] = [*prev, *val]
+            case _:
+                raise KeyError(TomlMergeFailMsg, ".".join((*index, key)), name)
+    else:
+        return result
+
+def _copy_toml[T:TomlTypes](val:T) -> T:
+    """ Copy parsed toml. Only tables and arrays need copying, other toml values are immutable """
+    match val:
+        case dict():
+            return cast("T", {k: _copy_toml(v) for k, v in val.items()})
+        case list():
+            return cast("T", [_copy_toml(x) for x in val])
+        case _:
+            return val
+
 ##--|
 class TomlLoader_m:
     """ Mixin for loading toml files """
+    _load_cache : ClassVar[TomlCache] = TomlCache()
 
     @classmethod
     def read(cls:type[ChainGuard_i], text:str) -> ChainGuard_i:
@@ -79,25 +195,69 @@ class TomlLoader_m:
             raise OSError(LoadFailMsg, data, err.args) from err
 
     @classmethod
-    def load(cls:type[ChainGuard_i], *paths:str|pl.Path) -> ChainGuard_i:
+    def load(cls:type[ChainGuard_i], *paths:str|pl.Path, workers:int=API.DEFAULT_LOAD_WORKERS) -> ChainGuard_i:
+        """ Load and merge toml files.
+        Each file is parsed separately (and cached), in a thread pool if there are several.
+        """
         logging.debug("Creating ChainGuard for %s", paths)
-        texts = []
-        for path in paths:
-            texts.append(pl.Path(path).read_text())
-        else:
-            try:
-                return cls(tomllib.loads("\n".join(texts)))
-            except tomllib.TOMLDecodeError as err:
-                raise OSError(TomlLoadFailMsg, *err.args, paths) from err
+        return cast("ChainGuard_i", cls._load_files([pl.Path(x) for x in paths], workers=workers)) # type: ignore[attr-defined]
 
     @classmethod
-    def load_dir(cls:type[ChainGuard_i], dirp:str|pl.Path) -> ChainGuard_i:
+    def load_dir(cls:type[ChainGuard_i], dirp:str|pl.Path, workers:int=API.DEFAULT_LOAD_WORKERS) -> ChainGuard_i:
         logging.debug("Creating ChainGuard for directory: %s", str(dirp))
         try:
-            texts = []
-            for path in pl.Path(dirp).glob("*.toml"):
-                texts.append(path.read_text())
-
-            return cls(tomllib.loads("\n".join(texts)))
+            paths = sorted(pl.Path(dirp).glob("*.toml"))
+            return cast("ChainGuard_i", cls._load_files(paths, workers=workers)) # type: ignore[attr-defined]
         except Exception as err:
             raise OSError(DirectoryLoadFailMsg, dirp, err.args) from err
+
+    @staticmethod
+    def load_cache_info() -> API.TomlCacheInfo_d:
+        return TomlLoader_m._load_cache.info()
+
+    @staticmethod
+    def load_cache_clear() -> None:
+        TomlLoader_m._load_cache.clear()
+
+    ##--| internal
+
+    @classmethod
+    def _load_files(cls:type[ChainGuard_i], paths:list[pl.Path], *, workers:int) -> ChainGuard_i:
+        tables : list[dict[str, TomlTypes]]
+        match paths:
+            case []:
+                return cls({})
+            case [x]:
+                return cls(TomlLoader_m._load_file(x))
+            case [*xs] if workers <= 1:
+                tables = [TomlLoader_m._load_file(x) for x in xs]
+            case [*xs]:
+                with ThreadPoolExecutor(max_workers=min(workers, len(xs))) as pool:
+                    tables = list(pool.map(TomlLoader_m._load_file, xs))
+
+        try:
+            return cast("ChainGuard_i", cls.merge(*tables, dfs=ftz.partial(merge_tables, names=[str(x) for x in paths]))) # type: ignore[attr-defined]
+        except KeyError as err:
+            _, index, name = err.args
+            raise OSError(TomlLoadFailMsg, f"{TomlMergeFailMsg}: {index} in {name}") from err
+
+    @staticmethod
+    def _load_file(path:pl.Path) -> dict[str, TomlTypes]:
+        """ Parse a single toml file, or get it from the cache.
+        Returns a copy of the cached table, so loads can't modify each other's data
+        """
+        cache_key = TomlCache.key(path)
+        match TomlLoader_m._load_cache.lookup(cache_key):
+            case dict() as x:
+                return _copy_toml(x)
+            case None:
+                pass
+
+        text = path.read_text()
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError as err:
+            raise OSError(TomlLoadFailMsg, f"{path}: {err}") from err
+        else:
+            TomlLoader_m._load_cache.add(cache_key, data)
+            return _copy_toml(data)
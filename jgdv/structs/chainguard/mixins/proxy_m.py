@@ -21,6 +21,7 @@ from uuid import UUID, uuid1
 ##-- end builtin imports
 
 from ..proxies.failure import GuardFailureProxy
+from ..proxies.path import GuardPath, NO_FALLBACK
 from ..errors import GuardedAccessError
 
 # ##-- types
@@ -76,6 +77,17 @@ class GuardProxyEntry_m:
 
         return GuardFailureProxy(self, types=types, fallback=fallback)
 
+    @staticmethod
+    def compile_path(path:str|Iterable[str|int], fallback:Any=NO_FALLBACK, types:Maybe=None) -> GuardPath:
+        """
+        Compile an access path once, to use on guards many times.
+        eg: jobs = ChainGuard.compile_path("tool.doot.jobs", fallback=[])
+            jobs(doot.config) -> doot.config.on_fail([]).tool.doot.jobs()
+
+        Without a fallback, a missing path raises a GuardedAccessError.
+        """
+        return GuardPath(path, fallback=fallback, types=types)
+
     def first_of(self:ChainGuard, fallback:Any, types:Maybe=None) -> GuardProxy: # type: ignore[misc]
         """
         get the first non-None value from a index path, even across arrays of tables
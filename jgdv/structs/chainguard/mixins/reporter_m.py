@@ -20,8 +20,10 @@ import logging as logmod
 import pathlib as pl
 import re
 import time
+import threading
 import types as types_
 import weakref
+from contextvars import ContextVar
 from copy import deepcopy
 from time import sleep
 from uuid import UUID, uuid1
@@ -51,6 +53,8 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Callable, Generator
     from collections.abc import Sequence, Mapping, MutableMapping, Hashable
 
+    type DefaultRecord = tuple[str|tuple[str|int, ...], Any, Any]
+
 ##--|
 
 # isort: on
@@ -60,41 +64,165 @@ if TYPE_CHECKING:
 logging = logmod.getLogger(__name__)
 ##-- end logging
 
+##--| Vars
+DEFAULT_REPORT_MAX  : Final[int]  = 4_096
+ListIndexMsg        : Final[str]  = "Tried to Register a default value with a list index, use a str or tuple"
+
+##--| Body
+
+class DefaultCollector:
+    """ Collects raw (index, value, types) records of values accessed through failure proxies.
+    Records are only formatted when reported.
+
+    Repeated records are skipped without locking,
+    unhashable values are compared by their repr.
+    New records are added under a lock, up to maxsize (None for unbounded),
+    after which they are counted as dropped.
+    """
+    __slots__ = ("_lock", "_records", "dropped", "maxsize")
+    _records  : dict[Hashable, DefaultRecord]
+    _lock     : threading.Lock
+    dropped   : int
+    maxsize   : Maybe[int]
+
+    def __init__(self, *, maxsize:Maybe[int]=DEFAULT_REPORT_MAX) -> None:
+        assert(maxsize is None or 0 < maxsize), maxsize
+        self._records  = {}
+        self._lock     = threading.Lock()
+        self.dropped   = 0
+        self.maxsize   = maxsize
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, index:str|tuple[str|int, ...], val:Any, types:Any=None) -> None:  # noqa: ANN401
+        key : Hashable
+        try:
+            key = (index, types, val)
+            hash(key)
+        except TypeError:
+            key = (index, types, repr(val))
+
+        if key in self._records:
+            return
+
+        with self._lock:
+            if key in self._records:
+                return
+            if self.maxsize is not None and self.maxsize <= len(self._records):
+                self.dropped += 1
+                return
+
+            self._records[key] = (index, val, types)
+
+    def records(self) -> list[DefaultRecord]:
+        with self._lock:
+            return list(self._records.values())
+
+    def merge(self, other:DefaultCollector) -> None:
+        """ Add another collector's records to this one """
+        for record in other.records():
+            self.add(*record)
+        else:
+            with self._lock:
+                self.dropped += other.dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self.dropped = 0
+
+    def report(self) -> list[str]:
+        """ Format the records as toml-like lines, without duplicates """
+        lines : dict[str, None] = {}
+        for index, val, types in self.records():
+            lines[self._format(index, val, types)] = None
+        else:
+            return list(lines)
+
+    @staticmethod
+    def _format(index:str|tuple[str|int, ...], val:Any, types:Any) -> str:  # noqa: ANN401
+        index_str  : str
+        types_str  : str
+        match index:
+            case str():
+                index_str = index
+            case _:
+                index_str = ".".join(map(str, index))
+
+        match types:
+            case None:
+                types_str = "Any"
+            case str():
+                types_str = types
+            case types_.UnionType():
+                types_str = repr(types)
+            case type(__name__=name):
+                types_str = name
+            case _:
+                types_str = str(types)
+
+        match val:
+            case bool():
+                return f"{index_str} = {str(val).lower()} # <{types_str}>"
+            case _:
+                return f"{index_str} = {val!r} # <{types_str}>"
+
+_current_collector : ContextVar[Maybe[DefaultCollector]] = ContextVar("DEFAULTED_COLLECTOR", default=None)
+
 class DefaultedReporter_m:
-    """ A Mixin for reporting values that a failure proxy defaulted on. """
+    """ A Mixin for reporting values that a failure proxy defaulted on.
+
+    Records go to the collector of the current context,
+    which is the class level _defaulted unless inside collect_defaulted.
+    """
 
-    _defaulted : ClassVar[set[str]] = set()
+    _defaulted : ClassVar[DefaultCollector] = DefaultCollector()
 
     @staticmethod
-    def add_defaulted(index:str|list[str], val:Any, types:Maybe[str]=None) -> None:  # noqa: ANN401
-        index_str : str
-        ##--|
-        types = types or "Any"
+    def add_defaulted(index:str|tuple[str|int, ...], val:Any, types:Any=None) -> None:  # noqa: ANN401
+        """ Record a value. Cheap, formatting is left to report_defaulted """
         match index, val:
             case _, ():
                 return
             case list(), _:
-                msg = "Tried to Register a default value with a list index, use a str"
-                raise TypeError(msg)
-            case str(), bool():
-                index_str = f"{index} = {str(val).lower()} # <{types}>"
-            case str(), _:
-                index_str = f"{index} = {val!r} # <{types}>"
-            case [*xs], bool():
-                index_path = ".".join(xs)
-                index_str = f"{index_path} = {str(val).lower()} # <{types}>"
-            case [*xs], _:
-                index_path = ".".join(xs)
-                index_str = f"{index_path} = {val} # <{types}>"
-            case _, _:
-                msg = "Unexpected Values found: "
-                raise TypeError(msg, val, index)
-
-        DefaultedReporter_m._defaulted.add(index_str)
+                raise TypeError(ListIndexMsg, index)
+            case _:
+                pass
+
+        match _current_collector.get():
+            case None:
+                DefaultedReporter_m._defaulted.add(index, val, types)
+            case collector:
+                collector.add(index, val, types)
 
     @staticmethod
     def report_defaulted() -> list[str]:
         """
         Report the index paths inject default values
         """
-        return list(DefaultedReporter_m._defaulted)
+        match _current_collector.get():
+            case None:
+                return DefaultedReporter_m._defaulted.report()
+            case collector:
+                return collector.report()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def collect_defaulted(*, maxsize:Maybe[int]=DEFAULT_REPORT_MAX, propagate:bool=True) -> Iterator[DefaultCollector]:
+        """ Collect defaulted values into a new collector, for this context.
+        eg: with ChainGuard.collect_defaulted() as collector: ...
+
+        On exit, records are merged into the outer collector, unless propagate=False.
+        """
+        outer      = _current_collector.get()
+        collector  = DefaultCollector(maxsize=maxsize)
+        if outer is None:
+            outer = DefaultedReporter_m._defaulted
+        token      = _current_collector.set(collector)
+        try:
+            yield collector
+        finally:
+            _current_collector.reset(token)
+            if propagate:
+                outer.merge(collector)
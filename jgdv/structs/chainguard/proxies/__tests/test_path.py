@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from jgdv.structs.chainguard import ChainGuard, GuardedAccessError
+from jgdv.structs.chainguard.mixins.reporter_m import DefaultedReporter_m, DefaultCollector
+from jgdv.structs.chainguard.proxies.path import GuardPath
+
+logging = logmod.root
+
+@pytest.fixture(scope="function")
+def data() -> ChainGuard:
+    return ChainGuard({"tool": {"doot": {"settings": {"jobs": ["a", "b"], "max-depth": 2},
+                                         "tasks": [{"name": "x"}, {"name": "y"}]}}})
+
+##--|
+
+class TestGuardPath:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        path = ChainGuard.compile_path("tool.doot.settings.jobs")
+        assert(isinstance(path, GuardPath))
+        assert(repr(path) == "<GuardPath: tool.doot.settings.jobs:Any>")
+
+    def test_empty_path_fails(self):
+        with pytest.raises(ValueError):
+            ChainGuard.compile_path("")
+
+    def test_get(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.jobs")
+        assert(path(data) == ["a", "b"])
+        assert(path(data) == data.tool.doot.settings.jobs)
+
+    def test_get_key_tuple(self, data):
+        path = ChainGuard.compile_path(("tool", "doot", "settings", "jobs"))
+        assert(path(data) == ["a", "b"])
+
+    def test_underscore_to_dash(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.max_depth")
+        assert(path(data) == 2)
+        assert(path._steps[-1] == ("max-depth", "max_depth"))
+        assert(path(data) == 2)
+
+    def test_exact_key_preferred(self):
+        path = ChainGuard.compile_path("a_b")
+        assert(path(ChainGuard({"a-b": 1})) == 1)
+        assert(path(ChainGuard({"a-b": 1, "a_b": 2})) == 2)
+
+    def test_table_is_child_guard(self, data):
+        path   = ChainGuard.compile_path("tool.doot")
+        result = path(data)
+        assert(isinstance(result, ChainGuard))
+        assert(result is path(data))
+        assert(result._index() == ("<root>", "tool", "doot"))
+
+    def test_list_of_tables(self, data):
+        path   = ChainGuard.compile_path("tool.doot.tasks")
+        result = path(data)
+        assert(all(isinstance(x, ChainGuard) for x in result))
+        assert([x.name for x in result] == ["x", "y"])
+
+    def test_list_index(self, data):
+        path = ChainGuard.compile_path("tool.doot.tasks.1.name")
+        assert(path(data) == "y")
+
+    def test_reused_on_other_data(self, data):
+        path  = ChainGuard.compile_path("tool.doot.settings.jobs")
+        other = ChainGuard({"tool": {"doot": {"settings": {"jobs": ["c"]}}}})
+        assert(path(data) == ["a", "b"])
+        assert(path(other) == ["c"])
+        assert(path(data) == ["a", "b"])
+
+    def test_from_child_guard(self, data):
+        path = ChainGuard.compile_path("settings.jobs")
+        assert(path(data.tool.doot) == ["a", "b"])
+
+    def test_missing_fails(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.blah")
+        with pytest.raises(GuardedAccessError) as ctx:
+            path(data)
+
+        assert("<root>.tool.doot.settings.blah not found" in ctx.value.args[0])
+
+    def test_missing_through_value_fails(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.jobs.blah")
+        with pytest.raises(GuardedAccessError):
+            path(data)
+
+    def test_fallback(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.blah", fallback=5)
+        assert(path(data) == 5)
+
+    def test_none_fallback(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.blah", fallback=None)
+        assert(path(data) is None)
+
+    def test_fallback_after_resolving(self, data):
+        path  = ChainGuard.compile_path("tool.doot.settings.jobs", fallback=[])
+        other = ChainGuard({"tool": {}})
+        assert(path(data) == ["a", "b"])
+        assert(path(other) == [])
+        assert(path(data) == ["a", "b"])
+
+    def test_types(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.max_depth", types=int)
+        assert(path(data) == 2)
+
+    def test_union_types(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.max_depth", types=int|str)
+        assert(path(data) == 2)
+
+    def test_types_fail(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.max_depth", types=str)
+        with pytest.raises(TypeError):
+            path(data)
+
+    def test_fallback_types_fail(self):
+        with pytest.raises(TypeError):
+            ChainGuard.compile_path("a.b", fallback=2, types=str)
+
+    def test_wrappers(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.max_depth", fallback=0)
+        assert(path(data, wrapper=lambda x: x * 10) == 20)
+        assert(path(ChainGuard({}), fallback_wrapper=lambda x: x - 1) == -1)
+
+    def test_on_fail(self, data):
+        path    = ChainGuard.compile_path("tool.doot.settings.blah")
+        guarded = path.on_fail("a", str)
+        assert(guarded is not path)
+        assert(guarded(data) == "a")
+        with pytest.raises(GuardedAccessError):
+            path(data)
+
+    def test_on_fail_shares_resolution(self, data):
+        path = ChainGuard.compile_path("tool.doot.settings.max_depth")
+        path(data)
+        assert(path.on_fail(0)._steps is path._steps)
+
+    def test_agrees_with_on_fail(self, data):
+        for text in ["tool.doot.settings.jobs", "tool.doot.settings.max_depth", "tool.blah", "tool.doot.tasks.0.name"]:
+            path = ChainGuard.compile_path(text, fallback="fallback")
+            assert(path(data) == data.on_fail("fallback")[tuple(int(x) if x.isdigit() else x for x in text.split("."))]())
+
+    def test_reports_defaulted(self, data, mocker):
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
+        ChainGuard.compile_path("tool.doot.blah", fallback=False)(data)
+        ChainGuard.compile_path("tool.doot.settings.max_depth", fallback=0, types=int)(data)
+        defaulted = ChainGuard.report_defaulted()
+        assert("<root>.tool.doot.blah = false # <Any>" in defaulted)
+        assert("<root>.tool.doot.settings.max_depth = 2 # <int>" in defaulted)
+
+    def test_no_fallback_doesnt_report(self, data, mocker):
+        mocker.patch.object(DefaultedReporter_m, "_defaulted", DefaultCollector())
+        ChainGuard.compile_path("tool.doot.settings.max_depth")(data)
+        assert(ChainGuard.report_defaulted() == [])
+
+@pytest.mark.benchmark
+class TestGuardPath_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_repeated_access(self, data):
+        """ 100k reads of the same path, compared to data.on_fail(...).a.b.c() """
+        count = 100_000
+        path  = ChainGuard.compile_path("tool.doot.settings.max_depth", fallback=0)
+        with Benchmark("Reading a path", count=count) as bench:
+            with bench.case("on_fail"):
+                for _ in range(count):
+                    data.on_fail(0).tool.doot.settings.max_depth()
+
+            with bench.case("compiled"):
+                for _ in range(count):
+                    path(data)
+
+        assert(path(data) == data.on_fail(0).tool.doot.settings.max_depth())
+        assert(bench["compiled"] < bench["on_fail"])
@@ -127,7 +127,6 @@ class GuardProxy:
                           fallback=self._fallback)
 
     def _notify(self) -> None:
-        types_str = self._types_str()
         match self._data, self._fallback, self._index():
             case GuardBase(), _, _:
                 pass
@@ -135,15 +134,11 @@ class GuardProxy:
                 pass
             case _, _, []:
                 pass
-            case None, val, [*index]:
-                DefaultedReporter_m.add_defaulted(".".join(map(str, index)),
-                                                  val,
-                                                  types_str)
-            case val, _, [*index]:
+            case None, val, index:
+                DefaultedReporter_m.add_defaulted(index, val, self._types)
+            case val, _, index:
                 assert(not isinstance(val, GuardBase|None))
-                DefaultedReporter_m.add_defaulted(".".join(map(str, index)),
-                                                  val,
-                                                  types_str)
+                DefaultedReporter_m.add_defaulted(index, val, self._types)
             case val, flbck, index,:
                 msg = "Unexpected Values found: "
                 raise TypeError(msg, val, index, flbck)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+A Compiled access path for ChainGuard,
+  for paths that are read repeatedly, from the same or similar data.
+
+  Instead of building a chain of guards or proxies each time::
+
+      data.on_fail([]).tool.doot.settings.jobs()
+
+  Compile the path once, and reuse it::
+
+      jobs = ChainGuard.compile_path("tool.doot.settings.jobs", fallback=[])
+      jobs(data)
+
+  The path is split once, and which spelling of each key ('a_b' or 'a-b')
+  the data uses is resolved on first use.
+  Later calls just index the underlying dicts.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import types
+# ##-- end stdlib imports
+
+from .._base import GuardBase, USCORE, DASH
+from ..errors import GuardedAccessError
+from ..mixins.reporter_m import DefaultedReporter_m
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+from typing import Any
+
+if TYPE_CHECKING:
+    from jgdv import Maybe, CHECKTYPE
+    from typing import Final
+    from typing import ClassVar, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+    from .._interface import ProxyWrapper
+
+    type PathKey = str|int
+    type PathStep = tuple[PathKey, Maybe[str]]
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+NO_FALLBACK  : Final[tuple]  = ()
+PATH_SEP     : Final[str]    = "."
+
+##--| Body
+
+class GuardPath:
+    """ A Reusable accessor for a path of keys into a ChainGuard.
+
+    Called with a guard, returns the value at the path.
+    Values are returned as the guard would: tables as (cached) child guards.
+
+    Without a fallback, a missing path raises a GuardedAccessError, like normal access.
+    With a fallback (including None), it acts like on_fail:
+    the fallback is returned instead, and the value is reported to DefaultedReporter_m.
+    If types are given, the result must be an instance of them.
+
+    Resolved keys are cached as steps of (key, shadow),
+    where shadow is the key as written, when the data used its alternative spelling.
+    If data doesn't match the cached steps, the path is resolved again.
+    """
+    __slots__ = ("_fallback", "_found", "_keys", "_steps", "_types")
+    _keys      : tuple[PathKey, ...]
+    _found     : tuple[PathKey, ...]
+    _steps     : Maybe[tuple[PathStep, ...]]
+    _fallback  : Maybe[Any|tuple]
+    _types     : CHECKTYPE
+
+    def __init__(self, path:str|Iterable[PathKey], *, fallback:Maybe[Any|tuple]=NO_FALLBACK, types:CHECKTYPE=None) -> None:
+        match path:
+            case str() if not path:
+                msg = "A Guard path needs at least one key"
+                raise ValueError(msg, path)
+            case str():
+                self._keys = tuple(path.split(PATH_SEP))
+            case _:
+                self._keys = tuple(path)
+
+        self._steps     = None
+        self._found     = ()
+        self._fallback  = fallback
+        self._types     = types
+        match fallback:
+            case tuple():
+                pass
+            case _:
+                self._match_type(fallback)
+
+    @override
+    def __repr__(self) -> str:
+        index_str = PATH_SEP.join(map(str, self._keys))
+        return f"<GuardPath: {index_str}:{self._types_str()}>"
+
+    def __call__(self, data:GuardBase, *, wrapper:Maybe[ProxyWrapper]=None, fallback_wrapper:Maybe[ProxyWrapper]=None) -> Any:  # noqa: ANN401
+        """
+        Get the value at the path in data, or the fallback.
+        Optionally call a wrapper function on the actual value,
+        or a fallback_wrapper function on the fallback
+        """
+        val   : Any
+        curr  : Any
+        table : dict = data._table()
+        ##--|
+        try:
+            curr = table
+            for key, shadow in self._steps: # type: ignore[union-attr]
+                if shadow is not None and shadow in curr:
+                    raise KeyError(shadow)  # noqa: TRY301
+                curr = curr[key]
+        except (KeyError, IndexError, TypeError):
+            curr = self._resolve(table)
+
+        match curr:
+            case None if self._steps is None:
+                val = self._on_missing(data)
+                if fallback_wrapper is not None:
+                    val = fallback_wrapper(val)
+                return self._match_type(val)
+            case GuardBase():
+                val = curr
+            case dict() | collections.abc.Mapping():
+                val = data._child(self._found, curr)
+            case [*xs] if all(isinstance(x, collections.abc.Mapping) for x in xs):
+                val = data._child(self._found, curr)
+            case _:
+                val = curr
+                if self._fallback != NO_FALLBACK:
+                    self._notify(data, val)
+
+        if wrapper is not None:
+            val = wrapper(val)
+        return self._match_type(val)
+
+    def on_fail(self, fallback:Maybe[Any]=None, types:CHECKTYPE=None) -> GuardPath:
+        """ Get a copy of this path, with a fallback value and types.
+        The copy shares this path's resolved keys
+        """
+        result          = type(self)(self._keys, fallback=fallback, types=types)
+        result._steps   = self._steps
+        result._found   = self._found
+        return result
+
+    ##--| internal
+
+    def _resolve(self, table:dict) -> Maybe[Any]:
+        """ Find the path in the data, the slow way.
+        On success, caches the steps and returns the value.
+        On failure, clears the steps and returns None.
+        """
+        step   : PathStep
+        steps  : list[PathStep]  = []
+        curr   : Any             = table
+        for key in self._keys:
+            if isinstance(curr, GuardBase):
+                curr = curr._table()
+            match curr, key:
+                case collections.abc.Mapping(), str() if key in curr:
+                    step = (key, None)
+                case collections.abc.Mapping(), str() if (alt:=key.replace(USCORE, DASH)) in curr:
+                    step = (alt, key)
+                case list() | tuple(), int() if 0 <= key < len(curr):
+                    step = (key, None)
+                case list() | tuple(), str() if key.isdigit() and int(key) < len(curr):
+                    step = (int(key), None)
+                case _:
+                    self._steps = None
+                    return None
+
+            steps.append(step)
+            curr = curr[step[0]]
+        else:
+            self._steps  = tuple(steps)
+            self._found  = tuple(x for x, _ in steps)
+            return curr
+
+    def _on_missing(self, data:GuardBase) -> Any:  # noqa: ANN401
+        match self._fallback:
+            case tuple() as x if x == NO_FALLBACK:
+                index_s  = PATH_SEP.join(map(str, data._index(self._keys)))
+                msg      = f"{index_s} not found"
+                raise GuardedAccessError(msg)
+            case x:
+                self._notify(data, x)
+                return x
+
+    def _notify(self, data:GuardBase, val:Any) -> None:  # noqa: ANN401
+        DefaultedReporter_m.add_defaulted((*data._index(), *self._keys), val, self._types)
+
+    def _types_str(self) -> str:
+        match self._types:
+            case None:
+                return "Any"
+            case types.UnionType() as targ:
+                return repr(targ)
+            case type(__name__=targ):
+                return targ
+            case targ:
+                return str(targ)
+
+    def _match_type(self, val:Maybe) -> Maybe:
+        match self._types:
+            case None:
+                pass
+            case type() | types.UnionType() if not isinstance(val, self._types):
+                index_str  = PATH_SEP.join(map(str, self._keys))
+                msg        = "GuardPath Value doesn't match declared Type: "
+                raise TypeError(msg, index_str, val, self._types)
+            case _:
+                pass
+
+        return val
@@ -152,3 +152,44 @@ class TestDKey_Format:
     def test_format_wrapped_indirect(self):
         obj = DKey("{blah}")
         assert(f"{obj:wi}" == "{blah_}")
+
+class TestDKey_ExpandMany:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        keys  = [DKey("a", implicit=True), DKey("b", implicit=True), DKey("{a}/{b}")]
+        state = {"a": "aa", "b": "bb"}
+        assert(DKey.expand_many(keys, state) == ["aa", "bb", "aa/bb"])
+
+    def test_matches_individual_expansion(self):
+        keys  = [DKey("a", implicit=True), DKey("{a}/{c}"), DKey("c", implicit=True), DKey("{a}-{b}")]
+        state = {"a": "{c}", "b": "bb", "c": "cc"}
+        assert(DKey.expand_many(keys, state) == [x.expand(state) for x in keys])
+
+    def test_empty(self):
+        assert(DKey.expand_many([], {}) == [])
+
+    def test_per_key_fallbacks(self):
+        keys  = [DKey("a", implicit=True, fallback="x"), DKey("b", implicit=True), DKey("c", implicit=True, fallback="z")]
+        assert(DKey.expand_many(keys, {"b": "bb"}) == ["x", "bb", "z"])
+
+    def test_call_fallback(self):
+        keys  = [DKey("a", implicit=True), DKey("b", implicit=True)]
+        assert(DKey.expand_many(keys, {"b": "bb"}, fallback="q") == ["q", "bb"])
+
+    def test_per_key_limit(self):
+        keys  = [DKey("a", implicit=True, max_exp=1), DKey("a", implicit=True)]
+        state = {"a": "{b}", "b": "bb"}
+        assert(DKey.expand_many(keys, state) == [x.expand(state) for x in keys])
+
+    def test_list_sources_are_per_key(self):
+        keys  = [DKey("a", implicit=True), DKey("b", implicit=True)]
+        assert(DKey.expand_many(keys, ["x", "y"]) == ["y", "y"])
+
+    def test_overridden_expand(self):
+        from ..special.args_keys import KwargsDKey  # noqa: PLC0415
+        keys = [DKey("a", implicit=True), DKey[DKey.Marks.KWARGS]("kwargs", implicit=True)]
+        assert(isinstance(keys[1], KwargsDKey))
+        assert(DKey.expand_many(keys, {"a": "aa"}) == ["aa", {}])
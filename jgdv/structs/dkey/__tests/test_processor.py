@@ -8,6 +8,7 @@ from __future__ import annotations
 import enum
 import logging as logmod
 import pathlib as pl
+import re
 from typing import (Any, ClassVar, Generic, TypeAlias, TypeVar, cast, TYPE_CHECKING)
 from collections.abc import Mapping
 import warnings
@@ -28,6 +29,19 @@ if TYPE_CHECKING:
 
 logging = logmod.root
 
+##--| Differential test data
+# Key texts used throughout the dkey test suite, and some edge cases
+TEST_ROOT     : pl.Path      = pl.Path(__file__).parent.parent
+HARVESTED     : list[str]    = sorted({m[1] for x in TEST_ROOT.glob("**/__tests/test_*.py")
+                                       for m in re.finditer(r'DKey(?:\[[^\]]*\])?\("([^"]*)"', x.read_text())})
+EDGE_CASES    : list[str]    = [
+    "blah", "{blah}", "{blah_}", "blah_", "{blah!p}", "{blah!I}", "{blah!s}", "{blah!c}", "{blah!L}",
+    "{blah:e2}", "{blah!p:e2}", "{blah:e2!p}", "{blah:}", "{blah!}", "{blah!pp}", " {blah} ",
+    "{_blah}", "{1blah}", "{bl.ah}", "{ blah }", "{blah}{bloo}", "{blah} bloo", "{blah:{bloo}}",
+    "{blah!I:e1}", "{args}", "{kwargs}", "{blah_!p}", "", "{}", "{{blah}}",
+]
+KEY_CTORS     : list         = [dkey.DKey, dkey.DKey[str], dkey.DKey[pl.Path], dkey.DKey[Mapping], dkey.DKey[list]]
+
 class TestDKey_Mark:
 
     def test_sanity(self):
@@ -154,3 +168,46 @@ class TestDKey_FormatParam:
                 assert(True)
             case x:
                 assert(False), x
+
+class TestDKey_SimplePath:
+    """ The simple key fast path must build identical keys to the full pre-processing """
+
+    def summarise(self, key:Key_p) -> tuple:
+        return (type(key), str.__str__(key), str(key), f"{key:w}",
+                key.data.convert, key.data.format, key.data.max_expansions,
+                key.data.expansion_type, key.data.typecheck, key.data.fallback,
+                tuple((x.prefix, x.joined()) for x in key.data.raw),
+                key.data.meta, key.data.words, key.data.sections, type(key).cls_annotation())
+
+    def build(self, key_type:type, text:str, **kwargs) -> tuple:
+        try:
+            return self.summarise(key_type(text, **kwargs))
+        except Exception as err:  # noqa: BLE001
+            return (type(err),)
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_harvested(self):
+        assert(len(HARVESTED) > 20)
+
+    def test_is_used(self, mocker):
+        simple_spy = mocker.spy(DKeyProcessor, "extract_raw_keys")
+        dkey.DKey("{blah}")
+        simple_spy.assert_not_called()
+
+    @pytest.mark.parametrize("ctor", KEY_CTORS)
+    @pytest.mark.parametrize("implicit", [False, True])
+    @pytest.mark.parametrize("text", HARVESTED + EDGE_CASES)
+    def test_matches_full_path(self, monkeypatch, ctor, implicit, text):
+        fast = self.build(ctor, text, implicit=implicit)
+        monkeypatch.setattr(DKeyProcessor, "use_simple_path", False)
+        slow = self.build(ctor, text, implicit=implicit)
+        assert(fast == slow)
+
+    @pytest.mark.parametrize("kwargs", [{"fallback": "aweg"}, {"max_exp": 2}, {"ctor": int}, {"check": str}, {"bad_kwarg": 2}])
+    def test_matches_full_path_with_kwargs(self, monkeypatch, kwargs):
+        fast = self.build(dkey.DKey, "{blah}", **kwargs)
+        monkeypatch.setattr(DKeyProcessor, "use_simple_path", False)
+        slow = self.build(dkey.DKey, "{blah}", **kwargs)
+        assert(fast == slow)
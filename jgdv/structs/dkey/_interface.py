@@ -70,6 +70,8 @@ FMT_PATTERN              : Final[Rx]               = re.compile(r"[wdi]+")
 EXPANSION_LIMIT_PATTERN  : Final[Rx]               = re.compile(r"e(\d+)")
 INDIRECT_SUFFIX          : Final[Ident]            = "_"
 KEY_PATTERN              : Final[RxStr]            = "{(.+?)}"
+SIMPLE_KEY_RX            : Final[Rx]               = re.compile(r"\{([A-Za-z_]\w*)(?:!([^{}:]))?(?::([^{}]*))?\}", re.ASCII)
+SIMPLE_IMPLICIT_KEY_RX   : Final[Rx]               = re.compile(r"([A-Za-z_]\w*)(?:!([^{}:]))?(?::([^{}]*))?", re.ASCII)
 OBRACE                   : Final[str]              = "{"
 MAX_DEPTH                : Final[int]              = 10
 MAX_KEY_EXPANSIONS       : Final[int]              = 200
@@ -260,7 +262,7 @@ class RawKey_d:
 
 class DKey_d(StrangAPI.Strang_d):
     """ Data of a DKey """
-    __slots__ = ("convert", "expansion_type", "fallback", "format", "help", "max_expansions", "multi", "name", "raw", "typecheck")
+    __slots__ = ("convert", "expansion_type", "fallback", "format", "help", "max_expansions", "multi", "name", "plans", "raw", "typecheck")
     name            : Maybe[str]
     raw             : tuple[RawKey_d, ...]
     expansion_type  : Ctor
@@ -271,6 +273,7 @@ class DKey_d(StrangAPI.Strang_d):
     help            : Maybe[str]
     max_expansions  : Maybe[int]
     multi           : bool
+    plans           : Maybe[dict[tuple, tuple]]
 
     def __init__(self, **kwargs) -> None:
         super().__init__()
@@ -284,6 +287,7 @@ class DKey_d(StrangAPI.Strang_d):
         self.help            = kwargs.pop("help", None)
         self.max_expansions  = kwargs.pop("max_exp", None)
         self.multi           = kwargs.pop("multi", False)
+        self.plans           = None
 
 ##--| Section Specs
 DKEY_SECTIONS : Final[StrangAPI.Sections_d] = StrangAPI.Sections_d(
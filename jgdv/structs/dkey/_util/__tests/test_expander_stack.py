@@ -21,11 +21,13 @@ import pytest
 
 # ##-- 1st party imports
 from jgdv import identity_fn
+from jgdv.testing.benchmark import Benchmark
 # ##-- end 1st party imports
 
 from .._interface import ExpInst_d, SourceChain_d, ExpInstChain_d, InstructionFactory_p, IndirectKey_p, EXPANSION_CONVERT_MAPPING
+from .._interface import VersionedSource_p, FrozenSource_p, ExpOp_e, DEFAULT_PLAN_MAX
 from ... import DKey, IndirectDKey, NonDKey
-from ..expander_stack import DKeyExpanderStack, InstructionFactory
+from ..expander_stack import DKeyExpanderStack, InstructionFactory, ExpansionCache, LIFTED_KEYS
 
 # ##-- types
 # isort: off
@@ -57,6 +59,27 @@ logmod.getLogger("jgdv.structs.dkey._util.expander_stack").setLevel(logmod.INFO)
 
 # Vars:
 Expanders : Final[list[type]] = [DKeyExpanderStack]
+
+class _VersionedDict(dict):
+    """ A dict with a mutation counter, for testing the expansion cache """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, val):
+        super().__setitem__(key, val)
+        self.version += 1
+
+    def exp_version_h(self):
+        return self.version
+
+class _FrozenDict(dict):
+    """ A dict that declares it won't change, for testing indexed lookups """
+
+    def exp_frozen_h(self):
+        return True
+
 # Body:
 
 class TestExpInst_d:
@@ -174,6 +197,84 @@ class TestSourceChain_d:
             case x:
                 assert(False), x
 
+    def test_memo(self):
+        base  = {"a": "blah"}
+        obj   = SourceChain_d(base, memo=True)
+        assert(obj.memo == {})
+        assert(obj.get("a") == "blah")
+        assert(obj.memo == {"a": "blah"})
+        base["a"] = "bloo"
+        assert(obj.get("a") == "blah")
+
+    def test_memo_ignores_misses(self):
+        obj   = SourceChain_d({}, memo=True)
+        assert(obj.get("a") is None)
+        assert(obj.memo == {})
+
+    def test_no_memo_with_list(self):
+        obj = SourceChain_d({}, ["a"], memo=True)
+        assert(obj.memo is None)
+
+    def test_extend_shares_memo(self):
+        obj = SourceChain_d({"a": "blah"}, memo=True)
+        ext = obj.extend()
+        assert(ext.memo is obj.memo)
+        assert(ext.get("a") == "blah")
+        assert("a" in obj.memo)
+
+    def test_extend_with_sources_doesnt_share_memo(self):
+        obj = SourceChain_d({"a": "blah"}, memo=True)
+        ext = obj.extend({"b": "bloo"})
+        assert(ext.memo is None)
+        assert(ext.get("b") == "bloo")
+        assert(obj.get("b") is None)
+
+    def test_frozen_source(self):
+        assert(isinstance(_FrozenDict(), FrozenSource_p))
+        assert(not isinstance({}, FrozenSource_p))
+
+    def test_no_index_for_mutable(self):
+        obj = SourceChain_d(_FrozenDict(), {"a": "blah"})
+        assert(obj.index is None)
+        assert(obj.get("a") == "blah")
+
+    def test_no_index_for_list(self):
+        obj = SourceChain_d(_FrozenDict(), ["a"])
+        assert(obj.index is None)
+
+    def test_indexed_get(self):
+        obj = SourceChain_d(_FrozenDict({"a": "blah"}), _FrozenDict({"a": "bloo", "b": "aweg"}))
+        assert(obj.index == {"a": 0, "b": 1})
+        assert(obj.get("a") == "blah")
+        assert(obj.get("b") == "aweg")
+
+    def test_indexed_skips_none(self):
+        obj = SourceChain_d(_FrozenDict({"a": None}), _FrozenDict({"a": "bloo"}))
+        assert(obj.get("a") == "bloo")
+
+    def test_indexed_miss(self):
+        obj = SourceChain_d(_FrozenDict({"a": "blah"}))
+        assert(obj.get("b") is None)
+        assert("b" not in obj.index)
+        assert(obj.get("b", "fallback") == "fallback")
+
+    def test_index_shared(self):
+        first, second = _FrozenDict({"a": "blah"}), _FrozenDict({"b": "bloo"})
+        obj1 = SourceChain_d(first, second)
+        obj2 = SourceChain_d(first, second)
+        assert(obj1.index is obj2.index)
+        assert(obj1.extend().index is obj1.index)
+        assert(SourceChain_d(second, first).index is not obj1.index)
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    def test_index_matches_walk(self, frozen):
+        ctor    = _FrozenDict if frozen else dict
+        sources = [ctor({f"k{i}": i, "shared": i, f"none{i}": None}) for i in range(5)]
+        obj     = SourceChain_d(*sources)
+        assert((obj.index is not None) is frozen)
+        for key in ["k0", "k4", "shared", "none1", "missing"]:
+            assert(obj.get(key) == SourceChain_d(*[dict(x) for x in sources]).get(key))
+
     def test_lookup(self):
         obj   = SourceChain_d({"a":2, "b":3}, {"blah":"bloo"})
         inst  = ExpInstChain_d(ExpInst_d(value="blah"),
@@ -1014,3 +1115,332 @@ class TestFallbacks:
                 assert(True)
             case x:
                  assert(False), x
+
+@pytest.mark.parametrize("ctor", Expanders)
+class TestExpansionCache:
+
+    @pytest.fixture(scope="function")
+    def exp(self, ctor):
+        obj = ctor(ctor=DKey)
+        obj.enable_cache()
+        return obj
+
+    def test_sanity(self, exp):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_disabled_by_default(self, ctor):
+        exp = ctor(ctor=DKey)
+        assert(exp.cache_info() is None)
+
+    def test_versioned_source(self, exp):
+        assert(isinstance(_VersionedDict(), VersionedSource_p))
+        assert(not isinstance({}, VersionedSource_p))
+
+    def test_hit(self, exp):
+        obj    = DKey("test", implicit=True)
+        state  = _VersionedDict({"test": "blah"})
+        first  = exp.expand(obj, state)
+        second = exp.expand(obj, state)
+        assert(first is not second)
+        assert(first.value == second.value == "blah")
+        info = exp.cache_info()
+        assert(info.hits == 1)
+        assert(info.misses == 1)
+        assert(info.hit_rate == 0.5)
+
+    def test_hit_by_equivalent_key(self, exp):
+        state = _VersionedDict({"test": "blah"})
+        exp.expand(DKey("test", implicit=True), state)
+        exp.expand(DKey("test", implicit=True), state)
+        assert(exp.cache_info().hits == 1)
+
+    def test_recursive_hit(self, exp):
+        obj   = DKey("test", implicit=True)
+        state = _VersionedDict({"test": "{blah}", "blah": "bloo"})
+        for _ in range(3):
+            match exp.expand(obj, state):
+                case ExpInst_d(value="bloo"):
+                    assert(True)
+                case x:
+                    assert(False), x
+        assert(exp.cache_info().hits == 2)
+
+    def test_cached_failure(self, exp):
+        obj   = DKey("aweg", implicit=True)
+        state = _VersionedDict({"test": "blah"})
+        assert(exp.expand(obj, state) is None)
+        assert(exp.expand(obj, state) is None)
+        assert(exp.cache_info().hits == 1)
+
+    def test_invalidated_by_version(self, exp):
+        obj   = DKey("test", implicit=True)
+        state = _VersionedDict({"test": "{blah}", "blah": "bloo"})
+        assert(exp.expand(obj, state).value == "bloo")
+        state["blah"] = "qqqq"
+        assert(exp.expand(obj, state).value == "qqqq")
+        assert(exp.cache_info().hits == 0)
+        assert(exp.cache_info().misses == 2)
+
+    def test_sources_distinguished(self, exp):
+        obj    = DKey("test", implicit=True)
+        state1 = _VersionedDict({"test": "blah"})
+        state2 = _VersionedDict({"test": "bloo"})
+        assert(exp.expand(obj, state1).value == "blah")
+        assert(exp.expand(obj, state2).value == "bloo")
+        assert(exp.cache_info().hits == 0)
+
+    def test_kwargs_distinguished(self, exp):
+        obj   = DKey("aweg", implicit=True)
+        state = _VersionedDict()
+        assert(exp.expand(obj, state, fallback="a").value == "a")
+        assert(exp.expand(obj, state, fallback="b").value == "b")
+        assert(exp.cache_info().hits == 0)
+
+    def test_unversioned_source_skipped(self, exp):
+        obj   = DKey("test", implicit=True)
+        state = {"test": "blah"}
+        assert(exp.expand(obj, state).value == "blah")
+        assert(exp.expand(obj, state).value == "blah")
+        info = exp.cache_info()
+        assert(info.hits == 0)
+        assert(info.skipped == 2)
+        assert(info.currsize == 0)
+
+    def test_list_source_skipped(self, exp):
+        obj   = DKey("test", implicit=True)
+        assert(exp.expand(obj, ["a", "b"]).value == "b")
+        assert(exp.cache_info().skipped == 1)
+
+    def test_type_fallback_skipped(self, exp):
+        key    = DKey("blah", implicit=True, fallback=list)
+        state  = _VersionedDict()
+        first  = exp.expand(key, state)
+        second = exp.expand(key, state)
+        assert(first.value == second.value == [])
+        assert(first.value is not second.value)
+        assert(exp.cache_info().skipped == 2)
+
+    def test_bounded(self, ctor):
+        exp   = ctor(ctor=DKey)
+        exp.enable_cache(maxsize=2)
+        state = _VersionedDict({"a": 1, "b": 2, "c": 3})
+        for name in ["a", "b", "c"]:
+            exp.expand(DKey(name, implicit=True), state)
+        assert(exp.cache_info().currsize == 2)
+        # "a" was evicted
+        exp.expand(DKey("a", implicit=True), state)
+        assert(exp.cache_info().hits == 0)
+
+    def test_clear(self, exp):
+        state = _VersionedDict({"test": "blah"})
+        exp.expand(DKey("test", implicit=True), state)
+        exp._cache.clear()
+        assert(exp.cache_info() == (0, 0, 0, exp._cache.maxsize, 0))
+
+class TestDKeyExpansionCache:
+
+    @pytest.fixture(scope="function")
+    def cache(self):
+        cache = DKey.enable_expansion_cache()
+        yield cache
+        DKey.disable_expansion_cache()
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_dkey_expand(self, cache):
+        assert(isinstance(cache, ExpansionCache))
+        key   = DKey("{test}/{blah}")
+        state = _VersionedDict({"test": "aweg", "blah": "bloo"})
+        assert(key.expand(state) == "aweg/bloo")
+        assert(key.expand(state) == "aweg/bloo")
+        assert(DKey.expansion_cache_info().hits == 1)
+
+    def test_disable(self, cache):
+        DKey.disable_expansion_cache()
+        assert(DKey.expansion_cache_info() is None)
+
+@pytest.mark.parametrize("ctor", Expanders)
+class TestExpansionPlans:
+
+    @pytest.fixture(scope="function")
+    def exp(self, ctor):
+        return ctor(ctor=DKey)
+
+    def test_sanity(self, exp):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_classify(self, exp):
+        fac = exp._factory
+        assert(fac.classify(None)[0] is ExpOp_e.CLEAR)
+        assert(fac.classify(fac.null_inst())[0] is ExpOp_e.CLEAR)
+        assert(fac.classify(fac.literal_inst("blah"))[0] is ExpOp_e.RESULT)
+        assert(fac.classify(ExpInst_d(value=DKey("blah", implicit=True)))[0] is ExpOp_e.BUILD)
+        assert(fac.classify(ExpInst_d(value=DKey("blah")))[0] is ExpOp_e.RESULT)
+        assert(fac.classify(ExpInstChain_d(root=DKey("blah", implicit=True)))[0] is ExpOp_e.LOOKUP)
+        assert(fac.classify(ExpInstChain_d(root=DKey("blah", implicit=True), merge=2))[0] is ExpOp_e.MERGE)
+
+    def test_classify_fail(self, exp):
+        with pytest.raises(TypeError):
+            exp._factory.classify(ExpInst_d(value="blah"))
+
+    def test_plan_matches_chains(self, exp):
+        key   = DKey("{a}/{b}")
+        inst  = ExpInst_d(value=key)
+        plan  = exp._factory.compile_plan(inst, {})
+        chains = exp._factory.build_chains(inst, {})
+        assert(len(plan) == len(chains))
+        assert([op for op, _ in plan] == [exp._factory.classify(x)[0] for x in chains])
+
+    def test_plan_stored_on_key(self, exp):
+        key   = DKey("test", implicit=True)
+        assert(key.data.plans is None)
+        assert(exp.expand(key, {"test": "blah"}).value == "blah")
+        assert(len(key.data.plans) == 1)
+
+    def test_plan_reused(self, exp):
+        key   = DKey("{a}/{b}")
+        inst  = ExpInst_d(value=key)
+        exp.plan_for(inst, {})
+        exp.plan_for(inst, {})
+        assert(len(key.data.plans) == 1)
+        exp.plan_for(inst, {"rec": 2})
+        assert(len(key.data.plans) == 2)  # noqa: PLR2004
+
+    def test_plan_ignores_unread_opts(self, exp):
+        key   = DKey("test", implicit=True)
+        inst  = ExpInst_d(value=key)
+        exp.plan_for(inst, {})
+        exp.plan_for(inst, {"fallback": []})
+        exp.plan_for(inst, {"fallback": "blah", "limit": 2})
+        assert(len(key.data.plans) == 1)
+
+    def test_plans_bounded(self, exp):
+        key   = DKey("test", implicit=True)
+        for i in range(DEFAULT_PLAN_MAX * 2):
+            exp.plan_for(ExpInst_d(value=key, rec=i + 1), {})
+
+        assert(len(key.data.plans) == DEFAULT_PLAN_MAX)
+
+    def test_plan_steps_copied(self, exp):
+        """ Changes to the instructions of a plan don't change the stored plan """
+        key     = DKey("{a}/{b}")
+        inst    = ExpInst_d(value=key)
+        first   = exp.plan_for(inst, {"rec": 0})
+        results = [x for op, x in first if op is ExpOp_e.RESULT]
+        assert(len(results) == 2)  # noqa: PLR2004
+        for x in results:
+            x.value = "changed"
+
+        second  = exp.plan_for(inst, {"rec": 0})
+        assert(all(x.value != "changed" for op, x in second if op is ExpOp_e.RESULT))
+
+    def test_interpreted(self, ctor):
+        exp   = ctor(ctor=DKey, compiled=False)
+        key   = DKey("test", implicit=True)
+        assert(exp.expand(key, {"test": "blah"}).value == "blah")
+        assert(key.data.plans is None)
+
+    @pytest.mark.parametrize(("key", "state"), [
+        ("{test}", {"test": "blah"}),
+        ("{test}", {"test": "{blah}", "blah": "bloo"}),
+        ("{test}", {"test_": "blah", "blah": "bloo"}),
+        ("{test_}", {"test_": "blah", "blah": "bloo"}),
+        ("{test_}", {"blah": "bloo"}),
+        ("{a}/{b}", {"a": "{c}", "b": "bb", "c": "cc"}),
+        ("{a}/{b}/{c}", {"a": "{d}/{e}", "b": "bb", "c": "{d}-{e}", "d": "dd", "e": "ee"}),
+        ("{a!p}", {"a": "blah"}),
+        ("{aweg}", {}),
+    ])
+    def test_compiled_matches_interpreted(self, ctor, key, state):
+        compiled     = ctor(ctor=DKey)
+        interpreted  = ctor(ctor=DKey, compiled=False)
+        target       = DKey(key)
+        for _ in range(2):
+            match compiled.expand(target, state), interpreted.expand(target, state):
+                case None, None:
+                    assert(True)
+                case ExpInst_d() as x, ExpInst_d() as y:
+                    assert(x.value == y.value)
+                case x:
+                    assert(False), x
+
+@pytest.mark.parametrize("ctor", Expanders)
+class TestExpandMany:
+
+    @pytest.fixture(scope="function")
+    def exp(self, ctor):
+        return ctor(ctor=DKey)
+
+    def test_sanity(self, exp):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self, exp):
+        keys  = [DKey("a", implicit=True), DKey("{a}/{b}")]
+        state = {"a": "{b}", "b": "bb"}
+        match exp.expand_many(keys, state):
+            case [ExpInst_d(value="bb"), ExpInst_d(value="bb/bb")]:
+                assert(True)
+            case x:
+                assert(False), x
+
+    def test_failures_in_order(self, exp):
+        keys  = [DKey("a", implicit=True), DKey("b", implicit=True)]
+        match exp.expand_many(keys, {"b": "bb"}):
+            case [None, ExpInst_d(value="bb")]:
+                assert(True)
+            case x:
+                assert(False), x
+
+    def test_lifted_keys_shared(self, exp, mocker):
+        keys       = [DKey("a", implicit=True), DKey("b", implicit=True)]
+        state      = {"a": "{c}", "b": "{c}", "c": "cc"}
+        lift_spy   = mocker.spy(exp._factory, "lift_inst")
+        results    = exp.expand_many(keys, state)
+        assert([x.value for x in results] == ["cc", "cc"])
+        lifted     = lift_spy.spy_return_list
+        assert(len({id(x.value) for x in lifted}) < len(lifted))
+
+    def test_lifted_keys_reset(self, exp):
+        exp.expand_many([DKey("a", implicit=True)], {"a": "{b}", "b": "bb"})
+        assert(LIFTED_KEYS.get() is None)
+
+@pytest.mark.benchmark
+class TestExpansion_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    @pytest.mark.parametrize("count", [1, 5, 20])
+    def test_indexed_lookup(self, count):
+        """ The key is only in the last source """
+        data     = [{f"key_{i}_{j}": j for j in range(50)} for i in range(count)]
+        data[-1]["target"] = "found"
+        with Benchmark(f"SourceChain_d.get over {count} sources", count=2_000) as bench:
+            for frozen in [False, True]:
+                sources = [_FrozenDict(x) if frozen else x for x in data]
+                chain   = SourceChain_d(*sources)
+                assert((chain.index is not None) is frozen)
+                with bench.case("indexed" if frozen else "walk"):
+                    for _ in range(1_000):
+                        assert(chain.get("target") == "found")
+                        assert(chain.get("missing") is None)
+
+    @pytest.mark.parametrize("interned", [False, True])
+    def test_compiled_vs_interpreted(self, interned):
+        """ Nested multi-keys, where lookups lift values into further multi-keys """
+        key     = DKey("{a}/{b}/{c}")
+        state   = {"a": "{d}/{e}", "b": "bb", "c": "{d}-{e}", "d": "dd", "e": "ee"}
+        count   = 50
+        if interned:
+            DKey.enable_interning()
+        try:
+            with Benchmark(f"Nested MultiDKey Expansion (interned: {interned})", count=count) as bench:
+                for compiled in [False, True]:
+                    exp = DKeyExpanderStack(ctor=DKey, compiled=compiled)
+                    with bench.case("compiled" if compiled else "interpreted"):
+                        for _ in range(count):
+                            assert(exp.expand(key, state).value == "dd/ee/bb/dd-ee")
+        finally:
+            DKey.disable_interning()
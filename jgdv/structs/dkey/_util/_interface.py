@@ -27,6 +27,7 @@ import faulthandler
 
 from jgdv._abstract.protocols.general import SpecStruct_p
 from jgdv.structs.strang import Strang, CodeReference
+from jgdv.util.id_cache import IdCache
 from .._interface import Key_p, NonKey_p, MultiKey_p, IndirectKey_p, LIFT_EXPANSION_PATTERN
 
 # ##-- types
@@ -57,6 +58,8 @@ if typing.TYPE_CHECKING:
     type InstructionExpansions  = list[ExpInst_d]
     type ExpOpts                = dict
     type SourceBases            = list|Mapping|SpecStruct_p
+    type ExpStep                = tuple[ExpOp_e, Maybe[ExpInst_d|ExpInstChain_d]]
+    type ExpPlan                = tuple[ExpStep, ...]
 
 # isort: on
 # ##-- end types
@@ -74,6 +77,9 @@ UnexpectedData          : Final[str]  = "Unexpected kwargs given to ExpInst_d"
 
 ##--| Values
 NO_EXPANSIONS_PERMITTED    : Final[int]                 = 0
+DEFAULT_EXP_CACHE_MAX      : Final[int]                 = 1024
+DEFAULT_SOURCE_INDEX_MAX   : Final[int]                 = 64
+DEFAULT_PLAN_MAX           : Final[int]                 = 16
 
 EXPANSION_CONVERT_MAPPING  : Final[dict[str,Maybe[Callable]]]  = {
     "p"                    : lambda x: pl.Path(x).expanduser().resolve(),
@@ -84,6 +90,19 @@ EXPANSION_CONVERT_MAPPING  : Final[dict[str,Maybe[Callable]]]  = {
     "f"                    : float,
     LIFT_EXPANSION_PATTERN : None,
 }
+##--| Enums
+
+class ExpOp_e(enum.Enum):
+    """ The operations of the expansion stack.
+    Instructions are paired with one of these when pushed onto the stack,
+    so the expander doesn't need to re-match them when popped.
+    """
+    CLEAR   = enum.auto()
+    RESULT  = enum.auto()
+    BUILD   = enum.auto()
+    MERGE   = enum.auto()
+    LOOKUP  = enum.auto()
+
 ##--| Data
 
 class ExpInst_d:
@@ -167,6 +186,23 @@ class ExpInstChain_d:
             val = f"(C:{len(self.chain)})"
         return f"<ExpChain{val}: {self.root}>"
 
+class ExpCacheInfo_d(typing.NamedTuple):
+    """ Statistics of an ExpansionCache, in the style of functools' CacheInfo.
+    skipped counts the expansions that couldn't be cached at all.
+    """
+    hits     : int
+    misses   : int
+    skipped  : int
+    maxsize  : int
+    currsize : int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
 class SourceChain_d:
     """ The core logic to lookup a key from a sequence of sources
 
@@ -174,13 +210,29 @@ class SourceChain_d:
     | Tries sources in order.
     | A Source that is a list is copied and each retrieval pops a value off it
 
+    With memo=True, successful gets are memoized,
+    so a chain can be shared by the expansions of many keys.
+    Chains with list sources are never memoized.
+
+    When every source is frozen (see FrozenSource_p), gets use an index of key -> source position,
+    instead of trying each source in turn.
+    The index is merged from the sources' items when first needed,
+    and shared between chains of the same sources.
+    As frozen sources contain only their items, a key missing from the index is a miss,
+    and misses are not stored.
+
     TODO replace this with collections.ChainMap ?
     """
-    __slots__ = ("sources",)
-    sources  : list[Mapping|list]
-
-    def __init__(self, *args:Maybe[SourceBases|SourceChain_d]) -> None:
-        self.sources = []
+    __slots__ = ("index", "memo", "sources")
+    _indexes      : ClassVar[IdCache[dict[str, int]]] = IdCache(maxsize=DEFAULT_SOURCE_INDEX_MAX)
+    sources       : list[Mapping|list]
+    memo          : Maybe[dict[str, Any]]
+    index         : Maybe[dict[str, int]]
+
+    def __init__(self, *args:Maybe[SourceBases|SourceChain_d], memo:bool=False) -> None:
+        self.sources  = []
+        self.memo     = None
+        self.index    = None
         for base in args:
             match base:
                 case None:
@@ -197,6 +249,11 @@ class SourceChain_d:
                     self.sources.append(base.params)
                 case x:
                     raise TypeError(type(x))
+        else:
+            if memo and not any(isinstance(x, list) for x in self.sources):
+                self.memo = {}
+            if bool(self.sources) and all(self._is_frozen(x) for x in self.sources):
+                self.index = self._shared_index()
 
     @override
     def __repr__(self) -> str:
@@ -204,7 +261,12 @@ class SourceChain_d:
         return f"<{type(self).__name__}: {source_types}>"
 
     def extend(self, *args:SourceBases) -> SourceChain_d:
+        """ Build a new chain, with additional sources at the end.
+        If there are no additional sources, the memo is shared.
+        """
         extension = SourceChain_d(*self.sources, *args)
+        if self.memo is not None and not bool(args):
+            extension.memo = self.memo
         return extension
 
     def lookup(self, target:ExpInstChain_d) -> Maybe[ExpInst_d|tuple]:
@@ -238,6 +300,12 @@ class SourceChain_d:
 
         """
         replacement  : Maybe  = fallback
+        if self.memo is not None and key in self.memo:
+            return self.memo[key]
+
+        if self.index is not None and fallback is None:
+            return self._indexed_get(key)
+
         for lookup in self.sources:
             match lookup:
                 case None | []:
@@ -256,10 +324,47 @@ class SourceChain_d:
                     raise TypeError(msg, key, lookup)
 
             if replacement is not fallback:
+                if self.memo is not None:
+                    self.memo[key] = replacement
                 return replacement
         else:
             return fallback
 
+    ##--| index
+
+    def _is_frozen(self, source:Any) -> bool:  # noqa: ANN401
+        match getattr(source, "exp_frozen_h", None):
+            case None:
+                return False
+            case fn:
+                return bool(fn())
+
+    def _shared_index(self) -> dict[str, int]:
+        """ Get the index for this chain's sources, building it if necessary """
+        index : dict[str, int]
+        match SourceChain_d._indexes.get(self.sources):
+            case dict() as index:
+                return index
+            case _:
+                index = {}
+
+        for pos in range(len(self.sources) - 1, -1, -1):
+            # Reversed, so earlier sources take precedence
+            index.update((key, pos) for key, val in cast("Mapping", self.sources[pos]).items() if val is not None)
+
+        return SourceChain_d._indexes.add(self.sources, index)
+
+    def _indexed_get(self, key:str) -> Maybe:
+        """ Get a value using the index. """
+        assert(self.index is not None)
+        match self.index.get(key, None):
+            case None:
+                return None
+            case int() as pos:
+                return cast("Mapping", self.sources[pos]).get(key, None)
+            case x:
+                raise TypeError(type(x))
+
 ##--| Protocols
 
 @runtime_checkable
@@ -267,6 +372,10 @@ class InstructionFactory_p(Protocol):
 
     def build_chains(self, val:ExpInst_d, opts:ExpOpts) -> list[ExpInstChain_d|ExpInst_d]: ...
 
+    def compile_plan(self, val:ExpInst_d, opts:ExpOpts) -> ExpPlan: ...
+
+    def classify(self, val:Maybe[ExpInst_d|ExpInstChain_d]) -> ExpStep: ...
+
     def build_inst(self, val:Maybe, root:Maybe[ExpInst_d], opts:ExpOpts, *, decrement:bool=True) -> Maybe[ExpInst_d]: ...
 
     def null_inst(self) -> ExpInst_d: ...
@@ -274,6 +383,25 @@ class InstructionFactory_p(Protocol):
     def literal_inst(self, val:Any) -> ExpInst_d: ...  # noqa: ANN401
 
     def lift_inst(self, val:str, root:Maybe[ExpInst_d], opts:ExpOpts, *, decrement:bool=False, implicit:bool=False) -> ExpInst_d: ...
+@runtime_checkable
+class FrozenSource_p(Protocol):
+    """ A Mapping Source which declares it will not change,
+    so lookups on it can be indexed.
+    Its items must be the keys it contains.
+    """
+
+    def exp_frozen_h(self) -> bool: ...
+
+@runtime_checkable
+class VersionedSource_p(Protocol):
+    """ A Source which reports a version, that changes whenever the source is modified.
+    eg: a mutation counter.
+
+    Expansions are only cached when every source they use is versioned.
+    """
+
+    def exp_version_h(self) -> Hashable: ...
+
 class Expander_p[T](Protocol):
 
     def set_ctor(self, ctor:CtorFn[..., T]) -> None: ...
@@ -282,10 +410,18 @@ class Expander_p[T](Protocol):
 
     def expand(self, source:T, *sources:dict, **kwargs:Any) -> Maybe[ExpInst_d]:  ...  # noqa: ANN401
 
+    def expand_many(self, keys:Iterable[T], *sources:dict, **kwargs:Any) -> list[Maybe[ExpInst_d]]:  ...  # noqa: ANN401
+
     def extra_sources(self, source:T) -> SourceChain_d: ...
 
     def coerce_result(self, inst:ExpInst_d, opts:ExpOpts, *, source:Key_p) -> Maybe[ExpInst_d]: ...
 
+    def enable_cache(self, *, maxsize:int=DEFAULT_EXP_CACHE_MAX) -> Any: ...  # noqa: ANN401
+
+    def disable_cache(self) -> None: ...
+
+    def cache_info(self) -> Maybe[ExpCacheInfo_d]: ...
+
 class ExpansionHooks_p(Protocol):
 
     def exp_to_inst_h(self, root:ExpInst_d, factory:InstructionFactory_p,  **kwargs:Any) -> Maybe[ExpInst_d]: ...  # noqa: ANN401
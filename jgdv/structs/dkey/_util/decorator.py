@@ -106,8 +106,9 @@ class DKeyExpansionDecorator(DataDec):
 
         def _method_action_expansions(*call_args:In.args, **kwargs:In.kwargs) -> Out:
             _self, spec, state, *rest = call_args
+            expansions : list[Any]
             try:
-                expansions = [x(spec, state) for x in meth.__annotations__[data_key]]
+                expansions = DKey.expand_many(meth.__annotations__[data_key], spec, state)
             except KeyError as err:
                 logging.warning("Action State Expansion Failure: %s", err)
                 return cast("Out", False)  # noqa: FBT003
@@ -123,8 +124,9 @@ class DKeyExpansionDecorator(DataDec):
 
         def _fn_action_expansions(*args:In.args, **kwargs:In.kwargs) -> Out:
             spec, state, *rest = args
+            expansions : list[Any]
             try:
-                expansions = [x(spec, state) for x in fn.__annotations__[data_key]]
+                expansions = DKey.expand_many(fn.__annotations__[data_key], spec, state)
             except KeyError as err:
                 logging.warning("Action State Expansion Failure: %s", err)
                 return cast("Out", False)  # noqa: FBT003
@@ -9,6 +9,7 @@ from __future__ import annotations
 import atexit# for @atexit.register
 import collections
 import contextlib
+import contextvars
 import datetime
 import enum
 import faulthandler
@@ -21,7 +22,7 @@ import re
 import time
 import types
 from collections import defaultdict, deque
-from copy import deepcopy
+from copy import copy, deepcopy
 from uuid import UUID, uuid1
 from weakref import ref
 # ##-- end stdlib imports
@@ -42,6 +43,7 @@ from collections.abc import Mapping
 from . import _interface as ExpAPI # noqa: N812
 from ._interface import Expander_p, SourceChain_d
 from ._interface import ExpInst_d, ExpInstChain_d, InstructionFactory_p
+from ._interface import ExpCacheInfo_d, ExpOp_e, DEFAULT_EXP_CACHE_MAX, DEFAULT_PLAN_MAX
 from .._interface import Key_p
 
 # ##-- types
@@ -64,7 +66,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence, MutableMapping, Hashable
 
     from jgdv import Maybe, M_, Func, RxStr, Rx, Ident, FmtStr, CtorFn
-    from ._interface import Expandable_p
+    from ._interface import Expandable_p, ExpPlan, ExpStep
 # isort: on
 # ##-- end types
 
@@ -78,14 +80,18 @@ type InstructionAlts        = list[ExpInst_d]
 type InstructionExpansions  = list[ExpInst_d]
 type InstructionList        = list[InstructionAlts|ExpInst_d]
 DoMaybe                     = MethodMaybe()
+# Keys lifted during an expand_many batch, so they are shared between the batch's keys
+LIFTED_KEYS                 : contextvars.ContextVar[Maybe[dict[tuple[str, bool], Key_p]]] = contextvars.ContextVar("LIFTED_KEYS", default=None)
 # Body:
 
 @Proto(InstructionFactory_p)
 class InstructionFactory:
-    _ctor : Maybe[type[Key_p]]
+    _ctor       : Maybe[type[Key_p]]
+    _value_ops  : dict[type, Maybe[ExpOp_e]]
 
     def __init__(self, *, ctor:Maybe[type[Key_p]]=None) -> None:
-        self._ctor = ctor
+        self._ctor       = ctor
+        self._value_ops  = {}
 
     def set_ctor(self, ctor:Maybe[type[Key_p]]) -> None:
         if ctor is None:
@@ -93,7 +99,7 @@ class InstructionFactory:
         self._ctor = ctor
 
     def build_chains(self, val:ExpInst_d, opts:ExpOpts) -> list[ExpInstChain_d|ExpInst_d]:
-        chain : list[ExpInst_d]
+        chain : list[Maybe[ExpInst_d]]
         match val:
             case ExpInst_d(value=key) if hasattr(key, "exp_generate_chains_h"):
                 return cast("list[ExpInstChain_d|ExpInst_d]", val.value.exp_generate_chains_h(val, self, opts))
@@ -115,7 +121,27 @@ class InstructionFactory:
 
         return [self.build_single_chain(chain, val.value)]
 
-    def build_single_chain(self, vals:list[Maybe[ExpInst_d]], root:DKey) -> ExpInstChain_d:
+    def compile_plan(self, val:ExpInst_d, opts:ExpOpts) -> ExpPlan:
+        """ Build the chains of a key instruction, as steps ready for the expansion stack """
+        return tuple(self.classify(x) for x in self.build_chains(val, opts))
+
+    def classify(self, val:Maybe[ExpInst_d|ExpInstChain_d]) -> ExpStep:
+        """ Pair an instruction with the operation the expansion stack will perform on it """
+        match val:
+            case None | ExpInst_d(value=None):
+                return ExpOp_e.CLEAR, val
+            case ExpInst_d(literal=True) | ExpInst_d(rec=0):
+                return ExpOp_e.RESULT, val
+            case ExpInst_d(value=x) if (op:=self._value_op(x)) is not None:
+                return op, val
+            case ExpInstChain_d(merge=int()):
+                return ExpOp_e.MERGE, val
+            case ExpInstChain_d():
+                return ExpOp_e.LOOKUP, val
+            case x:
+                raise TypeError(type(x))
+
+    def build_single_chain(self, vals:list[Maybe[ExpInst_d]], root:Key_p) -> ExpInstChain_d:
         return ExpInstChain_d(*[x for x in vals if x is not None], root=root)
 
 
@@ -152,7 +178,14 @@ class InstructionFactory:
 
     def lift_inst(self, val:str, root:Maybe[ExpInst_d], opts:ExpOpts, *, decrement:bool=False, implicit:bool=False) -> ExpInst_d:
         assert(self._ctor               is               not               None)
-        key        : Key_p            = self._ctor(val, implicit=implicit)  # type: ignore[call-arg]
+        key        : Key_p
+        match LIFTED_KEYS.get():
+            case None:
+                key = self._ctor(val, implicit=implicit)  # type: ignore[call-arg]
+            case dict() as lifted if (val, implicit) in lifted:
+                key = lifted[val, implicit]
+            case dict() as lifted:
+                key = lifted[val, implicit] = self._ctor(val, implicit=implicit)  # type: ignore[call-arg]
         rec_count  : Maybe[int]       = self._calc_recursion(key, root, opts, decrement=decrement)
         convert    : Maybe[str|bool]  = key.data.convert
         match root:
@@ -168,6 +201,27 @@ class InstructionFactory:
         return ExpInst_d(value=None, literal=True)
     ##--|
 
+    def _value_op(self, val:Any) -> Maybe[ExpOp_e]:  # noqa: ANN401
+        """ The stack operation for a non-literal instruction's value.
+        Runtime protocol checks are slow, so the result is memoized by type.
+        """
+        op : Maybe[ExpOp_e]
+        try:
+            return self._value_ops[type(val)]
+        except KeyError:
+            pass
+
+        match val:
+            case API.NonKey_p():
+                op = ExpOp_e.RESULT
+            case API.Key_p():
+                op = ExpOp_e.BUILD
+            case _:
+                op = None
+
+        self._value_ops[type(val)] = op
+        return op
+
     def _calc_recursion(self, key:Maybe[Key_p], val:Maybe[ExpInst_d], opts:ExpOpts, *, decrement:bool=True) -> Maybe[int]:
         rec_count : Maybe[int] = None
         match val:
@@ -205,6 +259,112 @@ class InstructionFactory:
                 return False, False
 ##--|
 
+class ExpansionCache:
+    """ A Bounded, LRU cache of expansion results.
+
+    Keyed on (key, sources and their versions, expansion kwargs).
+    Every source has to implement VersionedSource_p for an expansion to be cached,
+    as an unversioned source (eg: a plain dict) can change without notice.
+    So list sources, which are popped from on lookup, are never cached.
+
+    Entries hold a reference to their sources,
+    so a source's id can't be reused while its entries are alive.
+    """
+    __slots__ = ("_data", "hits", "maxsize", "misses", "skipped")
+    _data    : collections.OrderedDict[tuple, tuple[tuple, Maybe[ExpInst_d]]]
+    hits     : int
+    misses   : int
+    skipped  : int
+    maxsize  : int
+
+    def __init__(self, *, maxsize:int=DEFAULT_EXP_CACHE_MAX) -> None:
+        assert(0 < maxsize), maxsize
+        self._data    = collections.OrderedDict()
+        self.maxsize  = maxsize
+        self.hits     = 0
+        self.misses   = 0
+        self.skipped  = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def key_for(self, key:API.Key_p, sources:tuple, kwargs:dict) -> Maybe[tuple]:
+        """ Build the cache key for an expansion, or None if it can't be cached """
+        x         : Any
+        versions  : list[tuple[int, Hashable]]  = []
+        cache_key : tuple
+        match key.data.fallback, kwargs.get("fallback", None):
+            case (type(), _) | (_, type()):
+                # Type fallbacks build a new value each expansion
+                self.skipped += 1
+                return None
+            case _:
+                pass
+
+        for source in itz.chain(sources, getattr(key, "_extra_sources", ())):
+            match source:
+                case None:
+                    continue
+                case SourceChain_d():
+                    targets = source.sources
+                case x:
+                    targets = [x]
+
+            for x in targets:
+                match getattr(x, "exp_version_h", None):
+                    case None:
+                        self.skipped += 1
+                        return None
+                    case version_fn:
+                        versions.append((id(x), version_fn()))
+
+        try:
+            cache_key = (type(key), str.__str__(key),
+                         key.data.convert, key.data.expansion_type, key.data.typecheck, key.data.fallback,
+                         tuple(versions),
+                         tuple(sorted(kwargs.items())))
+            hash(cache_key)
+        except TypeError:
+            self.skipped += 1
+            return None
+        else:
+            return cache_key
+
+    def lookup(self, cache_key:tuple) -> tuple[bool, Maybe[ExpInst_d]]:
+        """ Returns (found, result). A shallow copy of the result is returned """
+        match self._data.get(cache_key, None):
+            case None:
+                self.misses += 1
+                return False, None
+            case [_, None]:
+                self.hits += 1
+                self._data.move_to_end(cache_key)
+                return True, None
+            case [_, inst]:
+                self.hits += 1
+                self._data.move_to_end(cache_key)
+                return True, copy(inst)
+            case x:
+                raise TypeError(type(x))
+
+    def add(self, cache_key:tuple, sources:tuple, inst:Maybe[ExpInst_d]) -> None:
+        """ Store an expansion result, evicting the least recently used if necessary """
+        self._data[cache_key] = (sources, copy(inst))
+        self._data.move_to_end(cache_key)
+        while self.maxsize < len(self._data):
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits     = 0
+        self.misses   = 0
+        self.skipped  = 0
+
+    def info(self) -> ExpCacheInfo_d:
+        return ExpCacheInfo_d(self.hits, self.misses, self.skipped, self.maxsize, len(self._data))
+
+##--|
+
 @Proto(Expander_p[API.Key_p])
 class DKeyExpanderStack:
     """ A Static class to control expansion.
@@ -241,26 +401,143 @@ class DKeyExpanderStack:
         - Indirect Hard Hit ||  {test_}  => state[test=>blah]  => blah
         - Indirect Miss     ||  {test_} => state[...]          => {test_}
 
+    The chains of each key are compiled into a plan once, and stored on the key (see plan_for).
+    Passing compiled=False rebuilds them on every expansion instead.
+
+    Caching of results is opt-in, and only applies to versioned sources (see ExpansionCache)::
+
+        DKey.enable_expansion_cache(maxsize=100)
+
     """
     _factory : ClassVar[InstructionFactory] = InstructionFactory()
     _ctor : type[API.Key_p]
+    _cache : Maybe[ExpansionCache]
+    _compiled : bool
 
-    def __init__(self, *, ctor:Maybe[type[API.Key_p]]=None) -> None:
+    def __init__(self, *, ctor:Maybe[type[API.Key_p]]=None, compiled:bool=True) -> None:
         self._factory.set_ctor(ctor)
+        self._cache     = None
+        self._compiled  = compiled
 
     def set_ctor(self, ctor:type[API.Key_p]) -> None:
         """ Dependency injection from DKey.__init_subclass__ """
         self._factory.set_ctor(ctor)
 
+    ##--| caching
+
+    def enable_cache(self, *, maxsize:int=DEFAULT_EXP_CACHE_MAX) -> ExpansionCache:
+        """ Cache expansion results.
+        Returns the cache, for inspection of hits and misses.
+        """
+        self._cache = ExpansionCache(maxsize=maxsize)
+        return self._cache
+
+    def disable_cache(self) -> None:
+        self._cache = None
+
+    def cache_info(self) -> Maybe[ExpCacheInfo_d]:
+        match self._cache:
+            case ExpansionCache() as cache:
+                return cache.info()
+            case _:
+                return None
+
+    ##--| plans
+
+    def plan_for(self, inst:ExpInst_d, opts:ExpOpts) -> ExpPlan:
+        """ Get the compiled chains for a key instruction.
+
+        The chains only depend on the key, the instruction's recursion/conversion/lift settings,
+        and the 'rec' expansion option. So they are compiled once and stored on the key,
+        keeping at most DEFAULT_PLAN_MAX per key.
+        Only the lookups of the chains depend on the sources.
+
+        Expansion marks instructions as literal as it coerces them,
+        so the stored instructions are copied for each use.
+        """
+        plan_key  : tuple
+        plans     : dict[tuple, ExpPlan]
+        plan      : ExpPlan
+        if not self._compiled:
+            return self._factory.compile_plan(inst, opts)
+
+        match getattr(inst.value.data, "plans", False):
+            case False:
+                return self._factory.compile_plan(inst, opts)
+            case None:
+                plans = inst.value.data.plans = {}
+            case dict() as plans:
+                pass
+            case x:
+                raise TypeError(type(x))
+
+        plan_key = (inst.rec, inst.convert, inst.lift, "rec" in opts, opts.get("rec", None))
+        match plans.get(plan_key, None):
+            case None:
+                plan = self._factory.compile_plan(inst, opts)
+                if DEFAULT_PLAN_MAX <= len(plans):
+                    del plans[next(iter(plans))]
+                plans[plan_key] = plan
+            case stored:
+                plan = stored
+
+        return tuple((op, copy(x) if isinstance(x, ExpInst_d) else x) for op, x in plan)
+
     ##--|
 
     def redirect(self, source:API.Key_p, *sources:ExpAPI.SourceBases, **kwargs:Any) -> list[Maybe[ExpInst_d]]:  # noqa: ANN401
             return [self.expand(source, *sources, limit=1, **kwargs)]
 
-    def expand(self, key:API.Key_p, *sources:ExpAPI.SourceBases|SourceChain_d, **kwargs:Any) -> Maybe[ExpInst_d]:  # noqa: ANN401, PLR0912, PLR0915
-        """ The entry point for expanding a key """
+    def expand(self, key:API.Key_p, *sources:ExpAPI.SourceBases|SourceChain_d, **kwargs:Any) -> Maybe[ExpInst_d]:  # noqa: ANN401
+        """ The entry point for expanding a key.
+        Uses the cache, if enabled and the sources are all versioned.
+        """
+        cache_key : Maybe[tuple]
+        result    : Maybe[ExpInst_d]
+        match self._cache:
+            case ExpansionCache() as cache:
+                cache_key = cache.key_for(key, sources, kwargs)
+            case _:
+                return self._run_expansion(key, *sources, **kwargs)
+
+        if cache_key is None:
+            return self._run_expansion(key, *sources, **kwargs)
+
+        match cache.lookup(cache_key):
+            case True, result:
+                logging.info("- Cached Expansion: [%s]", repr(key))
+                return result
+            case _:
+                result = self._run_expansion(key, *sources, **kwargs)
+                cache.add(cache_key, sources, result)
+                return result
+
+    def expand_many(self, keys:Iterable[API.Key_p], *sources:ExpAPI.SourceBases|SourceChain_d, **kwargs:Any) -> list[Maybe[ExpInst_d]]:  # noqa: ANN401
+        """ Expand multiple keys against the same sources, returning results in order.
+
+        The source chain is built once, with its successful lookups memoized,
+        so subkeys shared between keys are only looked up once.
+        Keys lifted from looked up values are also shared, along with their compiled plans.
+        Each key uses its own fallback and expansion limit, unless overridden by kwargs.
+        If the sources include a list, each key gets a fresh chain, as in expand.
+        """
+        chain    : SourceChain_d  = SourceChain_d(*sources, memo=True)
+        shared   : tuple          = (chain,) if chain.memo is not None else sources
+        results  : list[Maybe[ExpInst_d]] = []
+        token    : contextvars.Token = LIFTED_KEYS.set(LIFTED_KEYS.get() or {})
+        try:
+            for key in keys:
+                opts = kwargs if "limit" in kwargs else {**kwargs, "limit": key.data.max_expansions}
+                results.append(self.expand(key, *shared, **opts))
+        finally:
+            LIFTED_KEYS.reset(token)
+
+        return results
+
+    def _run_expansion(self, key:API.Key_p, *sources:ExpAPI.SourceBases|SourceChain_d, **kwargs:Any) -> Maybe[ExpInst_d]:  # noqa: ANN401, PLR0912, PLR0915
+        """ Run the expansion stack for a key """
         x : Any
-        stack         : list[ExpInst_d|ExpInstChain_d|None]
+        stack         : list[ExpStep]
         result_stack  : list[ExpInst_d|None]
 
         ##--|
@@ -270,39 +547,43 @@ class DKeyExpanderStack:
 
         root          = self._factory.build_inst(key, None, {"rec":kwargs.get("limit", None), **kwargs}, decrement=False)
         assert(root is not None)
-        stack         = [root]
+        stack         = [self._factory.classify(root)]
         result_stack  = []
-        source_chain  = SourceChain_d(*sources)
+        match sources:
+            case [SourceChain_d() as source_chain]:
+                # Already built, eg: shared by expand_many
+                pass
+            case _:
+                source_chain = SourceChain_d(*sources)
         ## Pop each expansion from the stack,
         ## Adding new expansions back to it,
         ## and literals to the result stack.
         ## Merge instructions trigger result stack entries to be consumed
         while bool(stack):
             logging.info("Stack: %s", stack)
-            curr = stack.pop()
-            match curr:
-                case None | ExpInst_d(value=None):
+            match stack.pop():
+                case ExpOp_e.CLEAR, _:
                     logging.info("[Stack Clear]")
                     stack         = []
                     result_stack  = []
-                case ExpInst_d(value=API.NonKey_p()) | ExpInst_d(literal=True) | ExpInst_d(rec=0) as inst:
-                    logging.info("[Result shift]: %s", inst)
-                    value = self.coerce_result(inst, None, kwargs)
+                case ExpOp_e.RESULT, ExpInst_d() as curr:
+                    logging.info("[Result shift]: %s", curr)
+                    value = self.coerce_result(curr, None, kwargs)
                     result_stack.append(value)
-                case ExpInst_d(value=API.Key_p()) as inst:
-                    logging.info("[Build Chain]: %s / %s", str(inst.value), result_stack)
-                    stack += self._factory.build_chains(inst, kwargs)
-                case ExpInstChain_d(merge=int() as count) as inst:
-                    logging.info("[Merge Chain]: %s / %s", str(inst.root), result_stack)
+                case ExpOp_e.BUILD, ExpInst_d() as curr:
+                    logging.info("[Build Chain]: %s / %s", str(curr.value), result_stack)
+                    stack += self.plan_for(curr, kwargs)
+                case ExpOp_e.MERGE, ExpInstChain_d(merge=int() as count) as curr:
+                    logging.info("[Merge Chain]: %s / %s", str(curr.root), result_stack)
                     values, result_stack = reversed(result_stack[-count:]), result_stack[:-count]
-                    value         = self.flatten(list(values), inst.root, kwargs)
-                    value         = self.coerce_result(value, inst.root, kwargs)
-                    self.check_result(value, inst.root, kwargs)
+                    value         = self.flatten(list(values), curr.root, kwargs)
+                    value         = self.coerce_result(value, curr.root, kwargs)
+                    self.check_result(value, curr.root, kwargs)
                     result_stack.append(value)
-                case ExpInstChain_d() as inst:
-                    logging.info("[Lookup Chain]: %s / %s", str(inst.root), result_stack)
-                    lookup = self.do_lookup(inst, source_chain, kwargs)
-                    stack.append(lookup)
+                case ExpOp_e.LOOKUP, ExpInstChain_d() as curr:
+                    logging.info("[Lookup Chain]: %s / %s", str(curr.root), result_stack)
+                    lookup = self.do_lookup(curr, source_chain, kwargs)
+                    stack.append(self._factory.classify(lookup))
                 case x:
                     raise TypeError(type(x))
 
@@ -129,6 +129,22 @@ class DKey[**K](Strang, fresh_registry=True):
         """ register additional sources that are always included in expansion """
         cls._extra_sources += sources
 
+    @classmethod
+    def enable_expansion_cache(cls, *, maxsize:int=ExpAPI.DEFAULT_EXP_CACHE_MAX) -> Any:  # noqa: ANN401
+        """ Cache the results of expanding keys against versioned sources.
+        Returns the cache, for inspection of hits and misses.
+        The expander is shared, so this applies to all dkeys.
+        """
+        return cls._expander.enable_cache(maxsize=maxsize)
+
+    @classmethod
+    def disable_expansion_cache(cls) -> None:
+        cls._expander.disable_cache()
+
+    @classmethod
+    def expansion_cache_info(cls) -> Maybe[ExpAPI.ExpCacheInfo_d]:
+        return cls._expander.cache_info()
+
     @override
     def __init_subclass__(cls, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
         super().__init_subclass__(*args, annotation=kwargs.pop("mark", None), **kwargs)
@@ -152,13 +168,14 @@ class DKey[**K](Strang, fresh_registry=True):
     def __eq__(self, other:object) -> bool:
         match other:
             case DKey() | str():
-                return str.__eq__(self, other)
+                return self is other or str.__eq__(self, other)
             case _:
                 return NotImplemented
 
     @override
     def __hash__(self) -> int:
-        return hash(self[:])
+        # Equivalent to hash(self[:]), without building the slice
+        return str.__hash__(self)
 
     @override
     def __format__(self, spec:str) -> str:
@@ -208,6 +225,38 @@ class DKey[**K](Strang, fresh_registry=True):
             case _:
                 return None
 
+    @staticmethod
+    def expand_many(keys:Iterable[API.Key_p], *sources:Any, **kwargs:Any) -> list[Maybe]:  # noqa: ANN401
+        """ Expand multiple keys against the same sources, in one pass.
+        Results are returned in the same order as the keys.
+
+        Keys which override expand (eg: ArgsDKey) are expanded individually.
+        """
+        keys      = list(keys)
+        results   : list[Maybe]  = [None for _ in keys]
+        batch     : list[int]    = []
+        expander  : Maybe[Expander_p] = None
+        for i, key in enumerate(keys):
+            match key:
+                case DKey() if type(key).expand is DKey.expand:
+                    expander = key._expander
+                    batch.append(i)
+                case _:
+                    results[i] = key.expand(*sources, **kwargs)
+
+        if expander is None:
+            return results
+
+        expanded = expander.expand_many([keys[i] for i in batch], *sources, **kwargs)
+        for i, inst in zip(batch, expanded, strict=True):
+            match inst:
+                case ExpAPI.ExpInst_d(value=val, literal=True):
+                    results[i] = val
+                case _:
+                    pass
+        else:
+            return results
+
     def redirect(self, *args:Any, **kwargs:Any) -> list[API.Key_p]:  # noqa: ANN401
         assert(isinstance(self, API.Key_p))
         result = [DKey(x.value) for x in self._expander.redirect(self, *args, **kwargs) if x is not None]
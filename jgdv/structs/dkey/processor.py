@@ -79,14 +79,19 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
     """
 
     parser               : ClassVar[DKeyParser]    = DKeyParser()
+    use_simple_path      : ClassVar[bool]          = True
     _expected_init_keys  : ClassVar[list[str]]     = API.DEFAULT_DKEY_KWARGS[:]
 
     expected_kwargs      : Final[list[str]]        = API.DEFAULT_DKEY_KWARGS
     convert_mapping      : dict[str, KeyMark]
+    _simple_ctors        : dict[tuple[type, Maybe[str], bool], tuple[type, tuple]]
+    _multi_types         : dict[type, bool]
     ##--|
 
     def __init__(self) -> None:
-        self.convert_mapping = {}
+        self.convert_mapping  = {}
+        self._simple_ctors    = {}
+        self._multi_types     = {}
 
     @override
     def pre_process(self, cls:type[T], input:Any, *args:Any, strict:bool=False, **kwargs:Any) -> PreProcessResult[T]: # type: ignore[override]  # noqa: PLR0912, PLR0915
@@ -97,7 +102,7 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
         text         : str
         ctor         : Ctor[T]
         mark         : API.KeyMark
-        spec_mark    : API.KeyMark
+        spec_mark    : Maybe[API.KeyMark]
         format_mark  : Maybe[API.KeyMark]
         ##--|
         inst_data    : dict            = {}
@@ -105,15 +110,16 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
         force        : Maybe[Ctor[T]]  = kwargs.pop('force', None)
         implicit     : bool            = kwargs.pop("implicit", False)  # is key wrapped? ie: {key}
         insist       : bool            = kwargs.pop("insist", False)    # must produce key, not nullkey
+        kw_mark      : Maybe[KeyMark]  = kwargs.pop('mark', None)
 
         # TODO handle generic aliases by using the arg as instance expansion type
-        match force, kwargs.pop('mark', None):
+        match force, kw_mark:
             case type(), _:
                 spec_mark = cls.MarkOf(force)
             case None, None:
                 spec_mark = cls.MarkOf(cls)
-            case None, x:
-                spec_mark = x
+            case None, given:
+                spec_mark = given
             case _:
                 spec_mark = cls.MarkOf(cls)
 
@@ -124,7 +130,7 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
 
         ##--| Pre-clean text
         match input:
-            case Key_p() if insist:
+            case _ if insist and isinstance(input, Key_p):
                 text = f"{input:w}"
             case str():
                 text = input.strip()
@@ -139,6 +145,14 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
             ctor = self.select_ctor(cls, mark=False, force=None, insist=False)
             return str(input), inst_data, post_data, ctor
 
+        ##--| Fast path for simple keys, eg: {blah}, {blah!p}
+        if self.use_simple_path and force is None and kw_mark is None and not insist and API.RAWKEY_ID not in kwargs:
+            match self._simple_pre_process(cls, text, spec_mark, kwargs, implicit=implicit):
+                case None:
+                    pass
+                case result:
+                    return result
+
         ##--| Get pre-parsed keys
         match kwargs.pop(API.RAWKEY_ID, None) or self.extract_raw_keys(text, implicit=implicit):
             case [x]:
@@ -160,38 +174,50 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
                 msg = "Inspecting raw keys failed"
                 raise ValueError(msg, x)
         ##--|
-        match spec_mark, format_mark:
-            case type() as x, _:
-                mark = x
-            case x, None:
-                mark = x
-            case x, y if x == y:
-                mark = x
-            case x, y if y == DKeyMark_e.null() and x != DKeyMark_e.multi():
-                assert(y is not None)
-                mark = y
-            case x, y if x is DKeyMark_e.default():
-                assert(y is not None)
-                mark = y
-            case str() as x, _ if x not in DKeyMark_e:
-                mark = x
-            case _, y:
-                assert(y is not None)
-                mark = y
-
-
+        mark = self.resolve_mark(spec_mark, format_mark)
         assert(bool(text))
         assert(bool(inst_data))
         ctor = self.select_ctor(cls, insist=insist, mark=mark, force=force)
         self.validate_init_kwargs(ctor, kwargs)
         assert(issubclass(ctor, SubAlias_m))
         inst_data['mark'] = ctor.cls_annotation()
-        if DKeyMark_e.multi() in [format_mark, spec_mark] and not issubclass(ctor, API.MultiKey_p):
+        if self._multi_conflict(ctor, spec_mark, format_mark):
             msg = "a multi key was specified by a mark, but the ctor isnt a multi key"
             raise ValueError(msg, spec_mark, format_mark)
         ##--| return
         return text, inst_data, post_data, ctor
 
+    def _simple_pre_process(self, cls:type[T], text:str, spec_mark:KeyMark, kwargs:dict, *, implicit:bool) -> Maybe[PreProcessResult[T]]:
+        """ Pre-process a key which is a single identifier, with optional conversion and format params.
+
+        Skips the format string parser,
+        and gets the ctor from a table of (cls, conversion param, indirect) -> (ctor, annotation).
+        Returns None if the text isn't a simple key, to use the full pre-processing.
+        """
+        raw          : API.RawKey_d
+        format_mark  : Maybe[KeyMark]
+        ##--|
+        match (API.SIMPLE_IMPLICIT_KEY_RX if implicit else API.SIMPLE_KEY_RX).fullmatch(text):
+            case None:
+                return None
+            case m:
+                raw = API.RawKey_d(prefix="", key=m[1], convert=m[2], format=m[3] or "")
+
+        table_key = (cls, raw.convert, raw.is_indirect())
+        match self._simple_ctors.get(table_key, None):
+            case None:
+                _, format_mark  = self.inspect_raw([raw], kwargs)
+                ctor            = self.select_ctor(cls, insist=False, mark=self.resolve_mark(spec_mark, format_mark), force=None)
+                if not (isinstance(ctor, type) and issubclass(ctor, SubAlias_m)) or self._multi_conflict(ctor, spec_mark, format_mark):
+                    return None
+                self._simple_ctors[table_key] = (ctor, ctor.cls_annotation())
+            case _:
+                pass
+
+        ctor, annotation = self._simple_ctors[table_key]
+        self.validate_init_kwargs(ctor, kwargs)
+        return raw.direct(), {API.RAWKEY_ID: [raw], "mark": annotation}, {}, ctor
+
     @override
     def process(self, obj:T, *, data:Maybe[dict]=None) -> Maybe[T]:
         """ The key constructed, build slices """
@@ -240,8 +266,8 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
         # for each subkey, build it...
         x : Any
         key_meta : list[Maybe[str|API.Key_p]] = []
-        raw : list[API.RawKey_d] = []
-        if isinstance(obj, API.MultiKey_p):
+        raw : Sequence[API.RawKey_d] = ()
+        if self._is_multi(type(obj)):
             raw = obj.data.raw
 
         for x in raw:
@@ -260,6 +286,41 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
         return None
     ##--| Utils
 
+    def resolve_mark(self, spec_mark:KeyMark, format_mark:Maybe[KeyMark]) -> KeyMark:
+        """ Choose between the mark of the class or kwargs, and the mark from the key's text """
+        mark : KeyMark
+        match spec_mark, format_mark:
+            case type() as x, _:
+                mark = x
+            case x, None:
+                mark = x
+            case x, y if x == y:
+                mark = x
+            case x, y if y == DKeyMark_e.null() and x != DKeyMark_e.multi():
+                assert(y is not None)
+                mark = y
+            case x, y if x is DKeyMark_e.default():
+                assert(y is not None)
+                mark = y
+            case str() as x, _ if x not in DKeyMark_e:
+                mark = x
+            case _, y:
+                assert(y is not None)
+                mark = y
+
+        return mark
+
+    def _multi_conflict(self, ctor:type, spec_mark:KeyMark, format_mark:Maybe[KeyMark]) -> bool:
+        return DKeyMark_e.multi() in [format_mark, spec_mark] and not self._is_multi(ctor)
+
+    def _is_multi(self, ctor:type) -> bool:
+        """ Runtime protocol checks are slow, so memoize them by type """
+        try:
+            return self._multi_types[ctor]
+        except KeyError:
+            self._multi_types[ctor] = issubclass(ctor, API.MultiKey_p)
+            return self._multi_types[ctor]
+
     def inspect_raw(self, raw_keys:Iterable[API.RawKey_d], kdata:dict) -> tuple[Maybe[str], Maybe[API.KeyMark]]:  # noqa: ARG002
         """ Take extracted keys of the text,
         and determine features of them.
@@ -342,6 +403,8 @@ class DKeyProcessor[T:API.Key_p](PreProcessor_p):
 
 
     def register_convert_param(self, cls:type[API.Key_p], convert:Maybe[str]) -> None:
+        # A new key type can change which ctor a simple key uses
+        self._simple_ctors.clear()
         match convert:
             case str() as x if x in self.convert_mapping:
                 msg = "Convert Mapping Already Registered"
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+import pathlib as pl
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from jgdv.structs.dkey import DKey
+from jgdv.structs.locator import JGDVLocator, Location
+from jgdv.structs.locator.errors import LocationExpansionError
+from jgdv.structs.locator.graph import LocationGraph
+
+logging = logmod.root
+
+def locations(**kwargs:str) -> dict[str, Location]:
+    return {k: Location(v) for k,v in kwargs.items()}
+
+@pytest.fixture(scope="function")
+def simple() -> JGDVLocator:
+    return JGDVLocator(pl.Path.cwd())
+
+##--|
+
+class TestLocationGraph:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        graph = LocationGraph()
+        assert(isinstance(graph, LocationGraph))
+        assert(not bool(graph))
+
+    @pytest.mark.parametrize(["text", "expected"], [
+        ("dir::>a/b", set()),
+        ("dir::>{a}", {"a"}),
+        ("dir::>{a}/b/{c}", {"a", "c"}),
+        ("dir::>{a}/{a}", {"a"}),
+        ("file::>{a!p}/c.txt", {"a"}),
+    ])
+    def test_dependencies(self, text, expected):
+        assert(LocationGraph.dependencies(Location(text)) == expected)
+
+    def test_get(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>a", b="dir::>{a}/b", c="file::>{b}/c.txt")
+        graph.update(locs, changed=locs.keys())
+        assert(graph.get("a") == pl.Path("a"))
+        assert(graph.get("c") == pl.Path("a/b/c.txt"))
+        assert(graph["b"] == pl.Path("a/b"))
+
+    def test_get_missing(self):
+        graph = LocationGraph()
+        assert(graph.get("a") is None)
+        assert(graph.get("a", "blah") == "blah")
+        with pytest.raises(KeyError):
+            graph["a"]
+
+    def test_lazy(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>a", b="dir::>{a}/b", c="dir::>c")
+        graph.update(locs, changed=locs.keys())
+        assert(not bool(graph._resolved))
+        graph.get("b")
+        assert(set(graph._resolved) == {"a", "b"})
+
+    def test_resolve_all(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>a", b="dir::>{a}/b", c="dir::>c")
+        graph.update(locs, changed=locs.keys())
+        graph.resolve_all()
+        assert(set(graph._resolved) == {"a", "b", "c"})
+
+    def test_unresolvable_gives_raw_path(self):
+        graph = LocationGraph()
+        locs  = locations(b="dir::>{a}/b")
+        graph.update(locs, changed=locs.keys())
+        assert(graph.resolve("b") is None)
+        assert(graph.get("b") == pl.Path("{a}/b"))
+
+    def test_cycle(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>{c}/a", b="dir::>{a}/b", c="dir::>{b}/c")
+        with pytest.raises(LocationExpansionError):
+            graph.update(locs, changed=locs.keys())
+
+    def test_self_cycle(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>{a}/a")
+        with pytest.raises(LocationExpansionError):
+            graph.update(locs, changed=locs.keys())
+
+    def test_cycle_leaves_graph_unchanged(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>a", b="dir::>{a}/b")
+        graph.update(locs, changed=locs.keys())
+        bad   = locs | locations(a="dir::>{b}/a")
+        with pytest.raises(LocationExpansionError):
+            graph.update(bad, changed=["a"])
+
+        assert(graph.get("b") == pl.Path("a/b"))
+
+    def test_incremental(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>a", b="dir::>{a}/b", c="dir::>{b}/c", d="dir::>d")
+        graph.update(locs, changed=locs.keys())
+        graph.resolve_all()
+        changed = locs | locations(b="dir::>{a}/other")
+        graph.update(changed, changed=["b"])
+        assert(set(graph._resolved) == {"a", "d"})
+        assert(graph.get("c") == pl.Path("a/other/c"))
+
+    def test_late_dependency(self):
+        graph = LocationGraph()
+        locs  = locations(b="dir::>{a}/b")
+        graph.update(locs, changed=locs.keys())
+        assert(graph.resolve("b") is None)
+        more = locs | locations(a="dir::>a")
+        graph.update(more, changed=["a"])
+        assert(graph.get("b") == pl.Path("a/b"))
+
+    def test_clear(self):
+        graph = LocationGraph()
+        locs  = locations(a="dir::>a", b="dir::>{a}/b")
+        graph.update(locs, changed=locs.keys())
+        graph.resolve_all()
+        graph.clear()
+        assert(not bool(graph))
+        assert(not bool(graph._resolved))
+        assert("a" not in graph)
+
+class TestLocator_Dependencies:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_deep_expansion(self, simple):
+        simple.update({f"l{i}": f"dir::>{{l{i-1}}}/d{i}" if i else "dir::>root" for i in range(10)})
+        target = pl.Path.cwd().joinpath("root", *(f"d{i}" for i in range(1, 10)), "file.txt")
+        assert(simple.expand("{l9}/file.txt") == target)
+
+    def test_update_cycle_fails(self, simple):
+        simple.update({"a": "dir::>a", "b": "dir::>{a}/b"})
+        with pytest.raises(LocationExpansionError):
+            simple.update({"a": "dir::>{b}/a"}, strict=False)
+
+        assert(simple.access("a") == "dir::>a")
+        assert(simple.expand("{b}") == pl.Path.cwd() / "a/b")
+
+    def test_overwrite_reexpands_dependents(self, simple):
+        simple.update({"a": "dir::>a", "b": "dir::>{a}/b"})
+        assert(simple.expand("{b}") == pl.Path.cwd() / "a/b")
+        simple.update({"a": "dir::>other"}, strict=False)
+        assert(simple.expand("{b}") == pl.Path.cwd() / "other/b")
+
+    def test_pre_expand(self, simple):
+        simple.update({"a": "dir::>a", "b": "dir::>{a}/b"})
+        simple.pre_expand()
+        assert(set(simple._graph._resolved) == {"a", "b"})
+
+    def test_get_is_unexpanded(self, simple):
+        simple.update({"a": "dir::>a", "b": "dir::>{a}/b"})
+        assert(simple.get("b") == pl.Path("{a}/b"))
+
+    def test_clear(self, simple):
+        simple.update({"a": "dir::>a", "b": "dir::>{a}/b"})
+        simple.pre_expand()
+        simple.clear()
+        assert(not bool(simple._graph))
+
+@pytest.mark.benchmark
+class TestLocationGraph_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_deep_hierarchy(self, simple):
+        """ Expanding keys at every level of a 30 deep hierarchy,
+        compared to recursively expanding against the locator itself
+        """
+        simple.update({f"l{i}": f"dir::>{{l{i-1}}}/d{i}" if i else "dir::>root" for i in range(30)})
+        keys = [f"{{l{i}}}/file.txt" for i in range(30)]
+        with Benchmark("Expanding keys of a deep hierarchy", count=len(keys)) as bench:
+            with bench.case("recursive"):
+                recursive = [DKey(x, ctor=pl.Path).expand(simple) for x in keys]
+
+            with bench.case("graph"):
+                graphed = [simple.expand(x, norm=False) for x in keys]
+
+        # Recursive expansion stops at its recursion limit, leaving deeper keys unexpanded
+        assert(recursive[:10] == graphed[:10])
+        assert(not any("{" in str(x) for x in graphed))
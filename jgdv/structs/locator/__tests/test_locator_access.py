@@ -18,6 +18,7 @@ from jgdv.structs.locator.errors import DirAbsent, LocationExpansionError, Locat
 from jgdv.structs.locator import JGDVLocator, Location
 from jgdv.structs.locator.locator import _LocatorGlobal
 from jgdv.structs.dkey import DKey, NonDKey
+from jgdv.testing.benchmark import Benchmark
 
 logging = logmod.root
 
@@ -241,3 +242,115 @@ class TestLocation_ExpansionConflict:
         assert("bloo" in simple)
         with pytest.raises(LocationError):
             simple['{bloo}/blah']
+
+class TestLocator_ExpansionCache:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_initial(self, simple):
+        info = simple.cache_info()
+        assert(info.hits == info.misses == info.currsize == 0)
+        assert(info.hit_rate == 0.0)
+
+    def test_repeat_expand_hits(self, simple):
+        target = pl.Path.cwd() / "a/b/c/blah"
+        simple.update({"bloo": "dir::>a/b/c"})
+        assert(simple['{bloo}/blah'] == target)
+        assert(simple.cache_info().misses == 1)
+        for _ in range(5):
+            assert(simple['{bloo}/blah'] == target)
+        else:
+            info = simple.cache_info()
+            assert(info.hits == 5)
+            assert(info.misses == 1)
+            assert(info.currsize == 1)
+
+    def test_keys_share_entries_by_text(self, simple):
+        simple.update({"bloo": "dir::>a/b/c"})
+        first = simple.expand("{bloo}")
+        assert(simple.expand(pl.Path("{bloo}")) is first)
+        assert(simple.cache_info().hits == 1)
+
+    def test_strict_and_norm_are_separate_entries(self, simple):
+        simple.update({"bloo": "dir::>a/b/c"})
+        simple.expand("{bloo}", strict=True)
+        simple.expand("{bloo}", strict=False)
+        assert(simple.expand("{bloo}", norm=False) == pl.Path("a/b/c"))
+        info = simple.cache_info()
+        assert(info.misses == 3)
+        assert(info.hits == 0)
+
+    def test_soft_failure_is_cached(self, simple):
+        assert(simple.expand("{missing}", strict=False) is None)
+        assert(simple.expand("{missing}", strict=False) is None)
+        assert(simple.cache_info().hits == 1)
+
+    def test_strict_failure_not_cached(self, simple):
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                simple.expand("{missing}", strict=True)
+        else:
+            assert(simple.cache_info().currsize == 0)
+
+    def test_update_invalidates(self, simple):
+        simple.update({"bloo": "dir::>a/b/c"})
+        assert(simple['{bloo}'] == pl.Path.cwd() / "a/b/c")
+        simple.update({"bloo": "dir::>d/e"}, strict=False)
+        assert(simple.cache_info().currsize == 0)
+        assert(simple['{bloo}'] == pl.Path.cwd() / "d/e")
+
+    def test_clear_invalidates(self, simple):
+        simple.update({"bloo": "dir::>a/b/c"})
+        simple['{bloo}']
+        simple.clear()
+        assert(simple.cache_info().currsize == 0)
+        assert(simple.expand("{bloo}", strict=False) is None)
+
+    def test_new_root_has_fresh_cache(self, simple, tmp_path):
+        simple.update({"bloo": "dir::>a/b/c"})
+        assert(simple['{bloo}'] == pl.Path.cwd() / "a/b/c")
+        rooted = simple(tmp_path)
+        assert(rooted.cache_info().currsize == 0)
+        assert(rooted['{bloo}'] == tmp_path.resolve() / "a/b/c")
+        assert(simple['{bloo}'] == pl.Path.cwd() / "a/b/c")
+
+    def test_cache_clear(self, simple):
+        simple.update({"bloo": "dir::>a/b/c"})
+        simple['{bloo}']
+        simple.cache_clear()
+        info = simple.cache_info()
+        assert(info.currsize == 0)
+        assert(info.misses == 1)
+
+    def test_bounded(self, simple):
+        simple._cache.maxsize = 3
+        simple.update({"bloo": "dir::>a/b/c"})
+        for i in range(5):
+            simple[f"{{bloo}}/{i}"]
+        else:
+            assert(simple.cache_info().currsize == 3)
+
+@pytest.mark.benchmark
+class TestLocator_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_repeat_expansion(self, simple):
+        simple.update({f"loc_{i}": f"dir::>a/{{loc_{i-1}}}/b" if i else "dir::>root" for i in range(12)})
+        keys    = [f"{{loc_{i}}}/file.txt" for i in range(12)]
+        with Benchmark("Locator expand", count=len(keys) * 5) as bench:
+            with bench.case("uncached"):
+                for _ in range(5):
+                    simple.cache_clear()
+                    for key in keys:
+                        simple[key]
+
+            with bench.case("cached"):
+                for _ in range(5):
+                    for key in keys:
+                        simple[key]
+
+        assert(bench["cached"] < bench["uncached"])
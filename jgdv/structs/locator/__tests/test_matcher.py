@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+import pathlib as pl
+import random
+
+import pytest
+
+from jgdv.testing.benchmark import Benchmark
+from jgdv.structs.locator import JGDVLocator, Location
+from jgdv.structs.locator.matcher import LocationMatcher
+
+logging = logmod.root
+
+ROOT = pl.Path("/root/proj")
+
+def build(*entries:tuple[str, str, bool]) -> LocationMatcher:
+    return LocationMatcher([(name, pl.Path(path), is_file) for name, path, is_file in entries], root=ROOT)
+
+##--|
+
+class TestLocationMatcher:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        matcher = build(("a", "a/b", False))
+        assert(isinstance(matcher, LocationMatcher))
+        assert(len(matcher) == 1)
+
+    def test_empty(self):
+        matcher = build()
+        assert(matcher.match(pl.Path("a/b")) == ())
+
+    def test_dir_contains(self):
+        matcher = build(("a", "a/b", False))
+        assert(matcher.match(pl.Path("a/b/c.py")) == ("a",))
+        assert(matcher.match(pl.Path("a/b/c/d/e.py")) == ("a",))
+
+    def test_dir_contains_itself(self):
+        matcher = build(("a", "a/b", False))
+        assert(matcher.match(pl.Path("a/b")) == ("a",))
+
+    def test_dir_miss(self):
+        matcher = build(("a", "a/b", False))
+        assert(matcher.match(pl.Path("a/c/b.py")) == ())
+        assert(matcher.match(pl.Path("a")) == ())
+
+    def test_file_exact(self):
+        matcher = build(("a", "a/b/c.py", True))
+        assert(matcher.match(pl.Path("a/b/c.py")) == ("a",))
+        assert(matcher.match(pl.Path("a/b/c.py/d")) == ())
+        assert(matcher.match(pl.Path("a/b")) == ())
+
+    @pytest.mark.parametrize(["loc", "path", "expected"], [
+        ("a/b/*.py",   "a/b/c.py",        True),
+        ("a/b/*.py",   "a/b/c.bib",       False),
+        ("a/b/c.*",    "a/b/c.py",        True),
+        ("a/b/c.*",    "a/b/d.py",        False),
+        ("a/*/c.py",   "a/b/c.py",        True),
+        ("a/*/c.py",   "a/b/d/c.py",      False),
+        ("a/b/c?.py",  "a/b/c1.py",       True),
+        ("a/b/c?.py",  "a/b/c12.py",      False),
+        ("a/**/c.py",  "a/c.py",          True),
+        ("a/**/c.py",  "a/b/d/c.py",      True),
+        ("a/**/c.py",  "a/b/d/e/f/c.py",  True),
+        ("a/**/c.py",  "b/b/c.py",        False),
+        ("**/c.py",    "a/b/d/e/f/c.py",  True),
+        ("**/*.*",     "a/b/d/e/f/c.py",  True),
+        ("**/*.*",     "a/b/d/e/f/c",     False),
+        ("a/[b]/c.py", "a/[b]/c.py",      True),
+        ("a/[b]/c.py", "a/b/c.py",        False),
+        ("a/[b]/*.py", "a/[b]/c.py",      True),
+    ])
+    def test_file_wildcards(self, loc, path, expected):
+        matcher = build(("loc", loc, True))
+        assert(bool(matcher.match(pl.Path(path))) is expected)
+
+    def test_wildcards_agree_with_location(self):
+        """ For same depth paths, the matcher agrees with Location.__contains__ """
+        locs  = ["a/b/*.py", "a/b/c.*", "a/*/c.py", "a/**/c.py", "**/c.py", "**/*.*"]
+        paths = ["a/b/c.py", "a/b/c.bib", "a/b/d.py", "a/e/c.py", "b/b/c.py"]
+        for loc in locs:
+            matcher   = build(("loc", loc, True))
+            location  = Location(f"file::>{loc}")
+            for path in paths:
+                assert(bool(matcher.match(pl.Path(path))) is (pl.Path(path) in location)), (loc, path)
+
+    def test_dir_wildcards(self):
+        matcher = build(("a", "a/*/docs", False), ("b", "a/**", False))
+        assert(matcher.match(pl.Path("a/b/docs/c.rst")) == ("a", "b"))
+        assert(matcher.match(pl.Path("a/b/src/c.py")) == ("b",))
+        assert(matcher.match(pl.Path("a")) == ("b",))
+
+    def test_multiple_matches_in_order(self):
+        matcher = build(("py", "**/*.py", True), ("src", "src", False), ("pkg", "src/pkg", False))
+        assert(matcher.match(pl.Path("src/pkg/c.py")) == ("py", "src", "pkg"))
+
+    def test_absolute_paths(self):
+        matcher = build(("a", "a/b", False), ("tmp", "/tmp/blah", False))
+        assert(matcher.match(ROOT / "a/b/c.py") == ("a",))
+        assert(matcher.match(pl.Path("/tmp/blah/c.py")) == ("tmp",))
+        assert(matcher.match(pl.Path("/other/a/b/c.py")) == ())
+
+    def test_tilde_paths(self):
+        matcher = build(("a", "~/a", False))
+        assert(matcher.match(pl.Path("~/a/b")) == ("a",))
+        assert(matcher.match(pl.Path("~/a/b").expanduser()) == ("a",))
+
+    def test_match_many(self):
+        matcher = build(("py", "**/*.py", True), ("src", "src", False))
+        paths   = [pl.Path(x) for x in ["src/a.py", "src/b.txt", "docs/c.py", "docs/d.rst"]]
+        result  = matcher.match_many(paths)
+        assert(result == [
+            (paths[0], ("py", "src")),
+            (paths[1], ("src",)),
+            (paths[2], ("py",)),
+            (paths[3], ()),
+        ])
+
+    def test_match_many_agrees_with_match(self):
+        matcher = build(("py", "**/*.py", True), ("src", "src/*", False), ("c", "src/a/c.*", True))
+        paths   = [pl.Path(f"src/{x}/{y}.{z}") for x in "ab" for y in "cd" for z in ["py", "txt"]]
+        assert(matcher.match_many(paths) == [(x, matcher.match(x)) for x in paths])
+
+    def test_transitions_bounded(self):
+        matcher = LocationMatcher([("py", pl.Path("**/*.py"), True)], root=ROOT, max_transitions=4)
+        for i in range(10):
+            assert(matcher.match(pl.Path(f"a{i}/b.py")) == ("py",))
+        else:
+            assert(matcher._transitions <= 4)
+
+    def test_states_bounded(self):
+        entries = [(f"d{i}", pl.Path(f"d{i}/*"), False) for i in range(20)]
+        matcher = LocationMatcher(entries, root=ROOT, max_transitions=4)
+        for i in range(20):
+            assert(matcher.match(pl.Path(f"d{i}/b.py")) == (f"d{i}",))
+            assert(len(matcher._states) <= 5)
+        else:
+            assert(matcher._start in matcher._states.values())
+
+class TestLocatorClassify:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_classify(self):
+        locs = JGDVLocator(ROOT)
+        locs.update({"src": "dir::>src", "py": "file::>**/*.py", "readme": "file::>README.md"})
+        assert(locs.classify(pl.Path("src/a/b.py")) == ("src", "py"))
+        assert(locs.classify(pl.Path("README.md")) == ("readme",))
+        assert(locs.classify(pl.Path("docs/a.rst")) == ())
+
+    def test_classify_expands_keys(self):
+        locs = JGDVLocator(ROOT)
+        locs.update({"src": "dir::>src", "data": "dir::>{src}/data", "cfg": "file::>{data}/*.toml"})
+        assert(locs.classify(pl.Path("src/data/a.toml")) == ("src", "data", "cfg"))
+        assert(locs.classify(pl.Path("src/b.toml")) == ("src",))
+
+    def test_classify_many(self):
+        locs  = JGDVLocator(ROOT)
+        locs.update({"src": "dir::>src"})
+        paths = [pl.Path("src/a"), pl.Path("b")]
+        assert(locs.classify_many(paths) == [(paths[0], ("src",)), (paths[1], ())])
+
+    def test_matcher_reused(self):
+        locs = JGDVLocator(ROOT)
+        locs.update({"src": "dir::>src"})
+        assert(locs.matcher() is locs.matcher())
+
+    def test_update_rebuilds(self):
+        locs = JGDVLocator(ROOT)
+        locs.update({"src": "dir::>src"})
+        first = locs.matcher()
+        locs.update({"docs": "dir::>docs"})
+        assert(locs.matcher() is not first)
+        assert(locs.classify(pl.Path("docs/a.rst")) == ("docs",))
+
+    def test_clear_rebuilds(self):
+        locs = JGDVLocator(ROOT)
+        locs.update({"src": "dir::>src"})
+        assert(locs.classify(pl.Path("src/a")) == ("src",))
+        locs.clear()
+        assert(locs.classify(pl.Path("src/a")) == ())
+
+    def test_new_root(self):
+        locs = JGDVLocator(ROOT)
+        locs.update({"src": "dir::>src"})
+        other = locs(pl.Path("/other"))
+        assert(other.classify(pl.Path("/other/src/a")) == ("src",))
+        assert(locs.classify(pl.Path("/other/src/a")) == ())
+
+@pytest.mark.benchmark
+class TestLocationMatcher_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_bulk_classify(self):
+        """ 100k paths against 500 locations,
+        compared to checking a sample of the paths against each location in turn
+        """
+        rand    = random.Random(0)
+        kinds   = ["dir::>proj{p}/d{i}", "file::>proj{p}/*/f{i}.*", "file::>proj{p}/**/*.ext{e}", "dir::>proj{p}/*/sub{i}"]
+        entries = {f"loc_{i}": kinds[i % 4].format(p=i % 50, i=i, e=i % 7) for i in range(500)}
+        paths   = [pl.Path(f"proj{rand.randrange(50)}/d{rand.randrange(500)}/sub{rand.randrange(500)}/f{rand.randrange(500)}.ext{rand.randrange(7)}")
+                   for _ in range(100_000)]
+        locs    = JGDVLocator(ROOT)
+        locs.update(entries)
+        sample     = paths[:20]
+        locations  = [Location(x) for x in entries.values()]
+        with Benchmark(f"Classify {len(paths)} paths over {len(locations)} locations") as bench:
+            with bench.case("compile"):
+                locs.matcher()
+
+            with bench.case("bulk"):
+                result = locs.classify_many(paths)
+
+            with bench.case("naive"):
+                for path in sample:
+                    for loc in locations:
+                        path in loc # noqa: B015
+
+            bench.note(naive_per_path=bench["naive"] / len(sample))
+
+        assert(len(result) == len(paths))
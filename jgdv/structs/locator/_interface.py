@@ -21,6 +21,7 @@ from uuid import UUID, uuid1
 from weakref import ref
 import atexit # for @atexit.register
 import faulthandler
+import typing
 # ##-- end stdlib imports
 
 from jgdv.structs.strang import _interface as StrangAPI # noqa: N812
@@ -65,6 +66,8 @@ logging = logmod.getLogger(__name__)
 LOC_SEP    : Final[str]   = "::>"
 LOC_SUBSEP : Final[str]   = "/"
 
+DEFAULT_LOC_CACHE_MAX : Final[int] = 256
+
 # Body:
 
 class WildCard_e(StrangAPI.StrangMarkAbstract_e):
@@ -107,6 +110,22 @@ LocationSections : Final[StrangAPI.Sections_d] = StrangAPI.Sections_d(
 )
 ##--|
 
+class LocatorCacheInfo_d(typing.NamedTuple):
+    """ Statistics of a Locator's expansion cache, in the style of functools' CacheInfo """
+    hits     : int
+    misses   : int
+    maxsize  : int
+    currsize : int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+##--|
+
 @runtime_checkable
 class Location_p(Strang_p, Protocol):
     """ Something which describes a file system location,
@@ -156,7 +175,7 @@ class Locator_p(Protocol):
 
     def __iter__(self) -> Generator[str|Key_p]: ...
 
-    def __call__(self, new_root:Maybe[pl.Path]=None) -> Locator_p: ...
+    def __call__(self, new_root:Maybe[pl.Path]=None, *, chdir:bool=True) -> Locator_p: ...
 
     def __enter__(self) -> Locator_p: ...
 
@@ -165,7 +184,20 @@ class Locator_p(Protocol):
     ##--| methods
     def clear(self) -> None: ...
 
+    def snapshot(self) -> Locator_p: ...
+
+    def install(self) -> Self: ...
+
     def update(self, extra:dict|Location_p|Locator_p, *, strict:bool=True) -> Self: ...
 
     def expand(self, key:Location_p|pl.Path|Key_p|str, *, strict:bool=True, norm:bool=True) -> Maybe[pl.Path]: ...
+
+    def cache_info(self) -> LocatorCacheInfo_d: ...
+
+    def cache_clear(self) -> None: ...
+
     def metacheck(self, key:str|Key_p, *meta:LocationMeta_e) -> bool: ...
+
+    def classify(self, path:pl.Path) -> tuple[str, ...]: ...
+
+    def classify_many(self, paths:Iterable[pl.Path]) -> list[tuple[pl.Path, tuple[str, ...]]]: ...
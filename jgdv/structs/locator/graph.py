@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+The Dependency graph of a Locator's entries.
+
+Locations reference each other by key, eg::
+
+    {"src": "dir::>src", "data": "dir::>{src}/data", "cfg": "file::>{data}/conf.toml"}
+
+Which forms a DAG of src -> data -> cfg.
+Entries are expanded once, in topological order, the first time they are needed.
+Updating an entry only drops the expansions of it and its descendants.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import pathlib as pl
+from collections.abc import Mapping
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import networkx as nx
+# ##-- end 3rd party imports
+
+# ##-- 1st party imports
+from jgdv.structs.dkey import DKey, MultiDKey, SingleDKey
+# ##-- end 1st party imports
+
+from .errors import LocationExpansionError
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, Generic, cast, assert_type, assert_never
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+   from . import _interface as API # noqa: N812
+   from jgdv import Maybe
+   from typing import Final
+   from typing import ClassVar, Any, LiteralString
+   from typing import Never, Self, Literal
+   from typing import TypeGuard
+   from collections.abc import Iterable, Iterator, Callable, Generator
+   from collections.abc import Sequence, MutableMapping, Hashable
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Body
+
+class LocationGraph(Mapping):
+    """ Tracks which locations an entry's path uses,
+    as edges of dependency -> dependent.
+
+    Acts as an expansion source, a mapping of name -> expanded path.
+    Entries which can't be expanded (eg: they use an unregistered key)
+    are given unexpanded, so key expansion can report them as before.
+    """
+    __slots__ = ("_graph", "_locations", "_resolved")
+    _graph      : nx.DiGraph
+    _locations  : Mapping[str|API.Key_p, API.Location_p]
+    _resolved   : dict[str, Maybe[pl.Path]]
+
+    def __init__(self) -> None:
+        self._graph      = nx.DiGraph()
+        self._locations  = {}
+        self._resolved   = {}
+
+    @override
+    def __contains__(self, key:object) -> bool:
+        return key in self._locations
+
+    @override
+    def __getitem__(self, key:str) -> pl.Path:
+        match self.get(key):
+            case None:
+                raise KeyError(key)
+            case x:
+                return x
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(map(str, self._locations))
+
+    @override
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    @staticmethod
+    def dependencies(loc:API.Location_p) -> set[str]:
+        """ The names of the locations used in a location's path """
+        text : str = loc[1,:]
+        if "{" not in text:
+            return set()
+
+        match DKey(text):
+            case MultiDKey() as key:
+                return {str(x) for x in key.keys()}
+            case SingleDKey() as key:
+                return {str(key)}
+            case _:
+                return set()
+
+    @override
+    def get(self, key:str, fallback:Maybe=None) -> Maybe[pl.Path]: # type: ignore[override]
+        """ Get the expanded path of an entry, expanding it and its dependencies if necessary """
+        if key not in self._locations:
+            return fallback
+
+        match self.resolve(key):
+            case None:
+                return self._locations[key].path
+            case pl.Path() as x:
+                return x
+            case x:
+                raise TypeError(type(x))
+
+    def update(self, locations:Mapping[str|API.Key_p, API.Location_p], changed:Iterable[str|API.Key_p]) -> None:
+        """ Set the locations, re-reading the dependencies of the changed entries.
+        Raises a LocationExpansionError, without modifying the graph, if a cycle would be created.
+        """
+        candidate  : nx.DiGraph = self._graph.copy()
+        stale      : set[str]   = set()
+        for name in map(str, changed):
+            candidate.remove_edges_from(list(candidate.in_edges(name)))
+            candidate.add_node(name)
+            candidate.add_edges_from((dep, name) for dep in self.dependencies(locations[name]))
+        else:
+            if not nx.is_directed_acyclic_graph(candidate):
+                cycle = [x for x, _ in nx.find_cycle(candidate)]
+                msg = "Location dependency cycle"
+                raise LocationExpansionError(msg, cycle)
+
+        for name in map(str, changed):
+            stale.add(name)
+            stale.update(nx.descendants(candidate, name))
+        else:
+            self._graph      = candidate
+            self._locations  = locations
+            for name in stale:
+                self._resolved.pop(name, None)
+
+    def clear(self) -> None:
+        self._graph.clear()
+        self._locations  = {}
+        self._resolved.clear()
+
+    def resolve(self, name:str) -> Maybe[pl.Path]:
+        """ Expand an entry, and the entries it depends on, in topological order.
+        Returns None if it can't be expanded
+        """
+        if name in self._resolved:
+            return self._resolved[name]
+
+        needed = nx.ancestors(self._graph, name)
+        needed.add(name)
+        for node in nx.topological_sort(self._graph.subgraph(needed)):
+            if node not in self._resolved:
+                self._resolved[node] = self._expand_entry(node)
+        else:
+            return self._resolved[name]
+
+    def resolve_all(self) -> None:
+        """ Expand every entry """
+        for node in nx.topological_sort(self._graph):
+            if node not in self._resolved:
+                self._resolved[node] = self._expand_entry(node)
+
+    def _expand_entry(self, name:str) -> Maybe[pl.Path]:
+        """ Expand a single entry, once its dependencies are expanded """
+        deps : dict[str, pl.Path] = {}
+        if name not in self._locations:
+            return None
+
+        loc = self._locations[name]
+        for dep in self._graph.predecessors(name):
+            match self._resolved.get(dep, None):
+                case None:
+                    return None
+                case pl.Path() as x:
+                    deps[dep] = x
+        else:
+            if not deps:
+                return loc.path
+
+        match DKey(loc[1,:], ctor=pl.Path).expand(deps):
+            case pl.Path() as x:
+                return x
+            case _:
+                return None
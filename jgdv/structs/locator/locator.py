@@ -37,6 +37,8 @@ Shorthands::
 from __future__ import annotations
 
 # ##-- stdlib imports
+import contextlib
+import contextvars
 import datetime
 import functools as ftz
 import itertools as itz
@@ -45,7 +47,7 @@ import os
 import pathlib as pl
 import re
 import typing
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from copy import deepcopy
 from re import Pattern
 from uuid import UUID, uuid1
@@ -62,9 +64,11 @@ from jgdv.structs.dkey import DKey, ExpInst_d, MultiDKey, NonDKey, SingleDKey
 # ##-- end 1st party imports
 
 from . import _interface as API  # noqa: N812
-from ._interface import Location_p, LocationMeta_e, Locator_p
+from ._interface import DEFAULT_LOC_CACHE_MAX, Location_p, LocationMeta_e, Locator_p, LocatorCacheInfo_d
 from .errors import DirAbsent, LocationError, LocationExpansionError
+from .graph import LocationGraph
 from .location import Location
+from .matcher import LocationMatcher
 
 # ##-- types
 # isort: off
@@ -97,6 +101,7 @@ logging = logmod.getLogger(__name__)
 ##-- end logging
 
 ##--| Vars
+_MISSING : Final[object] = object()
 
 ##--| Body
 
@@ -118,38 +123,44 @@ class SoftFailMultiDKey(MultiDKey, mark="soft.fail"):
             return targets
 
 class _LocatorGlobal:
-    """ A program global stack of locations.
-    Provides the enter/exit store for JGDVLocator objects
+    """ The stack of active locations.
+    Provides the enter/exit store for JGDVLocator objects.
+
+    The first locator created is the program wide base.
+    Entered locators are pushed onto a contextvar stack,
+    so threads and asyncio tasks each see their own stack on top of the base.
     """
 
-    _global_locs : ClassVar[list[Locator_p]] = []
+    _base        : ClassVar[Maybe[Locator_p]]                          = None
+    _stack       : ClassVar[contextvars.ContextVar[tuple[Locator_p, ...]]] = contextvars.ContextVar("LOCATOR_STACK", default=())
     _startup_cwd : ClassVar[pl.Path] = pl.Path.cwd()
 
     @staticmethod
     def stacklen() -> int:
-        return len(_LocatorGlobal._global_locs)
+        base = 0 if _LocatorGlobal._base is None else 1
+        return base + len(_LocatorGlobal._stack.get())
 
     @staticmethod
     def peek() -> Maybe[Locator_p]:
-        match _LocatorGlobal._global_locs:
-            case []:
-                return None
+        match _LocatorGlobal._stack.get():
             case [*_, x]:
                 return x
             case _:
-                return None
+                return _LocatorGlobal._base
+
+    @staticmethod
+    def set_base(locs:Locator_p) -> None:
+        _LocatorGlobal._base = locs
 
     @staticmethod
     def push(locs:Locator_p) -> None:
-        _LocatorGlobal._global_locs.append(locs)
+        _LocatorGlobal._stack.set((*_LocatorGlobal._stack.get(), locs))
 
     @staticmethod
     def pop() -> Maybe[Locator_p]:
-        match _LocatorGlobal._global_locs:
-            case []:
-                return None
+        match _LocatorGlobal._stack.get():
             case [*xs, x]:
-                _LocatorGlobal._global_locs = xs
+                _LocatorGlobal._stack.set(tuple(xs))
                 return x
             case _:
                 return None
@@ -160,17 +171,77 @@ class _LocatorGlobal:
         """
         return _LocatorGlobal.peek()
 
+class LocatorCache:
+    """ A Bounded, LRU cache of a Locator's expanded paths.
+
+    Keyed on (the coerced key text, strict, norm).
+    Failed non-strict expansions (ie: None) are cached as well.
+    The owning Locator clears it whenever its locations change.
+    """
+    __slots__ = ("_data", "hits", "maxsize", "misses")
+    _data    : OrderedDict[tuple[str, bool, bool], Maybe[pl.Path]]
+    hits     : int
+    misses   : int
+    maxsize  : int
+
+    def __init__(self, *, maxsize:int=DEFAULT_LOC_CACHE_MAX) -> None:
+        assert(0 < maxsize), maxsize
+        self._data    = OrderedDict()
+        self.maxsize  = maxsize
+        self.hits     = 0
+        self.misses   = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def lookup(self, cache_key:tuple[str, bool, bool]) -> tuple[bool, Maybe[pl.Path]]:
+        """ Returns (found, result) """
+        match self._data.get(cache_key, _MISSING):
+            case x if x is _MISSING:
+                self.misses += 1
+                return False, None
+            case x:
+                self.hits += 1
+                with contextlib.suppress(KeyError):
+                    # Another thread may have evicted it
+                    self._data.move_to_end(cache_key)
+                return True, cast("Maybe[pl.Path]", x)
+
+    def add(self, cache_key:tuple[str, bool, bool], result:Maybe[pl.Path]) -> None:
+        """ Store an expanded path, evicting the least recently used if necessary """
+        self._data[cache_key] = result
+        with contextlib.suppress(KeyError):
+            self._data.move_to_end(cache_key)
+            while self.maxsize < len(self._data):
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """ Drop all entries. The hit/miss counts are kept """
+        self._data.clear()
+
+    def info(self) -> LocatorCacheInfo_d:
+        return LocatorCacheInfo_d(self.hits, self.misses, self.maxsize, len(self._data))
+
 class _LocatorUtil_m:
 
     _data    : dict[str|API.Key_p, Location_p]
+    _cache   : LocatorCache
+    _graph   : LocationGraph
+    _matcher : Maybe[LocationMatcher]
+    _frozen  : bool
 
     def update(self, extra:dict|ChainGuard|Location_p|Locator_p, *, strict:bool=True) -> Self:
         """
           Update the registered locations with a dict, chainguard, or other dootlocations obj.
 
-        when strict=True (default), don't allow overwriting existing locations
+        when strict=True (default), don't allow overwriting existing locations.
+        Raises a LocationExpansionError if the new locations would depend on each other in a cycle
         """
         raw : dict[str|API.Key_p, Location_p]
+        if self._frozen:
+            msg = "Tried to update a frozen Locator"
+            raise LocationError(msg, extra)
+
         match extra: # unwrap to just a dict
             case dict():
                 pass
@@ -199,8 +270,11 @@ class _LocatorUtil_m:
                 msg = "Couldn't build a Location"
                 raise LocationError(msg, k, v) from None
 
+        self._graph.update(raw, changed=new_keys)
         logging.debug("Registered New Locations: %s", ", ".join(new_keys))
-        self._data = raw
+        self._data    = raw
+        self._matcher = None
+        self._cache.clear()
         return self
 
     def metacheck(self, key:str|API.Key_p, *meta:LocationMeta_e) -> bool:
@@ -258,17 +332,56 @@ class _LocatorUtil_m:
     def norm(self, path:pl.Path) -> pl.Path:
         return self.normalize(path)
 
+    def matcher(self) -> LocationMatcher:
+        """ Get the compiled matcher over all registered locations.
+        Built on first use, and rebuilt after the locator changes.
+        """
+        assert(hasattr(self, "expand"))
+        assert(hasattr(self, "root"))
+        entries  : list[tuple[str, pl.Path, bool]]
+        path     : pl.Path
+        if self._matcher is not None:
+            return self._matcher
+
+        entries = []
+        for name, loc in self._data.items():
+            match self.expand(loc, strict=False, norm=False):
+                case None:
+                    path = loc.path
+                case pl.Path() as path:
+                    pass
+                case x:
+                    raise TypeError(type(x))
+            if Location.Marks.earlycwd in loc:
+                path = LocationMatcher.absolute(path, root=_LocatorGlobal._startup_cwd)
+            entries.append((str(name), path, Location.Marks.file in loc))
+        else:
+            self._matcher = LocationMatcher(entries, root=self.root)
+            return self._matcher
+
+    def classify(self, path:pl.Path) -> tuple[str, ...]:
+        """ The names of the registered locations that path falls under.
+        eg: locs.classify(pl.Path("src/a/b.py")) -> ("src", "py_files")
+        """
+        return self.matcher().match(path)
+
+    def classify_many(self, paths:Iterable[pl.Path]) -> list[tuple[pl.Path, tuple[str, ...]]]:
+        """ classify, in bulk """
+        return self.matcher().match_many(paths)
+
     def pre_expand(self) -> None:
         """
         Called after updating the Locator,
-        it pre-expands any registered keys found in registered Locations
+        it pre-expands any registered keys found in registered Locations.
+        (Otherwise they are expanded on first use)
         """
-        # TODO
-        pass
+        self._graph.resolve_all()
 
 class _LocatorAccess_m:
 
     _data    : dict[str|API.Key_p, Location_p]
+    _cache   : LocatorCache
+    _graph   : LocationGraph
 
     def get(self, key:str|API.Key_p, fallback:Maybe[str|pl.Path]=None) -> Maybe[pl.Path]:
         """
@@ -315,44 +428,74 @@ class _LocatorAccess_m:
     def expand(self, key:str|API.Key_p|Location_p|pl.Path, *, strict:bool=True, norm:bool=True) -> Maybe[pl.Path]:
         """
         Access the locations mentioned in 'key',
-        join them together, and normalize it
+        join them together, and normalize it.
+
+        Results are cached per (key, strict, norm) until the locator is updated or cleared.
         """
         assert(hasattr(self, "expand"))
         assert(hasattr(self, "normalize"))
+        result     : Maybe[pl.Path]
+        text       : str
+        cache_key  : tuple[str, bool, bool]
 
         logging.debug("Locator Expand: %s", key)
-        coerced : API.Key_p = self._coerce_key(key, strict=strict)
-        match coerced.expand(self):
+        text       = self._coerce_text(key)
+        cache_key  = (text, strict, norm)
+        match self._cache.lookup(cache_key):
+            case True, result:
+                return result
+            case _:
+                pass
+
+        coerced : API.Key_p = self._coerce_key(text, strict=strict)
+        # Registered locations are expanded through their dependency graph
+        match coerced.expand(self._graph):
             case None if strict:
                 msg = "Strict Expansion of Location failed"
                 raise KeyError(msg, key)
             case None:
-                return None
+                result = None
             case pl.Path() as x if norm:
-                return self.normalize(x)
+                result = self.normalize(x)
             case pl.Path() as x:
-                return x
+                result = x
             case x:
                 msg = "Unknown Response When Expanding Location"
                 raise TypeError(msg, key, x)
 
-    def _coerce_key(self, key:str|pl.Path|API.Key_p|Location_p, *, strict:bool=False) -> API.Key_p:
-        """ Coerces a key to a MultiDKey for expansion using DKey's expansion mechanism,
-        using self as the source
+        self._cache.add(cache_key, result)
+        return result
+
+    def cache_info(self) -> LocatorCacheInfo_d:
+        """ Hits and misses of the expansion cache """
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """ Drop cached expansions,
+        eg: if the filesystem has changed where symlinks are resolved.
         """
+        self._cache.clear()
+
+    def _coerce_text(self, key:str|pl.Path|API.Key_p|Location_p) -> str:
+        """ Get the text of a key to expand """
         match key:
             case Location():
-                current = key[1,:]
+                return key[1,:]
             case DKey():
-                current = f"{key:w}"
+                return f"{key:w}"
             case str():
-                current = key
+                return key
             case pl.Path():
-                current = str(key)
+                return str(key)
             case _:
                 msg = "Can't perform initial coercion of key"
                 raise TypeError(msg, key)
 
+    def _coerce_key(self, key:str|pl.Path|API.Key_p|Location_p, *, strict:bool=False) -> API.Key_p:
+        """ Coerces a key to a MultiDKey for expansion using DKey's expansion mechanism,
+        using self as the source
+        """
+        current = self._coerce_text(key)
         match strict:
             case False:
                 return cast("API.Key_p", DKey['soft.fail'](current, ctor=pl.Path))
@@ -362,7 +505,7 @@ class _LocatorAccess_m:
 ##--|
 
 @Proto(Locator_p)
-@Mixin(_LocatorAccess_m, _LocatorUtil_m, PathManip_m)
+@Mixin(_LocatorAccess_m, _LocatorUtil_m, PathManip_m, silent=True)
 class JGDVLocator(Mapping):
     """
       A managing context for storing and converting Locations to Paths.
@@ -372,7 +515,9 @@ class JGDVLocator(Mapping):
       (or the cwd at program start if the Location has the earlycwd flag)
 
       Can be used as a context manager to expand from a temp different root.
-      In which case the current global loc store is at JGDVLocator.Current
+      In which case the current global loc store is at JGDVLocator.Current.
+      (Each thread and asyncio task has its own stack of entered locators)
+      For worker threads and processes, use locator.snapshot()
 
       Locations are of the form:
       key = "meta/vars::path/to/dir/or/file.ext"
@@ -389,19 +534,30 @@ class JGDVLocator(Mapping):
 
     _root     : pl.Path
     _data     : dict[str|API.Key_p, Location_p]
+    _cache    : LocatorCache
+    _graph    : LocationGraph
+    _matcher  : Maybe[LocationMatcher]
     _loc_ctx  : Maybe[Locator_p]
+    _chdir    : bool
+    _frozen   : bool
 
-    access    : Callable
-    expand    : Callable
-    update    : Callable
+    access      : Callable
+    expand      : Callable
+    pre_expand  : Callable
+    update      : Callable
 
-    def __init__(self, root:pl.Path) -> None:
+    def __init__(self, root:pl.Path, *, chdir:bool=True) -> None:
         self._root    = root.expanduser().resolve()
         self._data    = {}
+        self._cache   = LocatorCache()
+        self._graph   = LocationGraph()
+        self._matcher = None
         self._loc_ctx = None
+        self._chdir   = chdir
+        self._frozen  = False
         match self.Current:
             case None:
-                _LocatorGlobal.push(cast("API.Locator_p", self))
+                _LocatorGlobal.set_base(cast("API.Locator_p", self))
             case JGDVLocator():
                 pass
 
@@ -471,29 +627,94 @@ class JGDVLocator(Mapping):
         """ Iterate over the registered location names """
         return iter(self._data.keys()) # type: ignore[arg-type]
 
-    def __call__(self, new_root:Maybe[pl.Path]=None) -> JGDVLocator:
-        """ Create a copied locations object, with a different root """
-        new_obj = JGDVLocator(new_root or self._root)
+    def __call__(self, new_root:Maybe[pl.Path]=None, *, chdir:bool=True) -> JGDVLocator:
+        """ Create a copied locations object, with a different root.
+        The copy starts with an empty expansion cache.
+
+        The cwd is process wide, so use chdir=False for a copy to be entered
+        from a worker thread or asyncio task.
+        """
+        new_obj = JGDVLocator(new_root or self._root, chdir=chdir)
         return new_obj.update(self)
 
     def __enter__(self) -> API.Locator_p:
-        """ replaces the global doot.locs with this locations obj,
-        and changes the system root to wherever this locations obj uses as root
+        """ replaces the current locations obj of this context with this one,
+        and (unless chdir=False) changes the system root to wherever this locations obj uses as root
         """
         _LocatorGlobal.push(cast("API.Locator_p", self))
-        os.chdir(self._root)
+        if self._chdir:
+            os.chdir(self._root)
         assert(self.Current is not None)
         return self.Current
 
     def __exit__(self, exc_type:Maybe[type[Exception]], exc_value:Maybe[Exception], exc_traceback:Maybe[Traceback]) -> Literal[False]:
-        """ returns the global state to its original, """
+        """ returns the context's state to its original, """
         _LocatorGlobal.pop()
-        assert(self.Current is not None)
-        os.chdir(cast("pl.Path", self.Current._root))
+        match self.Current:
+            case None:
+                pass
+            case x if self._chdir:
+                os.chdir(cast("pl.Path", x._root))
         return False
 
+    @override
+    def __getstate__(self) -> dict:
+        """ Pickle only the root and locations, caches are rebuilt on use """
+        return {
+            "root"      : self._root,
+            "locations" : {str(k): str(v) for k,v in self._data.items()},
+            "chdir"     : self._chdir,
+            "frozen"    : self._frozen,
+        }
+
+    def __setstate__(self, state:dict) -> None:
+        """ Unpickled locators are not registered as the base locator, see install """
+        self._root    = state["root"]
+        self._data    = {}
+        self._cache   = LocatorCache()
+        self._graph   = LocationGraph()
+        self._matcher = None
+        self._loc_ctx = None
+        self._chdir   = state["chdir"]
+        self._frozen  = False
+        self.update(state["locations"])
+        if state["frozen"]:
+            self._graph.resolve_all()
+            self._frozen = True
+
+    def snapshot(self) -> JGDVLocator:
+        """ A read-only copy, to hand to worker threads or pickle to worker processes.
+        Its entries are pre-expanded, and entering it doesn't change the cwd.
+        update and clear raise a LocationError.
+        """
+        new_obj = self(chdir=False)
+        new_obj.pre_expand()
+        new_obj._frozen = True
+        return new_obj
+
+    def install(self) -> Self:
+        """ Make this the process wide base locator.
+        eg: in a worker process's initializer, with a snapshot passed to it::
+
+            ProcessPoolExecutor(initializer=install_locs, initargs=(pickle.dumps(locs.snapshot()),))
+
+        """
+        _LocatorGlobal.set_base(cast("API.Locator_p", self))
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
     def clear(self) -> None:
+        if self._frozen:
+            msg = "Tried to clear a frozen Locator"
+            raise LocationError(msg)
+
         self._data.clear()
+        self._graph.clear()
+        self._matcher = None
+        self._cache.clear()
 
     @property
     def root(self) -> pl.Path:
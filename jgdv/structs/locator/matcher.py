@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+A Compiled matcher of paths against many Locations at once.
+
+Locations are merged into a trie on their path parts,
+where parts can be literal, a glob ('*.py', 'c.?'), or a rec_glob ('**').
+Matching a path walks the trie once, instead of checking every location in turn::
+
+    matcher = LocationMatcher([("src", pl.Path("/a/src"), False),
+                               ("py",  pl.Path("/a/**/*.py"), True)],
+                              root=pl.Path("/a"))
+    matcher.match(pl.Path("src/b.py"))      # ("src", "py")
+    matcher.match_many(paths)               # [(path, names)]
+
+A directory location matches itself and everything under it.
+A file location only matches a whole path.
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import fnmatch
+import logging as logmod
+import re
+# ##-- end stdlib imports
+
+from . import _interface as API # noqa: N812
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, Generic, cast, assert_type, assert_never
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+   import pathlib as pl
+   from jgdv import Maybe
+   from typing import Final
+   from typing import ClassVar, Any, LiteralString
+   from typing import Never, Self, Literal
+   from typing import TypeGuard
+   from collections.abc import Iterable, Iterator, Callable, Generator
+   from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+   type MatchEntry = tuple[str, pl.Path, bool]
+
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+##--| Vars
+GLOB_CHARS                     : Final[tuple[str, ...]]  = (API.WildCard_e.glob, API.WildCard_e.select)
+DEFAULT_MATCH_TRANSITIONS_MAX  : Final[int]              = 65_536
+
+##--| Body
+
+class _MatchNode:
+    """ A Node of the trie. Children are split by how they match a part.
+    A rec node consumes any number of parts, including none.
+    """
+    __slots__ = ("dirs", "files", "is_rec", "literal", "patterns", "rec")
+    literal   : dict[str, _MatchNode]
+    patterns  : dict[str, tuple[re.Pattern, _MatchNode]]
+    rec       : Maybe[_MatchNode]
+    dirs      : list[int]
+    files     : list[int]
+    is_rec    : bool
+
+    def __init__(self, *, is_rec:bool=False) -> None:
+        self.literal   = {}
+        self.patterns  = {}
+        self.rec       = None
+        self.dirs      = []
+        self.files     = []
+        self.is_rec    = is_rec
+
+    def child(self, part:str) -> _MatchNode:
+        """ Get or create the child for a part of a location's path """
+        match part:
+            case API.WildCard_e.rec_glob:
+                if self.rec is None:
+                    self.rec = _MatchNode(is_rec=True)
+                return self.rec
+            case str() if any(x in part for x in GLOB_CHARS):
+                if part not in self.patterns:
+                    # Only * and ? are wildcards in locations
+                    pattern = re.compile(fnmatch.translate(part.replace("[", "[[]")))
+                    self.patterns[part] = (pattern, _MatchNode())
+                return self.patterns[part][1]
+            case str():
+                if part not in self.literal:
+                    self.literal[part] = _MatchNode()
+                return self.literal[part]
+            case x:
+                raise TypeError(type(x))
+
+class _MatchState:
+    """ A State of the lazily built automaton: a set of active trie nodes,
+    and the directory locations passed through to reach them.
+    Transitions are cached by part.
+    """
+    __slots__ = ("dirs", "next", "nodes", "result")
+    nodes   : tuple[_MatchNode, ...]
+    dirs    : frozenset[int]
+    next    : dict[str, _MatchState]
+    result  : Maybe[tuple[str, ...]]
+
+    def __init__(self, nodes:tuple[_MatchNode, ...], dirs:frozenset[int]) -> None:
+        self.nodes   = nodes
+        self.dirs    = dirs
+        self.next    = {}
+        self.result  = None
+
+class LocationMatcher:
+    """ Classify paths by which of a set of locations they fall under.
+
+    Built from (name, absolute path, is_file) entries,
+    relative paths to match are made absolute against root.
+    Paths are compared as given, they are not resolved against the filesystem.
+
+    Sets of trie nodes are turned into states on demand, with their transitions cached,
+    so a part is only matched against globs the first time it is seen from a state.
+    Up to max_transitions are cached before they, and the states they reached, are dropped.
+    """
+    __slots__ = ("_max_transitions", "_names", "_root", "_start", "_states", "_transitions", "_trie")
+    _names            : tuple[str, ...]
+    _root             : pl.Path
+    _trie             : _MatchNode
+    _start            : _MatchState
+    _states           : dict[tuple[frozenset[int], frozenset[int]], _MatchState]
+    _transitions      : int
+    _max_transitions  : int
+
+    def __init__(self, entries:Iterable[MatchEntry], *, root:pl.Path, max_transitions:int=DEFAULT_MATCH_TRANSITIONS_MAX) -> None:
+        assert(0 < max_transitions), max_transitions
+        names : list[str] = []
+        self._root             = root
+        self._trie             = _MatchNode()
+        self._states           = {}
+        self._transitions      = 0
+        self._max_transitions  = max_transitions
+        for i, (name, path, is_file) in enumerate(entries):
+            names.append(name)
+            node = self._trie
+            for part in self.absolute(path, root=root).parts:
+                node = node.child(part)
+            else:
+                match is_file:
+                    case True:
+                        node.files.append(i)
+                    case False:
+                        node.dirs.append(i)
+        else:
+            self._names  = tuple(names)
+            self._start  = self._state(self._closure([self._trie]), frozenset())
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def absolute(path:pl.Path, *, root:pl.Path) -> pl.Path:
+        """ Make a path absolute, without touching the filesystem """
+        match path.parts:
+            case ["~", *_]:
+                return path.expanduser()
+            case _ if path.is_absolute():
+                return path
+            case _:
+                return root / path
+
+    def match(self, path:pl.Path) -> tuple[str, ...]:
+        """ The names of the locations that path falls under, in registration order """
+        state = self._start
+        for part in self._parts(path):
+            state = self._advance(state, part)
+        else:
+            return self._finish(state)
+
+    def match_many(self, paths:Iterable[pl.Path]) -> list[tuple[pl.Path, tuple[str, ...]]]:
+        """ Match many paths in one pass, as (path, names) pairs in the order given.
+        (Pairs rather than a dict, as hashing paths costs more than matching them)
+        """
+        results : list[tuple[pl.Path, tuple[str, ...]]] = []
+        for path in paths:
+            state = self._start
+            for part in self._parts(path):
+                state = self._advance(state, part)
+            else:
+                results.append((path, self._finish(state)))
+        else:
+            return results
+
+    ##--| internal
+
+    def _parts(self, path:pl.Path) -> tuple[str, ...]:
+        """ The parts of the absolute path, avoiding building a new path where possible """
+        match path.parts:
+            case ["~", *_]:
+                return path.expanduser().parts
+            case parts if path.is_absolute():
+                return parts
+            case parts:
+                return self._root.parts + parts
+
+    def _state(self, nodes:tuple[_MatchNode, ...], dirs:frozenset[int]) -> _MatchState:
+        """ Get the unique state for a set of nodes """
+        key = (frozenset(id(x) for x in nodes), dirs)
+        if key not in self._states:
+            self._states[key] = _MatchState(nodes, dirs)
+        return self._states[key]
+
+    def _advance(self, state:_MatchState, part:str) -> _MatchState:
+        """ Consume a part from every active node of a state.
+        Directory locations reached stay matched for the rest of the path.
+        """
+        found : list[_MatchNode]
+        if not state.nodes:
+            return state
+        if part in state.next:
+            return state.next[part]
+
+        found = []
+        for node in state.nodes:
+            if node.is_rec:
+                found.append(node)
+            if part in node.literal:
+                found.append(node.literal[part])
+            for pattern, child in node.patterns.values():
+                if pattern.match(part):
+                    found.append(child)
+        else:
+            nodes = self._closure(found)
+
+        dirs = state.dirs
+        if (reached:=[x for node in nodes for x in node.dirs]):
+            dirs = dirs.union(reached)
+
+        if self._max_transitions <= self._transitions:
+            self._reset_transitions()
+
+        result              = self._state(nodes, dirs)
+        state.next[part]    = result
+        self._transitions  += 1
+        return result
+
+    def _reset_transitions(self) -> None:
+        """ Drop every transition, and every state but the start.
+        States are only reached by transitions, so this bounds them too.
+        """
+        for state in self._states.values():
+            state.next.clear()
+        else:
+            start_key           = (frozenset(id(x) for x in self._start.nodes), self._start.dirs)
+            self._states        = {start_key: self._start}
+            self._transitions   = 0
+
+    def _closure(self, nodes:Iterable[_MatchNode]) -> tuple[_MatchNode, ...]:
+        """ Add the rec nodes reachable without consuming a part """
+        seen    : dict[int, _MatchNode] = {}
+        queue   : list[_MatchNode]      = list(nodes)
+        while queue:
+            node = queue.pop()
+            if id(node) in seen:
+                continue
+            seen[id(node)] = node
+            if node.rec is not None:
+                queue.append(node.rec)
+        else:
+            return tuple(seen.values())
+
+    def _finish(self, state:_MatchState) -> tuple[str, ...]:
+        if state.result is None:
+            matched = set(state.dirs)
+            for node in state.nodes:
+                matched.update(node.files)
+            else:
+                state.result = tuple(self._names[i] for i in sorted(matched))
+
+        return state.result
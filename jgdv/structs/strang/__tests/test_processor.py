@@ -289,6 +289,31 @@ class TestStrang_Process:
         assert(isinstance(ang.data.uuid, UUID))
 
 
+    def test_scan_sections(self):
+        ing                    = "a.b.c::d.e.f"
+        obj                    = StrangBasicProcessor()
+        base                   = Strang(ing)
+        secs, words, sec_words = obj._scan_sections(base, Strang._sections)
+        assert([ing[x] for x in secs] == ["a.b.c", "d.e.f"])
+        assert([ing[x] for x in words] == ["a", "b", "c", "d", "e", "f"])
+        assert(sec_words == ((0, 1, 2), (3, 4, 5)))
+
+    def test_scan_sections_empty_words(self):
+        ing                    = "a..b::c..d"
+        obj                    = StrangBasicProcessor()
+        base                   = Strang(ing)
+        _, words, sec_words    = obj._scan_sections(base, Strang._sections)
+        assert([ing[x] for x in words] == ["a", "", "b", "c", "", "d"])
+        assert(sec_words == ((0, 1, 2), (3, 4, 5)))
+
+    def test_scan_sections_stops_at_args(self):
+        ing                    = "a.b::c.d[blah]"
+        obj                    = StrangBasicProcessor()
+        base                   = Strang(ing)
+        secs, words, _         = obj._scan_sections(base, Strang._sections)
+        assert(ing[secs[-1]] == "c.d")
+        assert([ing[x] for x in words] == ["a", "b", "c", "d"])
+
 class TestStrang_PostProcess_UUIDs:
 
     def test_sanity(self):
@@ -91,3 +91,32 @@ class TestSec_d:
     def test_contains_type_union_fail(self):
         obj = API.Sec_d("test", ".", "::", str|int|list, API.DefaultBodyMarks_e, True, idx=0)
         assert(str|int|float not in obj)
+
+class TestSections_d:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_compiled_seps(self):
+        obj = API.Sections_d(
+            ("first", ".", "::", str, None, True),
+            ("second", "/", ":|:", str, None, False),
+            ("third", ".", None, str, None, True),
+        )
+        assert(obj.seps == ((".", "::"), ("/", ":|:"), (".", None)))
+        assert(obj.required_ends == ("::",))
+
+    def test_compiled_clean_rx(self):
+        obj = API.Sections_d(
+            ("first", ".", "::", str, None, True),
+            ("second", "/", None, str, None, True),
+        )
+        assert(obj.clean_rx is not None)
+        assert(obj.clean_rx.sub(obj.clean_sep, "a....b") == "a..b")
+
+    def test_no_case_no_clean_rx(self):
+        obj = API.Sections_d(
+            ("first", None, None, str, None, True),
+        )
+        assert(obj.clean_rx is None)
+        assert(obj.clean_sep == "")
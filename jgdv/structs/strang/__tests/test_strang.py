@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import uuid
 import logging as logmod
+import tracemalloc
 import pathlib as pl
 from types import GenericAlias
 from typing import (Any, Annotated, ClassVar, Generic, TypeAlias,
@@ -21,6 +22,7 @@ from .. import _interface as API  # noqa: N812
 from ..errors import StrangError
 from ..strang import Strang
 from ..processor import StrangBasicProcessor
+from jgdv.testing.benchmark import Benchmark
 
 ##--|
 logging  = logmod.root
@@ -499,6 +501,28 @@ class TestStrang_Hash:
         assert(str(obj) is not str(obj2))
         assert(hash(obj) != hash(obj2))
 
+    def test_hash_is_cached(self):
+        obj = Strang("head::tail.a.b.c")
+        assert(obj._hash is not None)
+        assert(hash(obj) == obj._hash)
+
+    def test_plain_strang_has_no_expanded_copy(self):
+        obj = Strang("head::tail.a.b.c")
+        assert(obj._expanded is None)
+        assert(obj._canonical() is obj)
+
+    def test_uuid_strang_caches_expanded(self):
+        obj = Strang("head::tail.a.b.<uuid>")
+        assert(isinstance(obj._expanded, str))
+        assert(obj._canonical() == str(obj))
+        assert(hash(obj) == hash(str(obj)))
+
+    def test_dict_lookup_by_str(self):
+        obj    = Strang("head::tail.a.b.c")
+        data   = {obj: 1}
+        assert(data["head::tail.a.b.c"] == 1)
+        assert(data[Strang("head::tail.a.b.c")] == 1)
+
 class TestStrang_LT:
 
     def test_sanity(self):
@@ -1569,3 +1593,293 @@ class TestStrang_Args:
                 assert(True)
             case x:
                 assert(False), x
+
+class TestStrang_Interning:
+
+    @pytest.fixture(scope="function")
+    def interned(self):
+
+        class InternedStrang(Strang):
+            __slots__ = ()
+
+        InternedStrang.enable_interning(maxsize=3)
+        yield InternedStrang
+        InternedStrang.disable_interning()
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_not_interned_by_default(self):
+        assert(Strang.intern_info() is None)
+        assert(Strang("head::a.b.c") is not Strang("head::a.b.c"))
+
+    def test_interned(self, interned):
+        obj1 = interned("head::a.b.c")
+        obj2 = interned("head::a.b.c")
+        assert(obj1 is obj2)
+        assert(obj1 == "head::a.b.c")
+        assert(obj1.shape == (1, 3))
+
+    def test_counts(self, interned):
+        interned("head::a.b.c")
+        interned("head::a.b.c")
+        interned("head::a.b.d")
+        match interned.intern_info():
+            case (1, 2, 3, 2):
+                assert(True)
+            case x:
+                assert(False), x
+
+    def test_keyed_on_args(self, interned):
+        obj1 = interned("head::a")
+        obj2 = interned("head::a", "b")
+        assert(obj1 is not obj2)
+        assert(obj2 == "head::a.b")
+        assert(obj2 is interned("head::a", "b"))
+
+    def test_lru_eviction(self, interned):
+        first = interned("head::a")
+        for x in ["b", "c", "d"]:
+            interned(f"head::{x}")
+
+        assert(interned.intern_info().currsize == 3)
+        assert(interned("head::a") is not first)
+
+    def test_lru_recent_survives(self, interned):
+        first = interned("head::a")
+        interned("head::b")
+        interned("head::c")
+        assert(interned("head::a") is first)
+        interned("head::d")
+        assert(interned("head::a") is first)
+
+    def test_uuids_bypass(self, interned):
+        obj1 = interned("head::a.b.c[<uuid>]")
+        obj2 = interned("head::a.b.c[<uuid>]")
+        assert(obj1.uuid() != obj2.uuid())
+        assert(interned.intern_info().currsize == 0)
+
+    def test_uuid_kwarg_bypass(self, interned):
+        val = uuid.uuid1()
+        obj1 = interned("head::a.b.c[<uuid>]", uuid=val)
+        obj2 = interned("head::a.b.c[<uuid>]", uuid=val)
+        assert(obj1 is not obj2)
+        assert(obj1.uuid() == obj2.uuid())
+
+    def test_subclass_shares_interner(self, interned):
+
+        class SubInterned(interned):
+            __slots__ = ()
+
+        obj1 = SubInterned("head::a.b.c")
+        obj2 = interned("head::a.b.c")
+        assert(type(obj1) is SubInterned)
+        assert(type(obj2) is interned)
+        assert(obj1 is SubInterned("head::a.b.c"))
+
+    def test_clear(self, interned):
+        obj1 = interned("head::a.b.c")
+        interned._interner.clear()
+        assert(interned("head::a.b.c") is not obj1)
+        assert(interned.intern_info().misses == 1)
+
+class TestStrang_BuildMany:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        texts = ["head::a.b.c", "head::d.e.f", "other.head::g"]
+        match Strang.build_many(texts):
+            case [a, b, c], []:
+                assert(all(isinstance(x, Strang) for x in [a, b, c]))
+                assert([a, b, c] == texts)
+                assert(c.shape == (2, 1))
+            case x:
+                assert(False), x
+
+    def test_failures_reported_per_item(self):
+        texts = ["head::a.b.c", "bad", "head::d.e.f"]
+        match Strang.build_many(texts):
+            case [Strang(), None, Strang()], [(1, StrangError() as err)]:
+                assert("Pre-Process" in str(err))
+            case x:
+                assert(False), x
+
+    def test_matches_individual_construction(self):
+        texts = ["head::a..b.c[blah]", "head::d.e.$head$", "head.a::b.<int:5>"]
+        results, failures = Strang.build_many(texts)
+        assert(not bool(failures))
+        for text, built in zip(texts, results, strict=True):
+            single = Strang(text)
+            assert(built == single)
+            assert(built.data.words == single.data.words)
+            assert(built.data.meta == single.data.meta)
+            assert(built.args() == single.args())
+
+    def test_generator_input(self):
+        results, failures = Strang.build_many(f"head::a.{x}" for x in range(5))
+        assert(len(results) == 5)
+        assert(not bool(failures))
+
+    def test_subclass(self):
+
+        class SubStrang(Strang):
+            __slots__ = ()
+
+        results, _ = SubStrang.build_many(["head::a", "head::b"])
+        assert(all(type(x) is SubStrang for x in results))
+
+    def test_uses_interner(self):
+
+        class InternedStrang(Strang):
+            __slots__ = ()
+
+        InternedStrang.enable_interning()
+        first = InternedStrang("head::a.b")
+        results, _ = InternedStrang.build_many(["head::a.b", "head::a.b", "head::c"])
+        assert(results[0] is first)
+        assert(results[1] is first)
+        assert(InternedStrang.intern_info().hits == 2)
+
+class TestStrang_Compact:
+
+    @pytest.fixture(scope="function")
+    def compact(self):
+
+        class CompactStrang(Strang):
+            __slots__ = ()
+            _data_type : ClassVar = API.StrangCompact_d
+
+        return CompactStrang
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self, compact):
+        obj = compact("head.a::tail.b.c")
+        assert(isinstance(obj.data, API.StrangCompact_d))
+        assert(not hasattr(obj, "__dict__"))
+        assert(obj.shape == (2, 3))
+
+    def test_bounds_match_default(self, compact):
+        ing      = "a.b.c::d..e.f[blah]"
+        obj      = compact(ing)
+        default  = Strang(ing)
+        assert(obj.data.sections == default.data.sections)
+        assert(obj.data.words == default.data.words)
+        assert(obj.data.flat_idx == default.data.flat_idx)
+        assert([tuple(x) for x in obj.data.sec_words] == list(default.data.sec_words))
+
+    def test_section_slices(self, compact):
+        obj = compact("a.b.c::d.e.f")
+        match obj.data.sections:
+            case [slice(start=0, stop=5), slice(start=7, stop=12)]:
+                assert(True)
+            case x:
+                assert(False), x
+
+    def test_getitem(self, compact):
+        obj = compact("a.b.c::d.e.f.g")
+        assert(obj[0] == "a")
+        assert(obj[0,:] == "a.b.c")
+        assert(obj[1,-1] == "g")
+        assert(obj[1,0::2] == "d.f")
+        assert(obj[None, 1:3] == "b.c")
+        assert(obj[:,:] == "a.b.c::d.e.f.g")
+        assert(obj["body", 1] == "e")
+
+    def test_words(self, compact):
+        obj = compact("a.b.c::d.e.f")
+        assert(list(obj.words(1)) == ["d", "e", "f"])
+        assert(list(obj) == ["a", "b", "c", "d", "e", "f"])
+
+    def test_index(self, compact):
+        obj = compact("a.b.c::d.e.$head$.f")
+        assert(obj.index(1, 1) == 9)
+        assert(obj.index(API.DefaultBodyMarks_e.head) == 11)
+        assert(obj.rindex(1, -1) == 18)
+
+    def test_uuid(self, compact):
+        obj = compact("a.b.c::d.e.f[<uuid>]")
+        assert(isinstance(obj.uuid(), uuid.UUID))
+        assert(obj[:,:] == "a.b.c::d.e.f")
+        assert(obj.de_uniq() == "a.b.c::d.e.f")
+
+    def test_empty_section(self, compact):
+        obj = compact("::a.b")
+        default = Strang("::a.b")
+        assert(obj.data.sections == default.data.sections)
+        assert(obj.shape == default.shape)
+
+    def test_index_error(self, compact):
+        obj = compact("a.b.c::d.e.f")
+        with pytest.raises(IndexError):
+            obj.data.words[10]
+        with pytest.raises(IndexError):
+            obj.data.sec_words[2]
+
+@pytest.mark.benchmark
+class TestStrang_Benchmark:
+    """ Timings are logged, not asserted """
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_build_many_vs_loop(self):
+        texts = [f"group.a.b{i}::body.d.e.f.g{i}" for i in range(2_000)]
+        with Benchmark("Strang Construction", count=len(texts)) as bench:
+            with bench.case("loop"):
+                looped = []
+                for text in texts:
+                    try:
+                        looped.append(Strang(text))
+                    except StrangError:
+                        looped.append(None)
+
+            with bench.case("build_many"):
+                batched, _ = Strang.build_many(texts)
+
+        assert(looped == batched)
+
+    def test_compact_memory(self):
+        """ Compare the memory of Strang_d and StrangCompact_d instances """
+
+        class CompactStrang(Strang):
+            __slots__ = ()
+            _data_type : ClassVar = API.StrangCompact_d
+
+        count   = 2_000
+        texts   = [f"group.a.b.{i}::body.d.e.f.g.{i}" for i in range(count)]
+        only    = [tracemalloc.Filter(True, "*/structs/strang/*")] # noqa: FBT003
+        sizes   = {}
+        for cls in [Strang, CompactStrang]:
+            cls(texts[0])
+            tracemalloc.start()
+            before  = tracemalloc.take_snapshot().filter_traces(only)
+            built   = [cls(x) for x in texts]
+            after   = tracemalloc.take_snapshot().filter_traces(only)
+            tracemalloc.stop()
+            sizes[cls.__name__] = sum(x.size_diff for x in after.compare_to(before, "filename")) / count
+            del built
+
+        logging.info("Strang bytes per instance: default %s, compact %s", sizes["Strang"], sizes["CompactStrang"])
+        assert(sizes["CompactStrang"] < sizes["Strang"])
+
+    def test_dict_lookup(self):
+        """ Compare lookups with the cached hash, against re-hashing the expanded str each time """
+        keys    = [Strang(f"group.a.b{i}::body.d.e.f.g{i}") for i in range(500)]
+        table   = dict.fromkeys(keys, True)
+        hashes  = {str.__hash__(format(x, "a+")) : True for x in keys}
+        with Benchmark("Strang dict lookup", count=len(keys) * 20) as bench:
+            with bench.case("cached"):
+                for _ in range(20):
+                    for key in keys:
+                        assert(table[key])
+
+            with bench.case("uncached"):
+                for _ in range(20):
+                    for key in keys:
+                        assert(hashes[str.__hash__(format(key, "a+"))])
+
+        assert(bench["cached"] < bench["uncached"])
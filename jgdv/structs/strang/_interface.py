@@ -9,6 +9,7 @@ Describes the internal data structs:
 - Sec_d : A Single section spec
 - Sections_d : Collects the sec_d's. ClassVar
 - Strang_d : Instance data of a strang beyond the normal str's
+- StrangCompact_d : A memory compact alternative to Strang_d
 
 """
 # Imports:
@@ -26,6 +27,7 @@ import time
 import collections
 import contextlib
 import hashlib
+from array import array
 from copy import deepcopy
 from uuid import UUID, uuid1
 from weakref import ref
@@ -71,7 +73,7 @@ __all__ = ( # noqa: RUF022
 "WordIndex",
 # -- Classes
 "CodeRefHeadMarks_e", "DefaultBodyMarks_e", "DefaultHeadMarks_e",
-"Importable_p", "Sec_d", "Sections_d", "StrangFormatter_p", "StrangMarkAbstract_e",
+"Importable_p", "Sec_d", "Sections_d", "StrangCompact_d", "StrangFormatter_p", "StrangMarkAbstract_e",
 "StrangMod_p", "StrangUUIDs_p", "Strang_d", "Strang_p",
 
 )
@@ -95,6 +97,7 @@ INST_K        : Final[str]                        = "instanced"
 GEN_K         : Final[str]                        = "gen_uuid"
 STRGET        : Final[Callable]                   = str.__getitem__
 STRCON        : Final[Callable[[str,str], bool]]  = str.__contains__
+STRFIND       : Final[Callable[..., int]]         = str.find
 UUID_WORD     : Final[str]                        = "<uuid>"
 
 SEC_END_MSG   : Final[str]                        = "Only the last section has no end marker"
@@ -240,11 +243,21 @@ class Sections_d:
 
     Each Section is a Sec_d
     TODO add format conversion specs
+
+    Separators are compiled once, on construction, into:
+    - seps          : the (case, end) pairs of each section, in order
+    - required_ends : the end markers that must be present
+    - clean_rx      : a matcher of repeated case separators, with its replacement clean_sep
+
     """
-    __slots__ = ("named", "order", "types")
-    named  : Final[dict[str, int]]
-    order  : Final[tuple[Sec_d, ...]]
-    types  : type|UnionType
+    __slots__ = ("clean_rx", "clean_sep", "named", "order", "required_ends", "seps", "types")
+    named          : Final[dict[str, int]]
+    order          : Final[tuple[Sec_d, ...]]
+    types          : type|UnionType
+    seps           : Final[tuple[tuple[Maybe[str], Maybe[str]], ...]]
+    required_ends  : Final[tuple[str, ...]]
+    clean_rx       : Final[Maybe[Rx]]
+    clean_sep      : Final[str]
 
     def __init__(self, *sections:tuple|Sec_d) -> None:
         order : list[Sec_d] = []
@@ -261,6 +274,18 @@ class Sections_d:
             self.order = tuple(order)
             self.named = {x.name:i for i,x in  enumerate(self.order)}
 
+        # Precompute the separator data the processor uses to slice strangs
+        self.seps           = tuple((x.case, x.end) for x in self.order)
+        self.required_ends  = tuple(x.end for x in self.order if x.end is not None and x.required)
+        match self.order:
+            case [Sec_d(case=str() as sep), *_]:
+                clean_sep = sep * 2
+            case _:
+                clean_sep = ""
+
+        self.clean_sep  = clean_sep
+        self.clean_rx   = re.compile(f"{re.escape(clean_sep)}+") if bool(clean_sep) else None
+
     def __contains__(self, val:str) -> bool:
         return val in self.named
 
@@ -308,6 +333,140 @@ class Strang_d:
         self.meta        = ()
         self.uuid        = uuid
 
+    def set_bounds(self, sections:Sequence[slice], words:Sequence[slice], sec_words:Sequence[Sequence[int]]) -> None:
+        """ Set the section and word slices, as calculated by the processor """
+        self.sections   = tuple(sections)
+        self.words      = tuple(words)
+        self.sec_words  = tuple(tuple(x) for x in sec_words)
+        self.flat_idx   = tuple((i,j) for i,x in enumerate(self.sec_words) for j in range(len(x)))
+
+class _PackedSlices_d(collections.abc.Sequence):
+    """ A read-only view of (start, stop) pairs in a packed array, as slices """
+    __slots__ = ("_buf", "_len", "_offset", "_stride")
+
+    def __init__(self, buf:array, offset:int, length:int, stride:int) -> None:
+        self._buf     = buf
+        self._offset  = offset
+        self._len     = length
+        self._stride  = stride
+
+    @override
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, i:int) -> slice: ...
+
+    @overload
+    def __getitem__(self, i:slice) -> tuple[slice, ...]: ...
+
+    @override
+    def __getitem__(self, i:int|slice) -> slice|tuple[slice, ...]:
+        match i:
+            case int() if -self._len <= i < self._len:
+                pos = self._offset + (i % self._len) * self._stride
+                return slice(self._buf[pos], self._buf[pos+1])
+            case int():
+                raise IndexError(i)
+            case slice():
+                return tuple(self[x] for x in range(*i.indices(self._len)))
+            case x:
+                raise TypeError(type(x))
+
+    @override
+    def __eq__(self, other:object) -> bool:
+        match other:
+            case collections.abc.Sequence():
+                return tuple(self) == tuple(other)
+            case _:
+                return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+class _PackedRanges_d(_PackedSlices_d):
+    """ A read-only view of (first, count) pairs in a packed array, as ranges """
+    __slots__ = ()
+
+    @overload # type: ignore[override]
+    def __getitem__(self, i:int) -> range: ...
+
+    @overload
+    def __getitem__(self, i:slice) -> tuple[range, ...]: ...
+
+    @override
+    def __getitem__(self, i:int|slice) -> range|tuple[range, ...]:
+        match i:
+            case int() if -self._len <= i < self._len:
+                pos    = self._offset + (i % self._len) * self._stride
+                first  = self._buf[pos]
+                return range(first, first + self._buf[pos+1])
+            case int():
+                raise IndexError(i)
+            case slice():
+                return tuple(self[x] for x in range(*i.indices(self._len)))
+            case x:
+                raise TypeError(type(x))
+
+class StrangCompact_d:
+    """ A memory compact alternative to Strang_d, with the same accessors.
+
+    Section and word bounds are packed into a single array('I'),
+    instead of tuples of slices and index tuples::
+
+        [section count, (start, stop, first word, word count) per section, (start, stop) per word]
+
+    sections, words and sec_words are light views over the array,
+    producing slices and ranges on access.
+    Use it for a strang type by setting its _data_type ClassVar.
+    """
+    __slots__ = ("_bounds", "args", "args_start", "meta", "uuid")
+    _bounds     : array
+    args_start  : Maybe[int]
+    args        : Maybe[tuple]
+    meta        : tuple[Maybe, ...]
+    uuid        : Maybe[UUID]
+
+    def __init__(self, uuid:Maybe[UUID]=None) -> None:
+        self._bounds     = array("I", [0])
+        self.args_start  = None
+        self.args        = None
+        self.meta        = ()
+        self.uuid        = uuid
+
+    def set_bounds(self, sections:Sequence[slice], words:Sequence[slice], sec_words:Sequence[Sequence[int]]) -> None:
+        """ Pack section and word slices. Each section's words must be contiguous """
+        bounds = array("I", [len(sections)])
+        for sec, idxs in zip(sections, sec_words, strict=True):
+            first = idxs[0] if bool(idxs) else 0
+            assert(tuple(idxs) == tuple(range(first, first + len(idxs)))), idxs
+            bounds.extend((sec.start, sec.stop, first, len(idxs)))
+        else:
+            for word in words:
+                bounds.extend((word.start, word.stop))
+
+        self._bounds = bounds
+
+    @property
+    def sections(self) -> _PackedSlices_d:
+        return _PackedSlices_d(self._bounds, 1, self._bounds[0], 4)
+
+    @property
+    def sec_words(self) -> _PackedRanges_d:
+        return _PackedRanges_d(self._bounds, 3, self._bounds[0], 4)
+
+    @property
+    def words(self) -> _PackedSlices_d:
+        offset = 1 + 4 * self._bounds[0]
+        return _PackedSlices_d(self._bounds, offset, (len(self._bounds) - offset) // 2, 2)
+
+    @property
+    def flat_idx(self) -> tuple[tuple[int, int], ...]:
+        return tuple((i,j) for i,x in enumerate(self.sec_words) for j in range(len(x)))
+
 
 ##--| Default Section Specs
 HEAD_SEC             : Final[Sec_d]       = Sec_d("head", CASE_DEFAULT, END_DEFAULT, BODY_TYPES, DefaultHeadMarks_e, True)  # noqa: FBT003
@@ -60,18 +60,119 @@ logging = logmod.getLogger(__name__)
 ##-- end logging
 
 # Vars:
-StrMeta      : Final[type]  = type(str)
-HasDictFail  : Final[str]   = "The resulting strang has a __dict__. Set the subclass to have __slots__=()"
+StrMeta            : Final[type]  = type(str)
+HasDictFail        : Final[str]   = "The resulting strang has a __dict__. Set the subclass to have __slots__=()"
+DEFAULT_INTERN_MAX : Final[int]   = 2048
 # Body:
 
+class InternInfo_d(typing.NamedTuple):
+    """ Statistics of a StrangInterner, in the style of functools' CacheInfo """
+    hits     : int
+    misses   : int
+    maxsize  : int
+    currsize : int
+
+class StrangInterner:
+    """ A Bounded, LRU cache of constructed strangs.
+
+    Keyed on (cls, type(text), text, args, kwargs),
+    so repeated constructions of the same text return the same, already processed, instance.
+
+    Strangs with UUIDs are never stored, as each construction can generate a new uuid.
+    """
+    __slots__ = ("_data", "hits", "maxsize", "misses")
+    _data    : collections.OrderedDict[tuple, Strang_p]
+    hits     : int
+    misses   : int
+    maxsize  : int
+
+    def __init__(self, *, maxsize:int=DEFAULT_INTERN_MAX) -> None:
+        assert(0 < maxsize), maxsize
+        self._data    = collections.OrderedDict()
+        self.maxsize  = maxsize
+        self.hits     = 0
+        self.misses   = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def key_for(self, cls:type, text:Any, args:tuple, kwargs:dict) -> Maybe[tuple]:  # noqa: ANN401
+        """ Build the cache key for a construction, or None if it can't be cached """
+        key : tuple
+        if "uuid" in kwargs:
+            return None
+        try:
+            key = (cls, type(text), text, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return None
+        else:
+            return key
+
+    def get(self, key:tuple) -> Maybe[Strang_p]:
+        match self._data.get(key, None):
+            case None:
+                self.misses += 1
+                return None
+            case obj:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return obj
+
+    def add(self, key:tuple, obj:Strang_p) -> None:
+        """ Store a constructed strang, evicting the least recently used if necessary """
+        if obj.data.uuid is not None or any(isinstance(x, UUID) for x in obj.data.meta):
+            return
+
+        self._data[key] = obj
+        self._data.move_to_end(key)
+        while self.maxsize < len(self._data):
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits    = 0
+        self.misses  = 0
+
+    def info(self) -> InternInfo_d:
+        return InternInfo_d(self.hits, self.misses, self.maxsize, len(self._data))
+
+##--|
+
 class StrangMeta(StrMeta):
     """ A Metaclass for Strang
     It runs the pre-processsing and post-processing on the constructed str
-    to turn it into a strang
+    to turn it into a strang.
+
+    Interning of constructed strangs is opt-in, per class, with::
+
+        Strang.enable_interning(maxsize=100)
+        assert(Strang("a::b") is Strang("a::b"))
+
     """
+    _interner : Maybe[StrangInterner]
 
-    def __call__[T:Strang_p](cls:type[T], text:str|pl.Path, *args:Any, **kwargs:Any) -> Strang_p:  # noqa: ANN401, N805
+    def __call__(cls:StrangMeta, text:str|pl.Path, *args:Any, **kwargs:Any) -> Strang_p:  # noqa: ANN401, N805
         """ Overrides normal str creation to allow passing args to init """
+        obj       : Strang_p
+        key       : Maybe[tuple]            = None
+        interner  : Maybe[StrangInterner]   = getattr(cls, "_interner", None)
+        if interner is not None:
+            key = interner.key_for(cls, text, args, kwargs)
+
+        if interner is None or key is None:
+            return cls._build_strang(text, *args, **kwargs)
+
+        match interner.get(key):
+            case None:
+                obj = cls._build_strang(text, *args, **kwargs)
+                interner.add(key, obj)
+                return obj
+            case cached:
+                return cached
+
+    def _build_strang[T:Strang_p](cls:type[T], text:str|pl.Path, *args:Any, **kwargs:Any) -> Strang_p:  # noqa: ANN401, N805
+        """ Run the processor stages to construct a strang """
         ctor       : type[T]
         obj        : T
         processor  : PreProcessor_p[T]  = cls._processor
@@ -106,3 +207,84 @@ class StrangMeta(StrMeta):
                 raise ValueError(HasDictFail, type(obj))
             return obj
 
+    def build_many[T:Strang_p](cls:type[T], texts:Iterable[str|pl.Path], **kwargs:Any) -> tuple[list[Maybe[T]], list[tuple[int, errors.StrangError]]]:  # noqa: ANN401, N805
+        """ Construct a batch of strangs, sharing one processing pipeline.
+
+        The processor stages, interner and __dict__ check are resolved once for the batch,
+        and kwargs are shared by every item.
+        Failures are collected instead of raising on the first bad item.
+
+        returns (results, failures):
+        - results  : aligned with texts, with None for items that failed
+        - failures : (index, StrangError) pairs
+        """
+        ctor          : type[T]
+        obj           : T
+        processor     : PreProcessor_p[T]                  = cls._processor
+        pre_process   : Callable                           = processor.pre_process
+        process       : Callable                           = processor.process
+        post_process  : Callable                           = processor.post_process
+        interner      : Maybe[StrangInterner]              = getattr(cls, "_interner", None)
+        strict        : bool                               = kwargs.get("strict", False)
+        init_kwargs   : dict                               = {k:v for k,v in kwargs.items() if k != "strict"}
+        checked       : set[type]                          = set()
+        results       : list[Maybe[T]]                     = []
+        failures      : list[tuple[int, errors.StrangError]]  = []
+
+        for i, text in enumerate(texts):
+            key = None if interner is None else interner.key_for(cls, text, (), kwargs)
+            if key is not None and (cached:=interner.get(key)) is not None: # type: ignore[union-attr]
+                results.append(cast("T", cached))
+                continue
+
+            stage = "Pre-Process"
+            try:
+                base, inst_data, post_data, new_ctor = pre_process(cls, text, strict=strict, **init_kwargs)
+                ctor   = new_ctor or cls
+                stage  = "__new__"
+                obj    = ctor.__new__(ctor, base)
+                stage  = "__init__"
+                if init_kwargs:
+                    obj.__init__(**{**init_kwargs, **inst_data}) # type: ignore[misc]
+                else:
+                    obj.__init__(**inst_data) # type: ignore[misc]
+                stage  = "Process"
+                obj    = process(obj, data=post_data) or obj
+                stage  = "Post-Process"
+                obj    = post_process(obj, data=post_data) or obj
+            except (TypeError, ValueError, errors.StrangError) as err:
+                failures.append((i, errors.StrangError(errors.StrangCtorFailure.format(cls=cls.__name__, stage=stage),
+                                                       err, text, cls, processor)))
+                results.append(None)
+                continue
+
+            if (obj_type:=type(obj)) not in checked:
+                if hasattr(obj, "__dict__"):
+                    raise ValueError(HasDictFail, obj_type)
+                checked.add(obj_type)
+
+            if key is not None:
+                interner.add(key, obj) # type: ignore[union-attr]
+            results.append(obj)
+        else:
+            return results, failures
+
+    ##--| interning
+
+    def enable_interning(cls, *, maxsize:int=DEFAULT_INTERN_MAX) -> StrangInterner:  # noqa: N805
+        """ Cache constructed instances of this class, and its subclasses.
+        Returns the interner, for inspection of hits and misses.
+        """
+        cls._interner = StrangInterner(maxsize=maxsize)
+        return cls._interner
+
+    def disable_interning(cls) -> None:  # noqa: N805
+        cls._interner = None
+
+    def intern_info(cls) -> Maybe[InternInfo_d]:  # noqa: N805
+        match getattr(cls, "_interner", None):
+            case StrangInterner() as interner:
+                return interner.info()
+            case _:
+                return None
+
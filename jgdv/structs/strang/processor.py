@@ -79,8 +79,19 @@ class StrangBasicProcessor[T:Strang_p](PreProcessor_p):
     """
 
     def use_hook(self, cls:type[T]|T, stage:str, *args:Any, **kwargs:Any) -> MaybeT[bool, Any]:  # noqa: ANN401
-        result : MaybeT[bool, Any]
-        match cls, getattr(cls, name_to_hook(stage), None):
+        """ Call the {stage} hook of a strang type or instance, if it has one.
+
+        The hook is looked up on the type, which python caches, before the instance,
+        to avoid failing attribute lookups on instances for every construction.
+        Nothing else is cached, so a hook added to a type later is still used.
+        """
+        result  : MaybeT[bool, Any]
+        name    : str   = name_to_hook(stage)
+        owner   : type  = cls if isinstance(cls, type) else type(cls)
+        if not callable(getattr(owner, name, None)):
+            return None
+
+        match cls, getattr(cls, name, None):
             case _, None:
                 return None
             case _, x if not callable(x):
@@ -152,8 +163,7 @@ class StrangBasicProcessor[T:Strang_p](PreProcessor_p):
 
         ie: all necessary sections are, provisionally, there.
         """
-        seps = [x.end for x in cls._sections.order if x.end is not None and x.required]
-        return all(x in val for x in seps)
+        return all(x in val for x in cls._sections.required_ends)
 
     def _clean_separators(self, cls:type[T], val:str) -> str:
         """ Clean even repetitions of the separator down to single uses
@@ -162,16 +172,18 @@ class StrangBasicProcessor[T:Strang_p](PreProcessor_p):
         a..b::c....d -> a.b::c.d
         but:
         a.b::c...d -> a.b::c..d
+
+        Uses the matcher precompiled in cls._sections
         """
         # TODO join the seps
-        seps = [x.case for x in cls._sections.order]
-        sep = seps[0] or ""
-        sep_double = re.escape(sep * 2)
-        clean_re   = re.compile(f"{sep_double}+")
-        # Don't reuse sep_double, as thats been escaped
-        cleaned    = clean_re.sub(sep * 2, val)
-        trimmed    = cleaned.removesuffix(sep).removesuffix(sep)
-        return trimmed
+        sections  : API.Sections_d  = cls._sections
+        sep       : str             = sections.seps[0][0] or ""
+        match sections.clean_rx:
+            case None:
+                return val
+            case rx:
+                cleaned = rx.sub(sections.clean_sep, val)
+                return cleaned.removesuffix(sep).removesuffix(sep)
 
     def _compress_types(self, cls:type[T], val:str) -> tuple[str, dict]:  # noqa: ARG002
         """ Extract values of explicitly typed words.
@@ -222,10 +234,9 @@ class StrangBasicProcessor[T:Strang_p](PreProcessor_p):
         - flat
         - bounds
         """
-        pos_offset    : int
-        word_indices  : list[tuple[int, ...]]
-        sec_slices    : list[slice]
-        flat_slices   : list[slice]
+        word_indices  : tuple[tuple[int, ...], ...]
+        sec_slices    : tuple[slice, ...]
+        flat_slices   : tuple[slice, ...]
         match self.use_hook(obj, "process", data=data):
             case None:
                 pass
@@ -245,66 +256,55 @@ class StrangBasicProcessor[T:Strang_p](PreProcessor_p):
             case _:
                 pass
 
-        pos_offset, index_offset = 0, 0
-        sec_slices, flat_slices, word_indices = [], [], []
-        for section in obj.sections():
-            sec, words, extend = self._process_section(obj, section, start=pos_offset)
-            sec_slices.append(sec)
-            word_indices.append(tuple(range(index_offset, index_offset+len(words))))
-            index_offset += len(words)
-            flat_slices  += words
-            pos_offset    = sec.stop + extend
-        else:
-            obj.data.sec_words  = tuple(word_indices)
-            obj.data.flat_idx   = tuple((i,j) for i,x in enumerate(obj.data.sec_words) for j in range(len(x)))
-            obj.data.sections   = tuple(sec_slices)
-            obj.data.words      = tuple(flat_slices)
-            self._process_args(obj, data=data)
-            return None
+        sec_slices, flat_slices, word_indices = self._scan_sections(obj, obj._sections)
+        obj.data.set_bounds(sec_slices, flat_slices, word_indices)
+        self._process_args(obj, data=data)
+        return None
 
-    def _process_section(self, obj:T, section:API.Sec_d, *, start:int=-1) -> tuple[slice, tuple[slice, ...], int]:
-        """ Set the slices of a section, return the index where the section ends """
-        word_slices   : tuple[slice]
-        search_end    : int  = obj.data.args_start or len(obj)
-        bound_extend  : int  = 0
-        match section.end:
-            case str() as x:
-                try:
-                    bound_extend = len(x)
-                    search_end   = obj.index(x, start=start)
-                except (ValueError, TypeError):
-                    return slice(start, start), (), 0
-            case None:
-                pass
-        ##--|
+    def _scan_sections(self, obj:T, sections:API.Sections_d) -> tuple[tuple[slice, ...], tuple[slice, ...], tuple[tuple[int, ...], ...]]:
+        """ Slice the sections and words of a strang, in a single sweep.
 
-        word_slices = self._slice_section(obj,
-                                          case=[section.case, section.end],
-                                          start=start,
-                                          max=search_end)
-        assert(all((start <= x.start <= x.stop <= search_end) for x in word_slices))
-        match word_slices:
-            case []:
-                return slice(start, search_end), (), 0
-            case _:
-                return slice(start, search_end), word_slices, bound_extend
-
-    def _slice_section(self, obj:T, *, case:list[Maybe[str]], start:int=0, max:int=-1) -> tuple[slice]:  # noqa: A002
-        """ Get a list of word slices of a section, with an offset. """
-        curr    : re.Match
-        slices  : list[slice]  = []
-        end                    = max or len(obj)
-        escaped                = "|".join(re.escape(x) for x in case if x is not None)
-        reg                    = re.compile(f"(.*?)({escaped}|$)")
-        words                  = []
-        for curr in reg.finditer(cast("str", obj), start, end):
-            span = curr.span(1)
-            if span[0] == end:
+        Uses the precompiled (case, end) separators of the class' Sections_d.
+        A section whose end marker isn't found is empty,
+        and the next section starts from the same position.
+        Empty words between separators are kept, a trailing empty word is not.
+
+        returns (section slices, word slices, section -> word indices)
+        """
+        sec_slices    : list[slice]            = []
+        word_slices   : list[slice]            = []
+        word_indices  : list[tuple[int, ...]]  = []
+        limit         : int                    = obj.data.args_start or len(obj)
+        start         : int                    = 0
+        for case, end in sections.seps:
+            first  = len(word_slices)
+            stop   = limit if end is None else API.STRFIND(obj, end, start)
+            if stop == -1:
+                sec_slices.append(slice(start, start))
+                word_indices.append(())
                 continue
-            slices.append(slice(*span))
-            words.append(obj[span[0]:span[1]])
+
+            match case:
+                case None if start < stop:
+                    word_slices.append(slice(start, stop))
+                case None:
+                    pass
+                case str():
+                    pos, step = start, len(case)
+                    while (nxt:=API.STRFIND(obj, case, pos, stop)) != -1:
+                        word_slices.append(slice(pos, nxt))
+                        pos = nxt + step
+                    if pos < stop:
+                        word_slices.append(slice(pos, stop))
+
+            sec_slices.append(slice(start, stop))
+            word_indices.append(tuple(range(first, len(word_slices))))
+            if end is not None and first < len(word_slices):
+                start = stop + len(end)
+            else:
+                start = stop
         else:
-            return cast("tuple[slice]", tuple(slices))
+            return tuple(sec_slices), tuple(word_slices), tuple(word_indices)
 
     def _process_args(self, obj:T, *, data:dict) -> None:
         """ Extract args and set values as necessary """
@@ -368,7 +368,7 @@ class StrangBasicProcessor[T:Strang_p](PreProcessor_p):
         meta     : list[MetaTypes]  = [None for x in range(count)]
         ##--|
         for i, word_idx in enumerate(obj.data.sec_words[idx]):
-            elem                    = obj[obj.data.words[word_idx]]
+            elem                    = API.STRGET(obj, obj.data.words[word_idx])
             assert(isinstance(elem, str))
             # Discriminate the str
             match elem:
@@ -395,9 +395,10 @@ class StrangBasicProcessor[T:Strang_p](PreProcessor_p):
     def _calc_obj_meta(self, obj:T) -> None:
         """ Set object level meta dict
 
-        ie: mark the obj as an instance
+        ie: mark the obj as an instance,
+        and cache its expanded str and hash
         """
-        pass
+        hash(obj)
 
     ##--| utils
 
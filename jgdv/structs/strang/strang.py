@@ -154,16 +154,27 @@ class _StrangSlicer:
         return result
 
     def run_iterator(self, obj:API.Strang_p, sec_iter:Iterator) -> str:
-        sec : API.Sec_d
-        result = []
+        """ Build the expanded str of the given sections,
+        reading words and their meta values directly from obj.data
+        """
+        sec    : API.Sec_d
+        words  : list[str]
+        result : list[str]  = []
+        meta   : tuple      = obj.data.meta
+        slices : Sequence   = obj.data.words
+        count  : int        = len(meta)
         for sec in sec_iter:
-            for word in obj.words(sec.idx, case=True):
-                match word:
+            words = []
+            for idx in obj.data.sec_words[sec.idx]:
+                match meta[idx] if idx < count else None:
+                    case None:
+                        words.append(API.STRGET(obj, slices[idx]))
                     case UUID() as x:
-                        result.append(f"<uuid:{x}>")
+                        words.append(f"<uuid:{x}>")
                     case x:
-                        result.append(str(x))
+                        words.append(str(x))
             else:
+                result.append((sec.case or "").join(words))
                 result.append(sec.end or "")
         else:
             return "".join(result)
@@ -201,7 +212,7 @@ class Strang[*K](SubAlias_m, str, metaclass=StrangMeta, fresh_registry=True):
         val[1] # d.e.f
 
     """
-    __slots__       = ("data", "meta")
+    __slots__       = ("_expanded", "_hash", "data", "meta")
     __match_args__  = ("head", "body")
 
     ##--|
@@ -209,9 +220,13 @@ class Strang[*K](SubAlias_m, str, metaclass=StrangMeta, fresh_registry=True):
     _formatter  : ClassVar                 = StrangFormatter()
     _slicer     : ClassVar[_StrangSlicer]  = _StrangSlicer()
     _sections   : ClassVar[API.Sections_d] = API.STRANG_ALT_SECS
+    _interner   : ClassVar                 = None
+    _data_type  : ClassVar[type]           = API.Strang_d
 
     data        : API.Strang_d
     meta        : dict
+    _expanded   : Maybe[str]
+    _hash       : Maybe[int]
 
     @classmethod
     def sections(cls) -> API.Sections_d:
@@ -225,7 +240,9 @@ class Strang[*K](SubAlias_m, str, metaclass=StrangMeta, fresh_registry=True):
 
     def __init__(self, *args:Any, **kwargs:Any) -> None:  # noqa: ANN401, ARG002
         super().__init__()
-        self.data  = API.Strang_d(kwargs.pop("uuid",None))
+        self.data       = self._data_type(kwargs.pop("uuid",None))
+        self._expanded  = None
+        self._hash      = None
 
     ##--| dunders
 
@@ -235,7 +252,11 @@ class Strang[*K](SubAlias_m, str, metaclass=StrangMeta, fresh_registry=True):
 
         eg: a.b.c::d.e.f..<uuid:{val}>
         """
-        return format(self, "a+")
+        match self._canonical():
+            case Strang() as x:
+                return str.__str__(x)
+            case x:
+                return x
 
     @override
     def __repr__(self) -> str:
@@ -282,7 +303,10 @@ class Strang[*K](SubAlias_m, str, metaclass=StrangMeta, fresh_registry=True):
 
     @override
     def __hash__(self) -> int:
-        return str.__hash__(str(self))
+        """ The hash of the fully expanded str, cached on first use """
+        if self._hash is None:
+            self._cache_canonical()
+        return cast("int", self._hash)
 
     @override
     def __lt__(self:API.Strang_p, other:object) -> bool:
@@ -321,14 +345,22 @@ class Strang[*K](SubAlias_m, str, metaclass=StrangMeta, fresh_registry=True):
 
     @override
     def __eq__(self, other:object) -> bool:
+        """ Compare by identity, then cached hashes, then the expanded strs.
+
+        A strang with a uuid also equals its unexpanded form
+        """
         match other:
-            case Strang() as x if self.uuid() and x.uuid():
-                return hash(self) == hash(other)
+            case _ if self is other:
+                return True
             case UUID() as x:
                 return self.uuid() == x
-            case x if self.uuid():
-                h_other = hash(x)
-                return hash(self) == h_other or hash(self[:]) == h_other
+            case Strang() as x:
+                return hash(self) == hash(x) and str.__eq__(self._canonical(), x._canonical())
+            case str() as x if self.uuid():
+                return ((hash(self) == hash(x) and str.__eq__(self._canonical(), x))
+                        or str.__eq__(self, x))
+            case str() as x:
+                return hash(self) == hash(x) and str.__eq__(self._canonical(), x)
             case x:
                 return hash(self) == hash(x)
 
@@ -388,6 +420,24 @@ class Strang[*K](SubAlias_m, str, metaclass=StrangMeta, fresh_registry=True):
             case _:
                 return False
 
+    def _cache_canonical(self) -> None:
+        """ Calculate the fully expanded str and its hash, once.
+        The expanded str is only stored if it differs from the strang's own text.
+        """
+        expanded        = format(self, "a+")
+        self._expanded  = None if str.__eq__(self, expanded) else expanded
+        self._hash      = str.__hash__(expanded)
+
+    def _canonical(self) -> str:
+        """ The fully expanded str, or the strang itself if that is the same text """
+        if self._hash is None:
+            self._cache_canonical()
+        match self._expanded:
+            case None:
+                return self
+            case x:
+                return x
+
     ##--| Properties
 
     @property
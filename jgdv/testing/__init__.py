@@ -4,4 +4,6 @@ This module adds testing fixtures for pytest.
 
 wrap_tmp cretaes a temp directory and moves the cwd to it,
 before returning to the original dir after the test.
+
+Benchmark times and logs the cases of tests marked 'benchmark'.
 """
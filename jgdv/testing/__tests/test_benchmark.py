@@ -0,0 +1,84 @@
+"""
+TEST File updated
+
+"""
+# ruff: noqa: ANN202, B011, ANN001
+
+# Imports
+from __future__ import annotations
+
+# ##-- stdlib imports
+import logging as logmod
+import time
+# ##-- end stdlib imports
+
+# ##-- 3rd party imports
+import pytest
+# ##-- end 3rd party imports
+
+##--|
+from ..benchmark import Benchmark
+##--|
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+
+# Body:
+
+class TestBenchmark:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_ctor(self):
+        match Benchmark("basic"):
+            case Benchmark() as obj:
+                assert(obj.label == "basic")
+                assert(not obj.timings)
+            case x:
+                assert(False), x
+
+    def test_case(self):
+        with Benchmark("basic") as bench:
+            with bench.case("first"):
+                time.sleep(0.1)
+
+        assert(bench["first"] > 0.1)
+
+    def test_case_accumulates(self):
+        with Benchmark("basic") as bench:
+            for _ in range(2):
+                with bench.case("first"):
+                    time.sleep(0.1)
+
+        assert(bench["first"] > 0.2)  # noqa: PLR2004
+
+    def test_missing_case(self):
+        with Benchmark("basic") as bench:
+            pass
+
+        with pytest.raises(KeyError):
+            bench["first"]
+
+    def test_logs_on_exit(self, caplog):
+        logger = logmod.getLogger("benchmark_test")
+        with caplog.at_level(logmod.INFO, logger="benchmark_test"):
+            with Benchmark("basic", count=5, logger=logger) as bench:
+                with bench.case("first"):
+                    pass
+                bench.note(size=10)
+
+        assert("basic (x5): first " in caplog.text)
+        assert(", size: 10" in caplog.text)
+
+    def test_no_log_on_error(self, caplog):
+        logger = logmod.getLogger("benchmark_test")
+        with caplog.at_level(logmod.INFO, logger="benchmark_test"):
+            with pytest.raises(ValueError), Benchmark("basic", logger=logger) as bench:  # noqa: PT012
+                with bench.case("first"):
+                    raise ValueError()
+
+        assert("basic" not in caplog.text)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+A Recorder of the timings of a benchmark's cases, for tests marked 'benchmark'.
+
+Each case is timed with a TimeCtx,
+and every timing is logged on one line when the benchmark exits::
+
+    with Benchmark("Strang dict lookup", count=10_000) as bench:
+        with bench.case("cached"):
+            ...
+        with bench.case("uncached"):
+            ...
+
+    assert(bench["cached"] < bench["uncached"])
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import contextlib
+import logging as logmod
+# ##-- end stdlib imports
+
+from jgdv.debugging.timing import TimeCtx
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe, Traceback
+    from logging import Logger
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Vars:
+
+# Body:
+
+class Benchmark:
+    """ Time named cases, and log them together on exit.
+
+    A case timed more than once accumulates its time.
+    notes are extra values (eg: sizes) to log with the timings.
+    """
+    __slots__ = ("_logger", "count", "label", "level", "notes", "timings")
+    label    : str
+    count    : Maybe[int]
+    level    : int
+    timings  : dict[str, float]
+    notes    : dict[str, Any]
+    _logger  : Logger
+
+    def __init__(self, label:str, *, count:Maybe[int]=None, logger:Maybe[Logger]=None, level:int=logmod.INFO) -> None:
+        self.label    = label
+        self.count    = count
+        self.level    = level
+        self.timings  = {}
+        self.notes    = {}
+        self._logger  = logger or logging
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, etype:Maybe[type], err:Maybe[Exception], tb:Maybe[Traceback]) -> Literal[False]:
+        if etype is None:
+            self._logger.log(self.level, "%s", self.summary())
+        return False
+
+    def __getitem__(self, name:str) -> float:
+        return self.timings[name]
+
+    @contextlib.contextmanager
+    def case(self, name:str) -> Iterator[None]:
+        """ Time the body of the with block as the named case """
+        with TimeCtx(logger=False) as timer:
+            yield
+
+        self.timings[name] = self.timings.get(name, 0.0) + timer.total_s
+
+    def note(self, **kwargs:Any) -> None:  # noqa: ANN401
+        self.notes.update(kwargs)
+
+    def summary(self) -> str:
+        label    = self.label if self.count is None else f"{self.label} (x{self.count})"
+        timings  = ", ".join(f"{name} {secs:.4f}s" for name, secs in self.timings.items())
+        notes    = "".join(f", {name}: {val}" for name, val in self.notes.items())
+        return f"{label}: {timings}{notes}"
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+
+"""
+# ruff: noqa: ANN202, ANN001, B011, PLR2004
+from __future__ import annotations
+
+import logging as logmod
+
+import pytest
+
+from ..id_cache import IdCache
+
+logging = logmod.root
+
+class TestIdCache:
+
+    def test_sanity(self):
+        assert(True is not False) # noqa: PLR0133
+
+    def test_basic(self):
+        cache = IdCache[str](maxsize=2)
+        objs  = [object(), object()]
+        assert(cache.get(objs) is None)
+        assert(cache.add(objs, "val") == "val")
+        assert(cache.get(objs) == "val")
+        assert(cache.get(tuple(objs)) == "val")
+        assert(len(cache) == 1)
+
+    def test_keyed_on_identity(self):
+        cache = IdCache[str](maxsize=2)
+        cache.add([[]], "val")
+        assert(cache.get([[]]) is None)
+
+    def test_order_matters(self):
+        cache = IdCache[str](maxsize=2)
+        a, b  = object(), object()
+        cache.add([a, b], "val")
+        assert(cache.get([b, a]) is None)
+
+    def test_holds_references(self):
+        cache = IdCache[str](maxsize=2)
+        cache.add([object()], "val")
+        (objs, _), = cache._data.values()
+        assert(isinstance(objs[0], object))
+
+    def test_bounded_lru(self):
+        cache    = IdCache[int](maxsize=2)
+        a, b, c  = [object()], [object()], [object()]
+        cache.add(a, 1)
+        cache.add(b, 2)
+        cache.get(a)
+        cache.add(c, 3)
+        assert(len(cache) == 2)
+        assert(cache.get(a) == 1)
+        assert(cache.get(b) is None)
+        assert(cache.get(c) == 3)
+
+    def test_clear(self):
+        cache = IdCache[int](maxsize=2)
+        cache.add([object()], 1)
+        cache.clear()
+        assert(len(cache) == 0)
+
+    def test_bad_maxsize(self):
+        with pytest.raises(AssertionError):
+            IdCache(maxsize=0)
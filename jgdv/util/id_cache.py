@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+A Bounded LRU cache, keyed on the identities of a sequence of objects.
+
+For sharing something built from a sequence (eg: an index of sources, a table of params)
+between everything built from the same objects, without hashing or comparing them::
+
+    _tables = IdCache[Table](maxsize=256)
+
+    def compile(params:Sequence) -> Table:
+        match _tables.get(params):
+            case None:
+                return _tables.add(params, Table(params))
+            case table:
+                return table
+
+"""
+# Imports:
+from __future__ import annotations
+
+# ##-- stdlib imports
+import collections
+import logging as logmod
+# ##-- end stdlib imports
+
+# ##-- types
+# isort: off
+import abc
+import collections.abc
+from typing import TYPE_CHECKING, cast, assert_type, assert_never
+from typing import Generic, NewType
+# Protocols:
+from typing import Protocol, runtime_checkable
+# Typing Decorators:
+from typing import no_type_check, final, override, overload
+
+if TYPE_CHECKING:
+    from jgdv import Maybe
+    from typing import Final
+    from typing import ClassVar, Any, LiteralString
+    from typing import Never, Self, Literal
+    from typing import TypeGuard
+    from collections.abc import Iterable, Iterator, Callable, Generator
+    from collections.abc import Sequence, Mapping, MutableMapping, Hashable
+
+##--|
+# isort: on
+# ##-- end types
+
+##-- logging
+logging = logmod.getLogger(__name__)
+##-- end logging
+
+# Body:
+
+class IdCache[V]:
+    """ A Bounded, LRU cache of values, keyed on the ids of the objects they were built from.
+
+    Entries hold a reference to their objects, so the ids stay unique while the entry is stored.
+    """
+    __slots__ = ("_data", "maxsize")
+    _data    : collections.OrderedDict[tuple[int, ...], tuple[tuple, V]]
+    maxsize  : int
+
+    def __init__(self, *, maxsize:int) -> None:
+        assert(0 < maxsize), maxsize
+        self._data    = collections.OrderedDict()
+        self.maxsize  = maxsize
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, objs:Sequence) -> Maybe[V]:
+        """ Get the value stored for these objects, in this order """
+        ident = tuple(id(x) for x in objs)
+        match self._data.get(ident, None):
+            case None:
+                return None
+            case [_, value]:
+                self._data.move_to_end(ident)
+                return value
+            case x:
+                raise TypeError(type(x))
+
+    def add(self, objs:Sequence, value:V) -> V:
+        """ Store a value for these objects, evicting the least recently used if necessary """
+        objs   = tuple(objs)
+        ident  = tuple(id(x) for x in objs)
+        self._data[ident] = (objs, value)
+        self._data.move_to_end(ident)
+        while self.maxsize < len(self._data):
+            self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()